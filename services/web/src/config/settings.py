@@ -38,6 +38,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'accounts',
     'vagas',
 ]
@@ -133,4 +134,61 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'accounts.CustomUser'
 
-STATICFILES_DIRS = [BASE_DIR.joinpath('static')]
\ No newline at end of file
+STATICFILES_DIRS = [BASE_DIR.joinpath('static')]
+
+# Number of job opportunities shown per page on the homepage and the maximum
+# page size that may be requested through the page_size query parameter.
+VAGAS_PAGE_SIZE = 50
+
+VAGAS_MAX_PAGE_SIZE = 200
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 20000,
+        },
+    },
+}
+
+# Number of seconds a rendered homepage row is kept in the cache.
+VAGAS_ROW_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Number of rows fetched from the database at a time when the homepage streams every job opportunity, and when
+# they are exported.
+VAGAS_STREAM_CHUNK_SIZE = 2000
+
+# Job opportunities matching a text search, a company name or a registration period are counted up to this limit.
+VAGAS_MAX_FILTERED_TOTAL = 1000
+
+# Autocomplete of empresa_nome and cargo_titulo: number of suggestions, most frequent distinct values kept in
+# memory by each worker, seconds between refreshes of the values and seconds after which they are loaded again
+# from scratch.
+VAGAS_AUTOCOMPLETE_LIMIT = 10
+
+VAGAS_AUTOCOMPLETE_MAX_VALUES = 50000
+
+VAGAS_AUTOCOMPLETE_REFRESH_INTERVAL = 5
+
+VAGAS_AUTOCOMPLETE_MAX_AGE = 60 * 60
+
+# Number of minutes an interview is expected to last, used as the duration of its calendar event.
+VAGAS_INTERVIEW_DURATION = 60
+
+# Interview reminders sent by the send_interview_reminders command: hours before the interview the reminder is
+# sent and seconds between polls for new and updated job opportunities.
+VAGAS_REMINDER_HOURS = 24
+
+VAGAS_REMINDER_POLL_INTERVAL = 30
+
+# Weekly digest sent by the send_weekly_digest command: days without updates after which an open job opportunity
+# is reported as stale and number of messages sent at a time through the email connection.
+VAGAS_DIGEST_STALE_DAYS = 14
+
+VAGAS_DIGEST_BATCH_SIZE = 100
+
+# Number of rows validated and inserted in each transaction by the import_vagas command.
+VAGAS_IMPORT_BATCH_SIZE = 5000
+
+# zlib compression level of the files exported from the homepage with gzip, from 1 (fastest) to 9 (smallest).
+VAGAS_EXPORT_COMPRESS_LEVEL = 6
@@ -28,6 +28,54 @@ $(function () {
         }
     });
 
+    $('input[data-autocomplete-url]').each(function () {
+        const $input_el = $(this);
+        const $sugestoes_el = $('#' + $input_el.attr('list'));
+        let timeout = null;
+
+        $input_el.on('input', function () {
+            clearTimeout(timeout);
+
+            timeout = setTimeout(function () {
+                const q = $input_el.val().trim();
+
+                if (!q) {
+                    $sugestoes_el.empty();
+                    return;
+                }
+
+                $.getJSON($input_el.data('autocomplete-url'), { q: q }, function (data) {
+                    $sugestoes_el.empty().append(data.sugestoes.map(sugestao => $('<option>').val(sugestao)));
+                });
+            }, 100);
+        });
+    });
+
+    const $empresa_nome_el = $('#id_empresa_nome');
+    const $empresa_nome_semelhantes_hint_el = $('#empresa_nome_semelhantes_hint');
+    let empresa_nome_timeout = null;
+    let empresa_nome_request = null;
+
+    $empresa_nome_el.on('input', function () {
+        clearTimeout(empresa_nome_timeout);
+
+        empresa_nome_timeout = setTimeout(function () {
+            const empresa_nome = $empresa_nome_el.val().trim();
+
+            if (empresa_nome_request) {
+                empresa_nome_request.abort();
+            }
+
+            empresa_nome_request = $.getJSON($empresa_nome_el.data('semelhantes-url'), { empresa_nome: empresa_nome }, function (data) {
+                const empresas = data.empresas.filter(empresa => empresa !== empresa_nome);
+
+                $empresa_nome_semelhantes_hint_el.text(
+                    empresas.length ? 'Empresas parecidas já cadastradas: ' + empresas.join(', ') : ''
+                );
+            });
+        }, 150);
+    });
+
     $('#id_empresa_telefone_celular').mask('(00) 00000-0000', { placeholder: '(DDD) _____-____' });
     $('#id_empresa_telefone_comercial').mask('(00) 0000-0000', { placeholder: '(DDD) ____-____' });
 });
\ No newline at end of file
@@ -0,0 +1,237 @@
+from typing import Iterable, Iterator, Optional
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, QuerySet, TextField, Value
+from django.db.models.functions import Coalesce
+from django.http import Http404, JsonResponse, QueryDict, StreamingHttpResponse
+from django.views.decorators.http import require_safe
+from vagas.autocomplete import autocompletes
+from vagas.filters import canonical_params, filter_vagas, get_ordering, rank_vagas, similar_empresas
+from vagas.models import Telefone, Vaga
+from vagas.pagination import CursorPaginator, InvalidCursor
+from vagas.views import get_page_size
+
+# Fields that may be requested through the fields query parameter.
+API_FIELDS = (
+    'id',
+    'empresa_nome',
+    'empresa_endereco',
+    'empresa_email',
+    'empresa_site',
+    'empresa_telefone_celular',
+    'empresa_telefone_comercial',
+    'cargo_titulo',
+    'cargo_descricao',
+    'site_referencia',
+    'data_hora_entrevista',
+    'situacao',
+    'data_hora_cadastro',
+    'data_hora_atualizacao',
+)
+
+# Fields read from other tables, by the name under which they are returned.
+API_EXPRESSIONS = {
+    'cargo_descricao': Coalesce(F('descricao__cargo_descricao'), Value(''), output_field=TextField()),
+}
+
+# Fields returned by the listing when none are requested, the same shown by the homepage.
+API_LIST_FIELDS = ('id',) + Vaga.LISTING_FIELDS
+
+# Shorter names have too few trigrams to be told apart.
+EMPRESAS_MIN_LENGTH = 3
+
+EMPRESAS_LIMIT = 5
+
+class ApiJSONEncoder(DjangoJSONEncoder):
+    """JSON encoder that also serializes phone numbers, as their formatted text."""
+
+    def default(self, o):
+        if isinstance(o, Telefone):
+            return str(o)
+
+        return super().default(o)
+
+encoder = ApiJSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+def get_fields(params: QueryDict, default: tuple) -> tuple:
+    """
+    Return the fields requested through the fields query parameter, e.g. ?fields=empresa_nome,situacao.
+
+    :param params: Query parameters of the request
+
+    :type params: QueryDict
+
+    :param default: Fields returned when none are requested
+
+    :type default: tuple
+
+    :raises ValueError: If an unknown field is requested.
+
+    :rtype: tuple
+    """
+    requested = [name.strip() for name in params.get('fields', '').split(',') if name.strip()]
+
+    if not requested:
+        return default
+
+    unknown = [name for name in requested if name not in API_FIELDS]
+
+    if unknown:
+        raise ValueError(f"Campos desconhecidos: {', '.join(unknown)}.")
+
+    return tuple(dict.fromkeys(requested))
+
+def values(vagas: QuerySet, fields: Iterable[str]) -> QuerySet:
+    """
+    Return the given job opportunities as dictionaries with the given fields.
+
+    :param vagas: Job opportunities to be returned
+
+    :type vagas: QuerySet
+
+    :param fields: Names of the fields, among API_FIELDS
+
+    :type fields: Iterable[str]
+
+    :rtype: QuerySet
+    """
+    return vagas.values(
+        *(name for name in fields if name not in API_EXPRESSIONS),
+        **{name: API_EXPRESSIONS[name] for name in fields if name in API_EXPRESSIONS},
+    )
+
+def page_url(request, cursor_name: str, cursor: Optional[str]) -> Optional[str]:
+    """
+    Return the URL of the page referenced by the given cursor, keeping the other query parameters.
+
+    :param cursor_name: Either after or before
+
+    :type cursor_name: str
+
+    :param cursor: Cursor of the page, if there is one
+
+    :type cursor: str
+
+    :rtype: str or None
+    """
+    if cursor is None:
+        return None
+
+    querystring = canonical_params(request.GET)
+    querystring.pop('after', None)
+    querystring.pop('before', None)
+    querystring[cursor_name] = cursor
+
+    return f'{request.path}?{querystring.urlencode()}'
+
+def encode_page(rows: list, fields: tuple, next_url: Optional[str], previous_url: Optional[str]) -> Iterator[str]:
+    """
+    Encode a page of job opportunities as JSON, one chunk per row.
+
+    :param rows: Rows returned by values()
+
+    :type rows: list
+
+    :param fields: Fields included in each row
+
+    :type fields: tuple
+
+    :rtype: Iterator[str]
+    """
+    yield f'{{"next":{encoder.encode(next_url)},"previous":{encoder.encode(previous_url)},"results":['
+
+    for i, row in enumerate(rows):
+        yield (',' if i else '') + encoder.encode({name: row[name] for name in fields})
+
+    yield ']}'
+
+def error_response(message: str, status: int) -> JsonResponse:
+    """
+    Return a JSON response describing an error.
+
+    :param message: Description of the error, shown to the client
+
+    :type message: str
+
+    :param status: HTTP status code
+
+    :type status: int
+
+    :rtype: JsonResponse
+    """
+    return JsonResponse({'error': message}, status=status, json_dumps_params={'ensure_ascii': False})
+
+@require_safe
+def list_view(request):
+    """
+    List the job opportunities matching the busca, situacao and data_hora_cadastro_order filters of the homepage.
+
+    Pages are selected with the after and before cursors returned in next and previous, and the
+    response body is encoded row by row as it is streamed.
+    """
+    try:
+        fields = get_fields(request.GET, API_LIST_FIELDS)
+    except ValueError as e:
+        return error_response(str(e), 400)
+
+    ordering = get_ordering(request.GET)
+    columns = dict.fromkeys(fields + tuple(name.lstrip('-') for name in ordering))
+    vagas = values(rank_vagas(filter_vagas(request.GET), request.GET), columns)
+    paginator = CursorPaginator(vagas, ordering, get_page_size(request))
+
+    try:
+        page = paginator.page(after=request.GET.get('after'), before=request.GET.get('before'))
+    except InvalidCursor:
+        return error_response('Cursor de paginação inválido.', 400)
+
+    content = encode_page(
+        page.object_list,
+        fields,
+        next_url=page_url(request, 'after', page.next_cursor),
+        previous_url=page_url(request, 'before', page.previous_cursor),
+    )
+
+    return StreamingHttpResponse(content, content_type='application/json')
+
+@require_safe
+def detail_view(request, pk: int):
+    """Return a job opportunity with the requested fields, all of them by default."""
+    try:
+        fields = get_fields(request.GET, API_FIELDS)
+    except ValueError as e:
+        return error_response(str(e), 400)
+
+    vaga = values(Vaga.objects.filter(pk=pk), fields).first()
+
+    if vaga is None:
+        return error_response('Vaga não encontrada.', 404)
+
+    return JsonResponse(vaga, encoder=ApiJSONEncoder, json_dumps_params={'ensure_ascii': False})
+
+@require_safe
+def empresas_view(request):
+    """
+    Return the registered company names resembling the empresa_nome query parameter.
+
+    Used as a hint while a job opportunity is being registered, so that an existing company is
+    not typed again with a different spelling.
+    """
+    empresa_nome = request.GET.get('empresa_nome', '').strip()
+    empresas = similar_empresas(empresa_nome, EMPRESAS_LIMIT) if len(empresa_nome) >= EMPRESAS_MIN_LENGTH else []
+
+    return JsonResponse({'empresas': empresas}, json_dumps_params={'ensure_ascii': False})
+
+@require_safe
+def autocomplete_view(request, field_name: str):
+    """
+    Return the registered values of empresa_nome or cargo_titulo starting with the q query parameter.
+
+    The values are looked up in memory, see vagas.autocomplete.Autocomplete.
+    """
+    if field_name not in autocompletes:
+        raise Http404
+
+    prefix = request.GET.get('q', '').strip()
+    sugestoes = autocompletes[field_name].suggest(prefix, settings.VAGAS_AUTOCOMPLETE_LIMIT) if prefix else []
+
+    return JsonResponse({'sugestoes': sugestoes}, json_dumps_params={'ensure_ascii': False})
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class VagasConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'vagas'
+
+    def ready(self) -> None:
+        from vagas import signals  # noqa: F401
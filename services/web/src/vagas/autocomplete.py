@@ -0,0 +1,223 @@
+import threading
+import time
+import unicodedata
+from bisect import bisect_left, insort
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import Count, Max, Sum
+from django.db.models.functions import Upper
+from vagas.models import ContagemSituacao, Unaccent, Vaga
+
+# Fields whose values are suggested while being typed.
+AUTOCOMPLETE_FIELDS = ('empresa_nome', 'cargo_titulo')
+
+# Separates the folded key from the original value in each entry.
+SEPARATOR = '\x00'
+
+# Rows saved shortly before a refresh may only be committed after it, so each refresh looks
+# this far behind the latest update it has already seen.
+REFRESH_OVERLAP = timedelta(minutes=1)
+
+def fold(value: str) -> str:
+    """
+    Return the value without accents and in upper case, as compared by the autocomplete.
+
+    :param value: Text to be folded
+
+    :type value: str
+
+    :rtype: str
+    """
+    decomposed = unicodedata.normalize('NFKD', value)
+
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).upper()
+
+class Autocomplete:
+    """
+    Suggest the registered values of a field that start with a given prefix.
+
+    The distinct values are kept in memory by each worker, as a sorted list of strings made of the
+    folded value followed by the original one, and looked up with bisect. The list is loaded on the
+    first lookup and then refreshed at most every VAGAS_AUTOCOMPLETE_REFRESH_INTERVAL seconds with
+    the rows updated since the previous refresh, which the vaga_atualizacao_idx index serves. Deleting
+    job opportunities or changing their company name or job title bumps the deletion generations of
+    the status counters and causes a full reload, as does reaching VAGAS_AUTOCOMPLETE_MAX_AGE. A status
+    change leaves the values as they are, so the update of the refresh suffices for it.
+
+    At most VAGAS_AUTOCOMPLETE_MAX_VALUES values are kept, the most frequent ones. When some
+    values were left out and the list cannot fill a lookup, the database is queried through the
+    prefix index on the field.
+    """
+
+    def __init__(self, field_name: str) -> None:
+        self.field_name = field_name
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Discard the values in memory, so that they are loaded again by the next lookup.
+
+        :rtype: None
+        """
+        self.entries = None
+        self.complete = False
+        self.ultima_atualizacao = None
+        self.geracao = None
+        self.loaded_at = None
+        self.refreshed_at = None
+
+    def suggest(self, prefix: str, limit: int) -> list:
+        """
+        Return the registered values starting with the given prefix, ignoring case and accents.
+
+        :param prefix: Text typed by the user
+
+        :type prefix: str
+
+        :param limit: Maximum number of values returned
+
+        :type limit: int
+
+        :rtype: list
+        """
+        self.refresh()
+        key = fold(prefix)
+        entries = self.entries
+        i = bisect_left(entries, key)
+        suggestions = []
+
+        while len(suggestions) < limit and i < len(entries) and entries[i].startswith(key):
+            suggestions.append(entries[i].split(SEPARATOR, 1)[1])
+            i += 1
+
+        if len(suggestions) < limit and not self.complete:
+            suggestions = self.query(key, limit, suggestions)
+
+        return suggestions
+
+    def query(self, key: str, limit: int, suggestions: list) -> list:
+        """
+        Complete the suggestions with values read from the database.
+
+        :param key: Folded prefix
+
+        :type key: str
+
+        :param limit: Maximum number of values returned
+
+        :type limit: int
+
+        :param suggestions: Values already found in memory
+
+        :type suggestions: list
+
+        :rtype: list
+        """
+        # The prefix index serves the range of matching rows, and the duplicates of a frequent value
+        # are removed by the database, so the first distinct values are read however many rows share them.
+        values = (
+            Vaga.objects.alias(chave=Upper(Unaccent(self.field_name)))
+            .filter(chave__startswith=key)
+            .order_by('chave')
+            .values_list(self.field_name, flat=True)
+            .distinct()[:limit]
+        )
+
+        return sorted(set(suggestions).union(values), key=lambda value: (fold(value), value))[:limit]
+
+    def refresh(self) -> None:
+        """
+        Load the values on the first call and keep them up to date afterwards.
+
+        :rtype: None
+        """
+        now = time.monotonic()
+
+        if self.refreshed_at is not None and now - self.refreshed_at < settings.VAGAS_AUTOCOMPLETE_REFRESH_INTERVAL:
+            return
+
+        with self.lock:
+            if self.refreshed_at is not None and now - self.refreshed_at < settings.VAGAS_AUTOCOMPLETE_REFRESH_INTERVAL:
+                return
+
+            geracao = self.get_geracao()
+
+            if (self.entries is None or geracao != self.geracao
+                    or now - self.loaded_at >= settings.VAGAS_AUTOCOMPLETE_MAX_AGE):
+                self.load(geracao, now)
+            else:
+                self.update()
+
+            self.refreshed_at = now
+
+    def load(self, geracao: int, now: float) -> None:
+        """
+        Load the most frequent values of the field.
+
+        :param geracao: Sum of the deletion generations of the status counters
+
+        :type geracao: int
+
+        :param now: Monotonic time of the load
+
+        :type now: float
+
+        :rtype: None
+        """
+        max_values = settings.VAGAS_AUTOCOMPLETE_MAX_VALUES
+        ultima_atualizacao = Vaga.objects.aggregate(ultima=Max('data_hora_atualizacao'))['ultima']
+        values = list(
+            Vaga.objects.exclude(**{self.field_name: ''})
+            .values(self.field_name)
+            .annotate(vagas=Count('id'))
+            .order_by('-vagas')
+            .values_list(self.field_name, flat=True)[:max_values + 1]
+        )
+        self.complete = len(values) <= max_values
+        self.entries = sorted({f'{fold(value)}{SEPARATOR}{value}' for value in values[:max_values]})
+        self.ultima_atualizacao = ultima_atualizacao
+        self.geracao = geracao
+        self.loaded_at = now
+
+    def update(self) -> None:
+        """
+        Add the values of the rows updated since the previous refresh.
+
+        :rtype: None
+        """
+        if self.ultima_atualizacao is None:
+            vagas = Vaga.objects.all()
+        else:
+            vagas = Vaga.objects.filter(data_hora_atualizacao__gt=self.ultima_atualizacao - REFRESH_OVERLAP)
+
+        # Lookups running in other threads keep reading the previous list until the new one is assigned.
+        entries = None
+
+        for value, data_hora_atualizacao in vagas.values_list(self.field_name, 'data_hora_atualizacao').iterator():
+            self.ultima_atualizacao = max(self.ultima_atualizacao or data_hora_atualizacao, data_hora_atualizacao)
+            entry = f'{fold(value)}{SEPARATOR}{value}'
+            current = self.entries if entries is None else entries
+            i = bisect_left(current, entry)
+
+            if not value or (i < len(current) and current[i] == entry):
+                continue
+
+            if len(current) >= settings.VAGAS_AUTOCOMPLETE_MAX_VALUES:
+                self.complete = False
+            else:
+                entries = list(self.entries) if entries is None else entries
+                insort(entries, entry)
+
+        if entries is not None:
+            self.entries = entries
+
+    def get_geracao(self) -> int:
+        """
+        Return the sum of the deletion generations of the status counters, which changes whenever values may have been removed.
+
+        :rtype: int
+        """
+        return ContagemSituacao.objects.aggregate(geracao=Sum('geracao_exclusao'))['geracao'] or 0
+
+autocompletes = {field_name: Autocomplete(field_name) for field_name in AUTOCOMPLETE_FIELDS}
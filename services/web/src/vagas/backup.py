@@ -0,0 +1,345 @@
+import json
+from typing import BinaryIO
+from django.core.management.color import no_style
+from django.db import DatabaseError, connection, transaction
+from vagas.models import Vaga, VagaDescricao
+
+FORMATO = 'cadastrevagas'
+
+VERSAO = 1
+
+# Tables in the order they are restored. Descriptions come ahead of their rows, which the deferred
+# foreign key allows.
+TABLES = (VagaDescricao._meta.db_table, Vaga._meta.db_table)
+
+# Triggers keeping the search vector up to date, which are disabled while a restore loads the rows:
+# the search vector is restored along with them, and computing it again takes most of the time.
+SEARCH_TRIGGERS = {
+    VagaDescricao._meta.db_table: 'vagas_vagadescricao_busca',
+    Vaga._meta.db_table: 'vagas_vaga_busca',
+}
+
+# Written after the rows of each table, as COPY does in text format. Rows cannot be equal to it,
+# since COPY escapes every backslash in the data.
+END_OF_DATA = b'\\.\n'
+
+# Indexes not backing a constraint, which are dropped before a restore and built again afterwards,
+# since building an index once over all the rows is much faster than updating it row by row.
+SECONDARY_INDEXES = """
+SELECT indexrelid::regclass::text, pg_get_indexdef(indexrelid)
+FROM pg_index
+WHERE indrelid = %s::regclass
+AND NOT EXISTS (SELECT 1 FROM pg_constraint WHERE pg_constraint.conindid = pg_index.indexrelid)
+"""
+
+RECOMPUTE_COUNTERS = """
+INSERT INTO vagas_contagemsituacao (situacao, total, geracao, geracao_exclusao)
+SELECT situacao, COUNT(*), 1, 1 FROM vagas_vaga GROUP BY situacao
+ON CONFLICT (situacao) DO UPDATE SET
+    total = EXCLUDED.total,
+    geracao = vagas_contagemsituacao.geracao + 1,
+    geracao_exclusao = vagas_contagemsituacao.geracao_exclusao + 1;
+
+UPDATE vagas_contagemsituacao SET total = 0, geracao = geracao + 1, geracao_exclusao = geracao_exclusao + 1
+WHERE NOT EXISTS (SELECT 1 FROM vagas_vaga WHERE vagas_vaga.situacao = vagas_contagemsituacao.situacao);
+"""
+
+class InvalidBackup(Exception):
+    """Raised when a file is not a complete backup made by backup_vagas, or does not fit the current tables."""
+
+def get_columns(cursor, table: str) -> list:
+    """
+    Return the columns of a table.
+
+    :param cursor: Database cursor
+
+    :param table: Name of the table
+
+    :type table: str
+
+    :rtype: list
+    """
+    return [column.name for column in connection.introspection.get_table_description(cursor, table)]
+
+def copy_columns(table: str, columns: list) -> str:
+    """
+    Return the table and column list of a COPY statement.
+
+    :param table: Name of the table
+
+    :type table: str
+
+    :param columns: Names of the columns
+
+    :type columns: list
+
+    :rtype: str
+    """
+    quote_name = connection.ops.quote_name
+
+    return f"{quote_name(table)} ({', '.join(quote_name(column) for column in columns)})"
+
+def write_line(file: BinaryIO, data: dict) -> None:
+    file.write(json.dumps(data).encode() + b'\n')
+
+def read_line(file: BinaryIO) -> dict:
+    """
+    Return the JSON object of the next line of a backup.
+
+    :raises InvalidBackup: If the line is not a JSON object.
+
+    :rtype: dict
+    """
+    try:
+        data = json.loads(file.readline())
+    except ValueError:
+        data = None
+
+    if not isinstance(data, dict):
+        raise InvalidBackup('O arquivo não é uma cópia de segurança completa das vagas.')
+
+    return data
+
+def dump(file: BinaryIO) -> dict:
+    """
+    Write every job opportunity and its description to a file, as the text output of COPY.
+
+    The file starts with a line describing the backup. Then, for each table, a line with its name
+    and columns precedes its rows, which end with END_OF_DATA and a line with their number. Rows
+    are streamed from the database straight into the file, so memory use does not depend on the
+    number of rows, and both tables are read from the same snapshot.
+
+    :param file: File opened for writing in binary mode, possibly compressed
+
+    :type file: BinaryIO
+
+    :return: Number of rows written keyed by table
+
+    :rtype: dict
+    """
+    linhas = {}
+    # Within an enclosing transaction, the tables are read as that transaction sees them.
+    snapshot = not connection.in_atomic_block
+    write_line(file, {'formato': FORMATO, 'versao': VERSAO, 'tabelas': TABLES})
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        if snapshot:
+            cursor.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY')
+
+        for table in TABLES:
+            columns = get_columns(cursor, table)
+            write_line(file, {'tabela': table, 'colunas': columns})
+            cursor.copy_expert(f'COPY {copy_columns(table, columns)} TO STDOUT', file)
+            file.write(END_OF_DATA)
+            linhas[table] = cursor.rowcount
+            write_line(file, {'linhas': cursor.rowcount})
+
+    return linhas
+
+class TableData:
+    """
+    File-like object over the rows of a table in a backup, up to END_OF_DATA.
+
+    COPY reads it in chunks, which hold whole rows, so that no more than a chunk of the backup is
+    kept in memory at a time.
+    """
+
+    def __init__(self, file: BinaryIO, size: int = 2 ** 16) -> None:
+        """
+        :param file: Backup opened for reading in binary mode, positioned at the first row of a table
+
+        :type file: BinaryIO
+
+        :param size: Approximate number of bytes returned by each read
+
+        :type size: int
+        """
+        self.file = file
+        self.size = size
+        self.linhas = 0
+        self.fim = False
+        self.erro = None
+
+    def read(self, size: int = -1) -> bytes:
+        try:
+            return self.read_lines(max(size, self.size))
+        except Exception as e:
+            # COPY reports errors of read as its own, so the original error is kept to be raised again.
+            self.erro = e
+            raise
+
+    def read_lines(self, size: int) -> bytes:
+        lines = []
+        length = 0
+
+        while not self.fim and length < size:
+            line = self.file.readline()
+
+            if line == END_OF_DATA:
+                self.fim = True
+            elif not line.endswith(b'\n'):
+                raise InvalidBackup('O arquivo termina antes do fim das linhas de uma tabela.')
+            else:
+                lines.append(line)
+                length += len(line)
+
+        self.linhas += len(lines)
+
+        return b''.join(lines)
+
+    readline = read
+
+    def skip(self) -> None:
+        """Read the remaining rows without keeping them."""
+        while self.read():
+            pass
+
+def read_tables(file: BinaryIO, cursor):
+    """
+    Return the table, columns and rows of each table of a backup, checking the backup along the way.
+
+    The rows of a table must be consumed before the next one is returned.
+
+    :param file: Backup opened for reading in binary mode
+
+    :type file: BinaryIO
+
+    :param cursor: Database cursor
+
+    :raises InvalidBackup: If the file is not a complete backup, or its columns differ from those of the tables.
+
+    :rtype: Iterator[tuple]
+    """
+    cabecalho = read_line(file)
+
+    if cabecalho.get('formato') != FORMATO or cabecalho.get('versao') != VERSAO or tuple(cabecalho.get('tabelas', ())) != TABLES:
+        raise InvalidBackup('O arquivo não é uma cópia de segurança das vagas feita nesta versão.')
+
+    for table in TABLES:
+        secao = read_line(file)
+        columns = secao.get('colunas', [])
+
+        if secao.get('tabela') != table:
+            raise InvalidBackup('O arquivo não é uma cópia de segurança completa das vagas.')
+
+        different = set(columns) ^ set(get_columns(cursor, table))
+
+        if different:
+            raise InvalidBackup(f"As colunas da tabela {table} não conferem: {', '.join(sorted(different))}.")
+
+        data = TableData(file)
+        yield table, columns, data
+
+        if not data.fim:
+            data.skip()
+
+        if read_line(file).get('linhas') != data.linhas:
+            raise InvalidBackup(f'O número de linhas da tabela {table} não confere.')
+
+    if file.read(1):
+        raise InvalidBackup('O arquivo contém dados após a última tabela.')
+
+def verify(file: BinaryIO) -> dict:
+    """
+    Check a backup made by dump without writing anything to the database.
+
+    The whole file is read, so that a compressed file is checked against its checksum as well.
+
+    :param file: Backup opened for reading in binary mode
+
+    :type file: BinaryIO
+
+    :raises InvalidBackup: If the file is not a complete backup, or its columns differ from those of the tables.
+
+    :return: Number of rows keyed by table
+
+    :rtype: dict
+    """
+    linhas = {}
+
+    with connection.cursor() as cursor:
+        for table, columns, data in read_tables(file, cursor):
+            data.skip()
+            linhas[table] = data.linhas
+
+    return linhas
+
+def restore(file: BinaryIO, replace: bool = False) -> dict:
+    """
+    Restore the job opportunities and their descriptions from a backup made by dump, in a single transaction.
+
+    Rows are streamed from the file straight into the database, with the triggers of the search
+    vector disabled, into tables whose secondary indexes are built again once the rows are loaded.
+    Afterwards the primary key sequence is set past the restored rows and the counters of
+    ContagemSituacao are computed again, with their generations incremented, as rows may have been
+    removed. Both tables are locked against reads and writes until the transaction ends.
+
+    :param file: Backup opened for reading in binary mode
+
+    :type file: BinaryIO
+
+    :param replace: Whether the current job opportunities, and everything that refers to them, are removed first
+
+    :type replace: bool
+
+    :raises InvalidBackup: If the file is not a complete backup, its columns differ from those of the tables, or there are job opportunities and replace is not given.
+
+    :return: Number of rows keyed by table
+
+    :rtype: dict
+    """
+    linhas = {}
+
+    quote_name = connection.ops.quote_name
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        # TRUNCATE and ALTER TABLE refuse tables with foreign key checks still pending in the
+        # transaction, so they run before them, and are only deferred while the rows are loaded,
+        # since descriptions come ahead of their rows.
+        cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+
+        if replace:
+            cursor.execute(f'TRUNCATE {quote_name(Vaga._meta.db_table)} CASCADE')
+        elif Vaga.objects.exists():
+            raise InvalidBackup('Já existem vagas cadastradas.')
+
+        cursor.execute('SET CONSTRAINTS ALL DEFERRED')
+        indexes = []
+
+        for table in TABLES:
+            cursor.execute(f'ALTER TABLE {quote_name(table)} DISABLE TRIGGER {quote_name(SEARCH_TRIGGERS[table])}')
+            cursor.execute(SECONDARY_INDEXES, [quote_name(table)])
+            indexes += cursor.fetchall()
+
+        for name, definition in indexes:
+            cursor.execute(f'DROP INDEX {name}')
+
+        for table, columns, data in read_tables(file, cursor):
+            try:
+                with connection.wrap_database_errors:
+                    cursor.copy_expert(f'COPY {copy_columns(table, columns)} FROM STDIN', data)
+            except DatabaseError:
+                if data.erro:
+                    raise data.erro
+
+                raise
+
+            linhas[table] = data.linhas
+
+        cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+
+        for table in TABLES:
+            cursor.execute(f'ALTER TABLE {quote_name(table)} ENABLE TRIGGER {quote_name(SEARCH_TRIGGERS[table])}')
+
+        for name, definition in indexes:
+            cursor.execute(definition)
+
+        for sql in connection.ops.sequence_reset_sql(no_style(), [Vaga]):
+            cursor.execute(sql)
+
+        cursor.execute(RECOMPUTE_COUNTERS)
+
+        for table in TABLES:
+            cursor.execute(f'ANALYZE {quote_name(table)}')
+
+    return linhas
@@ -0,0 +1,149 @@
+from datetime import datetime
+from typing import Iterable
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import get_template
+from django.utils.safestring import SafeString, mark_safe
+
+ROW_TEMPLATE = 'homepage_row.html'
+
+def row_cache_key(pk: int, data_hora_atualizacao: datetime) -> str:
+    """
+    Return the cache key of the rendered homepage row of a job opportunity.
+
+    :param pk: Primary key of the job opportunity
+
+    :type pk: int
+
+    :param data_hora_atualizacao: Datetime of the last update of the job opportunity
+
+    :type data_hora_atualizacao: datetime
+
+    :rtype: str
+    """
+    return f'vagas:linha:{pk}:{data_hora_atualizacao.timestamp()}'
+
+def render_rows(vagas: Iterable, store: bool = True) -> list[SafeString]:
+    """
+    Return the rendered homepage rows of the given job opportunities.
+
+    Rows are looked up in the cache with a single round trip; only the missing ones are
+    rendered and then stored for the next requests.
+
+    :param vagas: Job opportunities, which must provide data_hora_atualizacao
+
+    :type vagas: Iterable
+
+    :param store: Whether missing rows are stored in the cache
+
+    :type store: bool
+
+    :rtype: list[SafeString]
+    """
+    vagas_by_key = {row_cache_key(vaga.pk, vaga.data_hora_atualizacao): vaga for vaga in vagas}
+    cached = cache.get_many(vagas_by_key.keys())
+    missing = {}
+    template = None
+    rows = []
+
+    for key, vaga in vagas_by_key.items():
+        html = cached.get(key)
+
+        if html is None:
+            template = template or get_template(ROW_TEMPLATE)
+            html = missing[key] = template.render({'vaga': vaga})
+
+        rows.append(mark_safe(html))
+
+    if missing and store:
+        cache.set_many(missing, settings.VAGAS_ROW_CACHE_TIMEOUT)
+
+    return rows
+
+def invalidate_row(pk: int, data_hora_atualizacao: datetime) -> None:
+    """
+    Remove the rendered homepage row of a job opportunity from the cache.
+
+    :param pk: Primary key of the job opportunity
+
+    :type pk: int
+
+    :param data_hora_atualizacao: Datetime of the last update of the job opportunity
+
+    :type data_hora_atualizacao: datetime
+
+    :rtype: None
+    """
+    cache.delete(row_cache_key(pk, data_hora_atualizacao))
+
+DETAIL_TEMPLATE = 'oportunidades_detail_card.html'
+
+def detail_cache_key(pk: int, data_hora_atualizacao: datetime) -> str:
+    """
+    Return the cache key of the rendered detail card of a job opportunity.
+
+    :param pk: Primary key of the job opportunity
+
+    :type pk: int
+
+    :param data_hora_atualizacao: Datetime of the last update of the job opportunity
+
+    :type data_hora_atualizacao: datetime
+
+    :rtype: str
+    """
+    return f'vagas:detalhe:{pk}:{data_hora_atualizacao.timestamp()}'
+
+def store_detail(vaga) -> SafeString:
+    """
+    Render the detail card of a job opportunity and store it in the cache.
+
+    The card holds the description, which may be a whole job posting, with its line breaks turned
+    into paragraphs, and the links of the job opportunity; rendering it takes time proportional to
+    the length of the description.
+
+    :param vaga: Job opportunity, with its description
+
+    :type vaga: Vaga
+
+    :rtype: SafeString
+    """
+    html = get_template(DETAIL_TEMPLATE).render({'vaga': vaga})
+    cache.set(detail_cache_key(vaga.pk, vaga.data_hora_atualizacao), html, settings.VAGAS_ROW_CACHE_TIMEOUT)
+
+    return mark_safe(html)
+
+def render_detail(vaga) -> SafeString:
+    """
+    Return the rendered detail card of a job opportunity, from the cache if it was rendered since its last update.
+
+    The description of the job opportunity is only read when the card has to be rendered.
+
+    :param vaga: Job opportunity
+
+    :type vaga: Vaga
+
+    :rtype: SafeString
+    """
+    html = cache.get(detail_cache_key(vaga.pk, vaga.data_hora_atualizacao))
+
+    if html is None:
+        return store_detail(vaga)
+
+    return mark_safe(html)
+
+def invalidate_detail(pk: int, data_hora_atualizacao: datetime) -> None:
+    """
+    Remove the rendered detail card of a job opportunity from the cache.
+
+    :param pk: Primary key of the job opportunity
+
+    :type pk: int
+
+    :param data_hora_atualizacao: Datetime of the last update of the job opportunity
+
+    :type data_hora_atualizacao: datetime
+
+    :rtype: None
+    """
+    cache.delete(detail_cache_key(pk, data_hora_atualizacao))
@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import Count
+from django.template.loader import render_to_string
+from django.utils import timezone
+from vagas.models import ContagemSituacao, Vaga
+
+# Statuses in which a job opportunity is still waiting for the next step of the user or of the company.
+OPEN_STATUSES = (Vaga.Status.APPLIED, Vaga.Status.WAITING)
+
+# Interviews and stale job opportunities listed by name in the digest; the others are only counted.
+LISTED = 10
+
+def count_by_status(vagas) -> dict:
+    """
+    Return the number of the given job opportunities keyed by status label, in the order of Vaga.Status.
+
+    :param vagas: Job opportunities
+
+    :type vagas: QuerySet
+
+    :rtype: dict
+    """
+    totais = dict(vagas.order_by().values('situacao').annotate(total=Count('id')).values_list('situacao', 'total'))
+
+    return {label: totais[value] for value, label in Vaga.Status.choices if totais.get(value)}
+
+def build_digest(now: datetime, dias: int, dias_parada: int) -> dict:
+    """
+    Return the summary of the job opportunities sent by the digest.
+
+    Each part is computed by the database with an aggregate or a short indexed query: registrations
+    by the BRIN index on data_hora_cadastro, updates by vaga_atualizacao_idx, interviews by the
+    partial vaga_entrevista_agendada_idx index and stale job opportunities by
+    vaga_situacao_atualizacao_idx. Stale job opportunities are usually most of the open ones, so
+    they are counted as the totals kept by ContagemSituacao minus the open job opportunities updated
+    recently, instead of counting the stale rows themselves. Job opportunities do not keep a history
+    of their statuses, so status changes are reported as the job opportunities registered before the
+    period and updated during it, by their current status.
+
+    :param now: Current datetime
+
+    :type now: datetime
+
+    :param dias: Number of days summarized, ending now
+
+    :type dias: int
+
+    :param dias_parada: Number of days without updates after which an open job opportunity is stale
+
+    :type dias_parada: int
+
+    :rtype: dict
+    """
+    inicio = now - timedelta(days=dias)
+    limite_parada = now - timedelta(days=dias_parada)
+    paradas = (
+        Vaga.objects.filter(situacao__in=OPEN_STATUSES, data_hora_atualizacao__lt=limite_parada)
+        .order_by('data_hora_atualizacao', 'id')
+    )
+    entrevistas = Vaga.objects.filter(
+        situacao=Vaga.Status.INTERVIEW_SCHEDULED,
+        data_hora_entrevista__gte=now,
+        data_hora_entrevista__lt=now + timedelta(days=dias),
+    ).order_by('data_hora_entrevista', 'id')
+    total_entrevistas = entrevistas.count()
+    entrevistas = list(entrevistas.only('empresa_nome', 'cargo_titulo', 'data_hora_entrevista')[:LISTED])
+    totais = ContagemSituacao.totais()
+    recentes = Vaga.objects.filter(situacao__in=OPEN_STATUSES, data_hora_atualizacao__gte=limite_parada).count()
+    # The counters and the rows are read at slightly different moments, so the difference is kept from going negative.
+    total_paradas = max(0, sum(totais[situacao] for situacao in OPEN_STATUSES) - recentes)
+    paradas = list(paradas.only('empresa_nome', 'cargo_titulo', 'situacao', 'data_hora_atualizacao')[:LISTED])
+
+    return {
+        'inicio': inicio,
+        'fim': now,
+        'dias': dias,
+        'dias_parada': dias_parada,
+        'novas': count_by_status(Vaga.objects.filter(data_hora_cadastro__gte=inicio)),
+        'atualizadas': count_by_status(
+            Vaga.objects.filter(data_hora_atualizacao__gte=inicio, data_hora_cadastro__lt=inicio)
+        ),
+        'entrevistas': entrevistas,
+        'total_entrevistas': total_entrevistas,
+        'outras_entrevistas': total_entrevistas - len(entrevistas),
+        'paradas': paradas,
+        'total_paradas': total_paradas,
+        'outras_paradas': total_paradas - len(paradas),
+    }
+
+def render_digest(digest: dict) -> tuple:
+    """
+    Return the subject and the body of the digest email.
+
+    :param digest: Summary returned by build_digest
+
+    :type digest: dict
+
+    :rtype: tuple
+    """
+    inicio = timezone.localtime(digest['inicio']).strftime('%d/%m')
+    fim = timezone.localtime(digest['fim']).strftime('%d/%m/%Y')
+
+    return f'Resumo das suas vagas de {inicio} a {fim}', render_to_string('digest_email.txt', digest)
+
+def send_digest(digest: dict, batch_size: int) -> int:
+    """
+    Send the digest to every active user with an email address.
+
+    The digest is rendered once, and the messages, one per user so that addresses are not
+    disclosed, are sent in batches through a single connection to the email backend.
+
+    :param digest: Summary returned by build_digest
+
+    :type digest: dict
+
+    :param batch_size: Number of messages sent at a time
+
+    :type batch_size: int
+
+    :return: Number of messages sent
+
+    :rtype: int
+    """
+    subject, body = render_digest(digest)
+    destinatarios = (
+        get_user_model().objects.filter(is_active=True).exclude(email='')
+        .order_by('pk').values_list('email', flat=True)
+    )
+    enviadas = 0
+    batch = []
+
+    with get_connection() as connection:
+        for email in destinatarios.iterator():
+            batch.append(EmailMessage(subject, body, None, [email], connection=connection))
+
+            if len(batch) == batch_size:
+                enviadas += connection.send_messages(batch) or 0
+                batch = []
+
+        if batch:
+            enviadas += connection.send_messages(batch) or 0
+
+    return enviadas
@@ -0,0 +1,183 @@
+import csv
+import json
+import zlib
+from datetime import tzinfo
+from io import StringIO
+from itertools import islice
+from typing import Iterator
+from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet
+from django.http import HttpResponseBadRequest, StreamingHttpResponse
+from django.utils import timezone
+from django.views.decorators.http import require_safe
+from vagas.api import API_FIELDS, values
+from vagas.filters import filter_vagas, get_ordering, rank_vagas
+
+FORMATS = ('csv', 'ndjson')
+
+CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+TELEFONE_FIELDS = ('empresa_telefone_celular', 'empresa_telefone_comercial')
+
+# Columns of an exported file: the fields of the API, each phone followed by its digits. The fields of the
+# registration form keep the format the form expects, so that an exported file can be imported again with
+# the import_vagas command.
+COLUMNS = tuple(
+    column
+    for name in API_FIELDS
+    for column in ((name, f'{name}_digitos') if name in TELEFONE_FIELDS else (name,))
+)
+
+# Format of data_hora_entrevista in the registration form.
+DATA_HORA_ENTREVISTA_FORMAT = '%d/%m/%Y %H:%M'
+
+def export_row(row: dict, tz: tzinfo) -> list:
+    """
+    Return the values of an exported row, in the order of COLUMNS.
+
+    Phones are given both as formatted by Telefone and as their digits, and empty ones as empty strings
+    in both columns. The interview datetime comes in local time, formatted as in the registration form,
+    and the other datetimes in local time and ISO 8601.
+
+    :param row: A job opportunity as returned by values() with API_FIELDS
+
+    :type row: dict
+
+    :param tz: The current time zone, looked up once per export rather than once per datetime
+
+    :type tz: tzinfo
+
+    :rtype: list
+    """
+    exported = []
+
+    for name in API_FIELDS:
+        value = row[name]
+
+        if name in TELEFONE_FIELDS:
+            exported += (str(value), value.digitos if value else '')
+        elif name == 'data_hora_entrevista':
+            exported.append(value.astimezone(tz).strftime(DATA_HORA_ENTREVISTA_FORMAT) if value else None)
+        elif name in ('data_hora_cadastro', 'data_hora_atualizacao'):
+            exported.append(value.astimezone(tz).isoformat())
+        else:
+            exported.append(value)
+
+    return exported
+
+def encode_csv(rows: Iterator[list]) -> Iterator[str]:
+    """
+    Encode chunks of exported rows as CSV, with a header row naming the columns.
+
+    :param rows: Chunks of rows returned by export_row
+
+    :type rows: Iterator[list]
+
+    :rtype: Iterator[str]
+    """
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(COLUMNS)
+
+    for chunk in rows:
+        writer.writerows(chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    yield buffer.getvalue()
+
+def encode_ndjson(rows: Iterator[list]) -> Iterator[str]:
+    """
+    Encode chunks of exported rows as NDJSON, one JSON object per line.
+
+    :param rows: Chunks of rows returned by export_row
+
+    :type rows: Iterator[list]
+
+    :rtype: Iterator[str]
+    """
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+    for chunk in rows:
+        yield ''.join(encoder.encode(dict(zip(COLUMNS, row))) + '\n' for row in chunk)
+
+ENCODERS = {
+    'csv': encode_csv,
+    'ndjson': encode_ndjson,
+}
+
+def compress(chunks: Iterator[str]) -> Iterator[bytes]:
+    """
+    Encode text chunks as UTF-8 and compress them as a single gzip member, as they come.
+
+    :param chunks: Text to be compressed
+
+    :type chunks: Iterator[str]
+
+    :rtype: Iterator[bytes]
+    """
+    compressor = zlib.compressobj(settings.VAGAS_EXPORT_COMPRESS_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+
+        if data:
+            yield data
+
+    yield compressor.flush()
+
+def export_chunks(vagas: QuerySet, chunk_size: int) -> Iterator[list]:
+    """
+    Return the exported rows of the given job opportunities in chunks, read through a server-side cursor.
+
+    :param vagas: The ordered job opportunities to be exported
+
+    :type vagas: QuerySet
+
+    :param chunk_size: Number of rows fetched and encoded at a time
+
+    :type chunk_size: int
+
+    :rtype: Iterator[list]
+    """
+    tz = timezone.get_current_timezone()
+
+    # Without a transaction, PostgreSQL would materialize the whole result of a WITH HOLD cursor before the first fetch.
+    with transaction.atomic():
+        rows = values(vagas, API_FIELDS).iterator(chunk_size=chunk_size)
+
+        for chunk in iter(lambda: list(islice(rows, chunk_size)), []):
+            yield [export_row(row, tz) for row in chunk]
+
+@require_safe
+def export_view(request):
+    """
+    Export the job opportunities selected by the filter of the homepage, in the same order, as CSV or NDJSON.
+
+    The format is chosen with the formato query parameter, and compactar=1 compresses the file with
+    gzip. The file is encoded and sent in chunks as the rows are read, so neither the memory used nor
+    the time to first byte depend on the number of rows.
+    """
+    formato = request.GET.get('formato', 'csv')
+
+    if formato not in FORMATS:
+        return HttpResponseBadRequest('Formato de exportação desconhecido.')
+
+    vagas = rank_vagas(filter_vagas(request.GET), request.GET).order_by(*get_ordering(request.GET))
+    content = ENCODERS[formato](export_chunks(vagas, settings.VAGAS_STREAM_CHUNK_SIZE))
+    filename = f'vagas-{timezone.localtime():%Y%m%d-%H%M}.{formato}'
+
+    if request.GET.get('compactar') == '1':
+        response = StreamingHttpResponse(compress(content), content_type='application/gzip')
+        filename += '.gz'
+    else:
+        response = StreamingHttpResponse((chunk.encode() for chunk in content), content_type=CONTENT_TYPES[formato])
+
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+
+    return response
@@ -0,0 +1,292 @@
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db.models import F, FloatField, Max, QuerySet, Subquery, Value
+from django.db.models.functions import Cast
+from django.http import QueryDict
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from vagas.forms import OportunidadesFilterForm
+from vagas.models import Unaccent, Vaga
+
+# Rows ranked when looking up similar company names, which bounds the time of a lookup when a
+# short or common name resembles a large part of the table.
+SIMILAR_EMPRESAS_CANDIDATES = 500
+
+def get_situacoes(params: QueryDict) -> list:
+    """
+    Return the statuses chosen in the filter, without repetitions and in alphabetical order of their values.
+
+    Unknown values are ignored, and an empty list means that every status is shown.
+
+    :param params: Query parameters of the request
+
+    :type params: QueryDict
+
+    :rtype: list
+    """
+    situacoes = set(params.getlist('situacao')) & set(Vaga.Status.values)
+
+    return [Vaga.Status(situacao) for situacao in sorted(situacoes)]
+
+def canonical_params(params: QueryDict) -> QueryDict:
+    """
+    Return a copy of the query parameters in a canonical order, with the chosen statuses as returned by get_situacoes.
+
+    Requests that differ only in the order of their parameters, e.g. ?situacao=W&situacao=C and
+    ?situacao=C&situacao=W, get the same query string, so that links, cache keys and ETags built
+    from it do not vary between equivalent filters.
+
+    :param params: Query parameters of the request
+
+    :type params: QueryDict
+
+    :rtype: QueryDict
+    """
+    canonical = QueryDict(mutable=True)
+
+    for key in sorted(params):
+        if 'situacao' == key:
+            canonical.setlist(key, get_situacoes(params))
+        else:
+            canonical.setlist(key, params.getlist(key))
+
+    return canonical
+
+def get_busca(params: QueryDict) -> Optional[SearchQuery]:
+    """
+    Return the full-text search query typed in the filter, if any.
+
+    The text is parsed with the same syntax as web search engines, so quoted phrases,
+    "or" and a leading minus sign are understood.
+
+    :param params: Query parameters of the request
+
+    :type params: QueryDict
+
+    :rtype: SearchQuery or None
+    """
+    busca = params.get('busca', '').strip()
+
+    if not busca:
+        return None
+
+    return SearchQuery(busca, config='portuguese', search_type='websearch')
+
+def get_empresa(params: QueryDict) -> str:
+    """
+    Return the company name typed in the filter, or an empty string.
+
+    :param params: Query parameters of the request
+
+    :type params: QueryDict
+
+    :rtype: str
+    """
+    return params.get('empresa', '').strip()
+
+def get_date(params: QueryDict, name: str) -> Optional[date]:
+    """
+    Return the date given in a query parameter in the ISO format, if it is valid.
+
+    :param params: Query parameters of the request
+
+    :type params: QueryDict
+
+    :param name: Name of the query parameter
+
+    :type name: str
+
+    :rtype: date or None
+    """
+    try:
+        return parse_date(params.get(name, ''))
+    except ValueError:
+        return None
+
+def get_periodo_cadastro(params: QueryDict) -> tuple:
+    """
+    Return the first and last registration dates chosen in the filter, each of them possibly None.
+
+    A preset period starts that many days before today, counting today, and is combined
+    with the first date typed by the user, if any.
+
+    :param params: Query parameters of the request
+
+    :type params: QueryDict
+
+    :rtype: tuple
+    """
+    inicio = get_date(params, 'data_cadastro_inicio')
+    fim = get_date(params, 'data_cadastro_fim')
+    periodo = params.get('periodo_cadastro')
+
+    if periodo in OportunidadesFilterForm.PeriodoCadastro.values:
+        inicio_periodo = timezone.localdate() - timedelta(days=int(periodo) - 1)
+        inicio = max(inicio, inicio_periodo) if inicio else inicio_periodo
+
+    return inicio, fim
+
+def start_of_day(day: date) -> datetime:
+    """
+    Return the first instant of the given day in the current time zone.
+
+    :param day: A date
+
+    :type day: date
+
+    :rtype: datetime
+    """
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+def has_row_filter(params: QueryDict) -> bool:
+    """
+    Check whether the job opportunities are filtered by anything besides their status.
+
+    The status counters cannot tell how many job opportunities match these filters, and the
+    planner cannot estimate well how many rows match a text filter.
+
+    :param params: Query parameters of the request
+
+    :type params: QueryDict
+
+    :rtype: bool
+    """
+    return get_busca(params) is not None or bool(get_empresa(params)) or any(get_periodo_cadastro(params))
+
+def get_data_hora_cadastro_order(params: QueryDict) -> OportunidadesFilterForm.DataHoraCadastroOrder:
+    """
+    Return the order of the registration datetime chosen in the filter, newest first by default.
+
+    :param params: Query parameters of the request
+
+    :type params: QueryDict
+
+    :rtype: OportunidadesFilterForm.DataHoraCadastroOrder
+    """
+    if OportunidadesFilterForm.DataHoraCadastroOrder.OLDEST.value == params.get('data_hora_cadastro_order'):
+        return OportunidadesFilterForm.DataHoraCadastroOrder.OLDEST
+
+    return OportunidadesFilterForm.DataHoraCadastroOrder.NEWEST
+
+def get_ordering(params: QueryDict) -> tuple:
+    """
+    Return the ordering of the filtered job opportunities, which always ends with the primary key.
+
+    Search results are ordered by relevance, which requires the rank annotation added by rank_vagas.
+
+    :param params: Query parameters of the request
+
+    :type params: QueryDict
+
+    :rtype: tuple
+    """
+    if get_busca(params) is not None:
+        return ('-rank', '-id',)
+
+    if OportunidadesFilterForm.DataHoraCadastroOrder.OLDEST == get_data_hora_cadastro_order(params):
+        return ('data_hora_cadastro', 'id',)
+
+    return ('-data_hora_cadastro', '-id',)
+
+def filter_vagas(params: QueryDict) -> QuerySet:
+    """
+    Return the job opportunities matching the filter, not yet ordered.
+
+    :param params: Query parameters of the request
+
+    :type params: QueryDict
+
+    :rtype: QuerySet
+    """
+    situacoes = get_situacoes(params)
+    busca = get_busca(params)
+    empresa = get_empresa(params)
+    vagas = Vaga.objects.filter(situacao__in=situacoes) if situacoes else Vaga.objects.all()
+
+    if busca is not None:
+        vagas = vagas.filter(busca=busca)
+
+    if empresa:
+        vagas = filter_empresa(vagas, empresa)
+
+    inicio, fim = get_periodo_cadastro(params)
+
+    if inicio:
+        vagas = vagas.filter(data_hora_cadastro__gte=start_of_day(inicio))
+
+    if fim:
+        vagas = vagas.filter(data_hora_cadastro__lt=start_of_day(fim + timedelta(days=1)))
+
+    return vagas
+
+def filter_empresa(vagas: QuerySet, empresa: str) -> QuerySet:
+    """
+    Return the job opportunities whose company name resembles the given one.
+
+    Names are compared by trigram word similarity, ignoring case and accents, so that
+    "itau" matches "Itaú Unibanco". The filter is served by the vaga_empresa_trgm_idx index.
+
+    :param vagas: Job opportunities to be filtered
+
+    :type vagas: QuerySet
+
+    :param empresa: Company name, possibly incomplete or misspelled
+
+    :type empresa: str
+
+    :rtype: QuerySet
+    """
+    return vagas.alias(empresa_sem_acento=Unaccent('empresa_nome')).filter(
+        empresa_sem_acento__trigram_word_similar=Unaccent(Value(empresa)),
+    )
+
+def similar_empresas(empresa: str, limit: int) -> list:
+    """
+    Return the registered company names that most resemble the given one, most similar first.
+
+    Only the first SIMILAR_EMPRESAS_CANDIDATES rows found by the trigram index are ranked.
+
+    :param empresa: Company name, possibly incomplete or misspelled
+
+    :type empresa: str
+
+    :param limit: Maximum number of names returned
+
+    :type limit: int
+
+    :rtype: list
+    """
+    similaridade = TrigramWordSimilarity(Unaccent(Value(empresa)), Unaccent('empresa_nome'))
+
+    candidatos = filter_empresa(Vaga.objects.all(), empresa).values('pk')[:SIMILAR_EMPRESAS_CANDIDATES]
+
+    return list(
+        Vaga.objects.filter(pk__in=Subquery(candidatos))
+        .values('empresa_nome')
+        .annotate(similaridade=Max(similaridade))
+        .order_by('-similaridade', 'empresa_nome')
+        .values_list('empresa_nome', flat=True)[:limit]
+    )
+
+def rank_vagas(vagas: QuerySet, params: QueryDict) -> QuerySet:
+    """
+    Annotate the filtered job opportunities with the relevance to the search query, if any.
+
+    Matches in cargo_titulo weigh the most, followed by empresa_nome and then cargo_descricao.
+    The rank is cast to double precision so that the value sent back in a pagination cursor
+    compares exactly equal to the one computed by the database.
+
+    :param vagas: Job opportunities returned by filter_vagas
+
+    :type vagas: QuerySet
+
+    :param params: Query parameters of the request
+
+    :type params: QueryDict
+
+    :rtype: QuerySet
+    """
+    busca = get_busca(params)
+
+    return vagas.annotate(rank=Cast(SearchRank(F('busca'), busca), FloatField())) if busca is not None else vagas
@@ -1,10 +1,40 @@
+from datetime import datetime
+from typing import Optional
 from django import forms
 from django.db import models
 from django.core.validators import RegexValidator
 from django.core.exceptions import ValidationError
+from django.urls import reverse_lazy
 from vagas.models import Vaga
 from vagas.validators import is_equal_to_or_later_than_current_datetime
 
+def validate_entrevista(situacao: Optional[str], data_hora_entrevista: Optional[datetime]) -> Optional[ValidationError]:
+    """
+    Return the error of an interview datetime that does not fit the status of a job opportunity, if any.
+
+    Overlaps with other scheduled interviews are not checked here.
+
+    :param situacao: Status of the job opportunity
+
+    :type situacao: str or None
+
+    :param data_hora_entrevista: Datetime of the interview
+
+    :type data_hora_entrevista: datetime or None
+
+    :rtype: ValidationError or None
+    """
+    if situacao == Vaga.Status.APPLIED and data_hora_entrevista is not None:
+        return ValidationError("O campo Data e horário da entrevista deve estar vazio caso a situação do cadastro seja 'Candidatado'.", code='invalid')
+
+    if situacao == Vaga.Status.INTERVIEW_SCHEDULED and data_hora_entrevista is None:
+        return ValidationError("O campo Data e o horário da entrevista deve ser preenchido caso a situação do cadastro seja 'Entrevista agendada'.", code='required')
+
+    if situacao == Vaga.Status.INTERVIEW_SCHEDULED and not is_equal_to_or_later_than_current_datetime(data_hora_entrevista):
+        return ValidationError("O campo Data e horário da entrevista não pode ser anterior à data e ao horário atuais.", code='invalid_datetime')
+
+    return None
+
 class CadastroVagasForm(forms.Form):
     """Form for submitting job opportunities."""
     template_name = 'cadastro_vagas_form.html'
@@ -13,7 +43,11 @@ class CadastroVagasForm(forms.Form):
         label='Nome da empresa',
         widget=forms.TextInput(attrs={
             'class': 'form-control shadow-sm',
-            'aria-describedby': 'empresa_nome_required'
+            'aria-describedby': 'empresa_nome_required empresa_nome_semelhantes_hint',
+            'autocomplete': 'off',
+            'list': 'empresa_nome_sugestoes',
+            'data-autocomplete-url': reverse_lazy('oportunidades_api_autocomplete', args=['empresa_nome']),
+            'data-semelhantes-url': reverse_lazy('oportunidades_api_empresas'),
         }),
         required=True,
         max_length=100,
@@ -101,7 +135,10 @@ class CadastroVagasForm(forms.Form):
         label='Título do cargo',
         widget=forms.TextInput(attrs={
             'class': 'form-control shadow-sm',
-            'aria-describedby': 'cargo_titulo_required'
+            'aria-describedby': 'cargo_titulo_required',
+            'autocomplete': 'off',
+            'list': 'cargo_titulo_sugestoes',
+            'data-autocomplete-url': reverse_lazy('oportunidades_api_autocomplete', args=['cargo_titulo']),
         }),
         required=True,
         max_length=50,
@@ -164,30 +201,35 @@ class CadastroVagasForm(forms.Form):
         },
     )
 
+    def __init__(self, *args, pk: Optional[int] = None, **kwargs) -> None:
+        """
+        :param pk: Primary key of the job opportunity being updated, which is not compared with itself for interview conflicts
+
+        :type pk: int
+        """
+        super().__init__(*args, **kwargs)
+        self.pk = pk
+
     def clean(self):
         super().clean()
         situacao = self.cleaned_data.get('situacao')
         data_hora_entrevista = self.cleaned_data.get('data_hora_entrevista')
 
-        if situacao == Vaga.Status.APPLIED and data_hora_entrevista is not None:
-            self.add_error('data_hora_entrevista',
-                ValidationError("O campo Data e horário da entrevista deve estar vazio caso a situação do cadastro seja 'Candidatado'.", code='invalid')
-            )
-        
-        if (situacao == Vaga.Status.INTERVIEW_SCHEDULED and data_hora_entrevista is None):
-            self.add_error('data_hora_entrevista',
-                ValidationError("O campo Data e o horário da entrevista deve ser preenchido caso a situação do cadastro seja 'Entrevista agendada'.", code='required')
-            )
+        error = validate_entrevista(situacao, data_hora_entrevista)
+
+        if error is not None:
+            self.add_error('data_hora_entrevista', error)
 
         if (situacao == Vaga.Status.INTERVIEW_SCHEDULED
             and
             data_hora_entrevista is not None
             and
-            not is_equal_to_or_later_than_current_datetime(data_hora_entrevista)
+            not self.has_error('data_hora_entrevista')
         ):
-            self.add_error('data_hora_entrevista',
-                ValidationError("O campo Data e horário da entrevista não pode ser anterior à data e ao horário atuais.", code='invalid_datetime')
-            )
+            try:
+                Vaga(pk=self.pk, situacao=situacao, data_hora_entrevista=data_hora_entrevista).validate_interview_conflict()
+            except ValidationError as e:
+                self.add_error('data_hora_entrevista', e)
 
         for bound_field in self:
             if bound_field.errors:
@@ -204,15 +246,42 @@ class OportunidadesFilterForm(forms.Form):
         OLDEST = 'A', 'Mais antigas'
         NEWEST = 'D', 'Mais recentes'
 
+    class PeriodoCadastro(models.TextChoices):
+        LAST_7_DAYS = '7', 'Últimos 7 dias'
+        LAST_30_DAYS = '30', 'Últimos 30 dias'
+        LAST_90_DAYS = '90', 'Últimos 90 dias'
+
     template_name = 'oportunidades_filter_form.html'
-    situacao = forms.ChoiceField(
+    busca = forms.CharField(
+        label='Busca',
+        required=False,
+        max_length=100,
+        widget=forms.TextInput(attrs={
+            'type': 'search',
+            'class': 'form-control form-control-sm shadow-sm',
+            'placeholder': 'Empresa, cargo ou descrição',
+            'aria-label': 'Busca por empresa, cargo ou descrição da oportunidade de vaga',
+        }),
+    )
+
+    empresa = forms.CharField(
+        label='Empresa',
+        required=False,
+        max_length=100,
+        widget=forms.TextInput(attrs={
+            'class': 'form-control form-control-sm shadow-sm',
+            'aria-label': 'Filtro por nome parecido da empresa da oportunidade de vaga',
+        }),
+    )
+
+    situacao = forms.MultipleChoiceField(
         label='Situação',
         required=False,
-        choices=Vaga.Status.choices + [(None, 'Todas'),],
-        initial=(None, 'Todas',),
-        widget=forms.Select(attrs={
-            'class': 'form-select form-select-sm shadow-sm',
-            'aria-label': 'Filtro de situação da oportunidade de vaga',
+        choices=Vaga.Status.choices,
+        initial=[],
+        widget=forms.CheckboxSelectMultiple(attrs={
+            'class': 'form-check-input',
+            'aria-label': 'Filtro de situações da oportunidade de vaga',
         }),
     )
 
@@ -225,4 +294,49 @@ class OportunidadesFilterForm(forms.Form):
             'class': 'form-select form-select-sm shadow-sm',
             'aria-label': 'Filtro para ordenar oportunidades por data e hora do cadastro',
         })
-    )
\ No newline at end of file
+    )
+
+    periodo_cadastro = forms.ChoiceField(
+        label='Período do cadastro',
+        required=False,
+        choices=PeriodoCadastro.choices + [(None, 'Qualquer data'),],
+        initial=(None, 'Qualquer data',),
+        widget=forms.Select(attrs={
+            'class': 'form-select form-select-sm shadow-sm',
+            'aria-label': 'Filtro de período do cadastro da oportunidade de vaga',
+        }),
+    )
+
+    data_cadastro_inicio = forms.DateField(
+        label='Cadastrada a partir de',
+        required=False,
+        widget=forms.DateInput(format='%Y-%m-%d', attrs={
+            'type': 'date',
+            'class': 'form-control form-control-sm shadow-sm',
+            'aria-label': 'Filtro de data inicial do cadastro da oportunidade de vaga',
+        }),
+    )
+
+    data_cadastro_fim = forms.DateField(
+        label='Cadastrada até',
+        required=False,
+        widget=forms.DateInput(format='%Y-%m-%d', attrs={
+            'type': 'date',
+            'class': 'form-control form-control-sm shadow-sm',
+            'aria-label': 'Filtro de data final do cadastro da oportunidade de vaga',
+        }),
+    )
+
+    def __init__(self, *args, totais: Optional[dict] = None, **kwargs) -> None:
+        """
+        :param totais: Number of job opportunities keyed by status, shown next to each status choice
+
+        :type totais: dict
+        """
+        super().__init__(*args, **kwargs)
+
+        if totais is not None:
+            self.fields['situacao'].choices = [
+                (value, f'{label} ({totais.get(value, 0)})')
+                for value, label in Vaga.Status.choices
+            ]
@@ -0,0 +1,215 @@
+import hashlib
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+from django.http import HttpResponse
+from django.views.decorators.http import condition, require_safe
+from vagas.models import ContagemSituacao, Vaga
+
+# Lines longer than this number of octets are folded, as required by RFC 5545.
+MAX_LINE_OCTETS = 75
+
+def escape_text(value: str) -> str:
+    """
+    Escape a value of a TEXT property of an iCalendar object.
+
+    :param value: Text to be escaped
+
+    :type value: str
+
+    :rtype: str
+    """
+    return (
+        value.replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+    )
+
+def format_datetime(value: datetime) -> str:
+    """
+    Format a datetime in UTC, as expected by the DTSTART, DTEND and DTSTAMP properties.
+
+    :param value: An aware datetime
+
+    :type value: datetime
+
+    :rtype: str
+    """
+    return value.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+def fold_line(line: str) -> str:
+    """
+    Return a content line of an iCalendar object, folded into lines of at most MAX_LINE_OCTETS octets and ending with CRLF.
+
+    :param line: Unfolded content line
+
+    :type line: str
+
+    :rtype: str
+    """
+    lines = []
+    current = ''
+    size = 0
+
+    for char in line:
+        char_size = len(char.encode())
+
+        # Continuation lines start with a space, which counts towards their size.
+        if size + char_size > MAX_LINE_OCTETS:
+            lines.append(current)
+            current = ' '
+            size = 1
+
+        current += char
+        size += char_size
+
+    lines.append(current)
+
+    return '\r\n'.join(lines) + '\r\n'
+
+def event_cache_key(pk: int, data_hora_atualizacao: datetime, base_url: str) -> str:
+    """
+    Return the cache key of the serialized event of the interview of a job opportunity.
+
+    :param pk: Primary key of the job opportunity
+
+    :type pk: int
+
+    :param data_hora_atualizacao: Datetime of the last update of the job opportunity
+
+    :type data_hora_atualizacao: datetime
+
+    :param base_url: Scheme and host the URLs in the event are built with
+
+    :type base_url: str
+
+    :rtype: str
+    """
+    return f'vagas:vevent:{pk}:{data_hora_atualizacao.timestamp()}:{base_url}'
+
+def render_event(vaga: Vaga, base_url: str) -> str:
+    """
+    Return the VEVENT of the interview of a job opportunity.
+
+    :param vaga: Job opportunity with Status.INTERVIEW_SCHEDULED
+
+    :type vaga: Vaga
+
+    :param base_url: Scheme and host the URL of the job opportunity is built with
+
+    :type base_url: str
+
+    :rtype: str
+    """
+    inicio = vaga.data_hora_entrevista
+    fim = inicio + timedelta(minutes=settings.VAGAS_INTERVIEW_DURATION)
+    url = base_url + vaga.get_absolute_url()
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:vaga-{vaga.pk}@cadastrevagas',
+        f'DTSTAMP:{format_datetime(vaga.data_hora_atualizacao)}',
+        f'LAST-MODIFIED:{format_datetime(vaga.data_hora_atualizacao)}',
+        f'DTSTART:{format_datetime(inicio)}',
+        f'DTEND:{format_datetime(fim)}',
+        f'SUMMARY:{escape_text(f"Entrevista: {vaga.cargo_titulo} - {vaga.empresa_nome}")}',
+        f'DESCRIPTION:{escape_text(f"{vaga.cargo_titulo} na empresa {vaga.empresa_nome}.")}\\n{escape_text(url)}',
+        f'URL:{url}',
+        'END:VEVENT',
+    ]
+
+    return ''.join(fold_line(line) for line in lines)
+
+def render_feed(base_url: str) -> str:
+    """
+    Return the iCalendar feed with one event per scheduled interview.
+
+    The serialized events are cached by primary key and datetime of the last update, so only
+    the events of the job opportunities updated since they were last serialized are rendered;
+    the other rows are not even read beyond the columns the partial vaga_entrevista_agendada_idx
+    index leads to.
+
+    :param base_url: Scheme and host the URLs in the events are built with
+
+    :type base_url: str
+
+    :rtype: str
+    """
+    agendadas = (
+        Vaga.objects.filter(situacao=Vaga.Status.INTERVIEW_SCHEDULED, data_hora_entrevista__isnull=False)
+        .order_by('data_hora_entrevista', 'id')
+        .values_list('pk', 'data_hora_atualizacao')
+    )
+    keys = {pk: event_cache_key(pk, data_hora_atualizacao, base_url) for pk, data_hora_atualizacao in agendadas}
+    cached = cache.get_many(keys.values())
+    missing = [pk for pk, key in keys.items() if key not in cached]
+
+    if missing:
+        rendered = {}
+
+        for vaga in Vaga.objects.filter(pk__in=missing).only(
+            'empresa_nome', 'cargo_titulo', 'data_hora_entrevista', 'data_hora_atualizacao',
+        ):
+            rendered[event_cache_key(vaga.pk, vaga.data_hora_atualizacao, base_url)] = render_event(vaga, base_url)
+
+        cache.set_many(rendered, settings.VAGAS_ROW_CACHE_TIMEOUT)
+        cached.update(rendered)
+
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//CadastreVagas//Agenda de entrevistas//PT',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        'X-WR-CALNAME:Entrevistas - CadastreVagas',
+    ]
+    # A row updated between both queries is left out of this version of the feed; its new datetime changes the ETag.
+    events = [cached[key] for key in keys.values() if key in cached]
+
+    return ''.join(fold_line(line) for line in lines) + ''.join(events) + fold_line('END:VCALENDAR')
+
+def feed_etag(request) -> str:
+    """
+    Return the ETag of the iCalendar feed.
+
+    It changes whenever a scheduled interview is created or updated, which moves the latest
+    data_hora_atualizacao of the rows with Status.INTERVIEW_SCHEDULED, and whenever a row leaves
+    that status, which bumps the generation of its status counter. It is computed once per
+    request and kept on it, since feed_view needs it again for the cache key.
+
+    :rtype: str
+    """
+    if hasattr(request, 'vagas_feed_etag'):
+        return request.vagas_feed_etag
+
+    ultima_atualizacao = (
+        Vaga.objects.filter(situacao=Vaga.Status.INTERVIEW_SCHEDULED)
+        .aggregate(ultima=Max('data_hora_atualizacao'))['ultima']
+    )
+    contagem = ContagemSituacao.objects.filter(situacao=Vaga.Status.INTERVIEW_SCHEDULED).values_list('total', 'geracao').first()
+    validator = repr((ultima_atualizacao, contagem, request.build_absolute_uri('/'), settings.VAGAS_INTERVIEW_DURATION))
+
+    request.vagas_feed_etag = hashlib.md5(validator.encode()).hexdigest()
+
+    return request.vagas_feed_etag
+
+@require_safe
+@condition(etag_func=feed_etag)
+def feed_view(request):
+    """
+    Return the iCalendar feed of the scheduled interviews, to be subscribed to by calendar clients.
+
+    Clients polling the feed are answered with 304 Not Modified while nothing changed, and the
+    serialized feed is cached by ETag for the clients that do not send If-None-Match.
+    """
+    base_url = request.build_absolute_uri('/')[:-1]
+    key = f'vagas:ics:{feed_etag(request)}'
+    content = cache.get(key)
+
+    if content is None:
+        content = render_feed(base_url)
+        cache.set(key, content, settings.VAGAS_ROW_CACHE_TIMEOUT)
+
+    return HttpResponse(content, content_type='text/calendar; charset=utf-8')
@@ -0,0 +1,476 @@
+import codecs
+import csv
+import json
+import os
+from bisect import bisect_right, insort
+from datetime import timedelta
+from typing import BinaryIO, Iterator, Optional, TextIO
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from vagas.forms import CadastroVagasForm, validate_entrevista
+from vagas.models import ImportacaoVagas, Vaga, VagaDescricao
+
+FORMATS = ('csv', 'ndjson')
+
+# Columns read from the file: the fields of the registration form, validated by the same form fields.
+FIELDS = CadastroVagasForm.base_fields
+
+# Fields whose values are seldom the same in two rows, and not worth keeping once cleaned.
+UNREPEATED_FIELDS = ('cargo_descricao',)
+
+REQUIRED_FIELDS = tuple(name for name, field in FIELDS.items() if field.required)
+
+REPORT_HEADER = ('linha', 'campo', 'mensagem')
+
+class InvalidFile(Exception):
+    """Raised when the file to be imported cannot be read, as opposed to a row with invalid values."""
+
+class LineReader:
+    """
+    Iterator over the lines of a binary file, decoded as UTF-8, that counts the lines and bytes read.
+
+    The csv module reads a record one line at a time, so right after a record is returned the
+    position is the start of the next one, from which an interrupted import can resume.
+    """
+
+    def __init__(self, file: BinaryIO) -> None:
+        """
+        :param file: File opened in binary mode
+
+        :type file: BinaryIO
+        """
+        self.file = file
+        self.posicao = 0
+        self.linha = 0
+
+    def seek(self, posicao: int, linha: int) -> None:
+        """
+        Continue reading from the given position, which must be the start of a line.
+
+        :param posicao: Position in the file, in bytes
+
+        :type posicao: int
+
+        :param linha: Number of lines before that position
+
+        :type linha: int
+
+        :rtype: None
+        """
+        self.file.seek(posicao)
+        self.posicao = posicao
+        self.linha = linha
+
+    def __iter__(self) -> 'LineReader':
+        return self
+
+    def __next__(self) -> str:
+        line = self.file.readline()
+
+        if not line:
+            raise StopIteration
+
+        if self.posicao == 0 and line.startswith(codecs.BOM_UTF8):
+            line = line[len(codecs.BOM_UTF8):]
+            self.posicao = len(codecs.BOM_UTF8)
+
+        self.posicao += len(line)
+        self.linha += 1
+
+        try:
+            return line.decode('utf-8')
+        except UnicodeDecodeError:
+            raise InvalidFile(f'A linha {self.linha} não está codificada em UTF-8.')
+
+def read_csv(lines: LineReader, posicao: int, linha: int) -> Iterator[tuple]:
+    """
+    Return the rows of a CSV file whose first line names the columns, from the given position on.
+
+    :param lines: Lines of the file
+
+    :type lines: LineReader
+
+    :param posicao: Position of the first row to be read, or 0 to read every row
+
+    :type posicao: int
+
+    :param linha: Number of lines before that position
+
+    :type linha: int
+
+    :raises InvalidFile: If the header lacks a required column or the file is not valid CSV.
+
+    :rtype: Iterator[tuple]
+    """
+    reader = csv.reader(lines)
+
+    try:
+        header = [name.strip() for name in next(reader)]
+    except StopIteration:
+        return
+
+    missing = [name for name in REQUIRED_FIELDS if name not in header]
+
+    if missing:
+        raise InvalidFile(f"Colunas obrigatórias ausentes: {', '.join(missing)}.")
+
+    if posicao:
+        lines.seek(posicao, linha)
+
+    while True:
+        inicio = lines.linha + 1
+
+        try:
+            record = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            raise InvalidFile(f'A linha {inicio} não pôde ser lida: {e}.')
+
+        if not record:
+            continue
+
+        if len(record) != len(header):
+            yield inicio, None, f'A linha contém {len(record)} colunas, mas o cabeçalho contém {len(header)}.'
+        else:
+            yield inicio, dict(zip(header, record)), None
+
+def read_ndjson(lines: LineReader, posicao: int, linha: int) -> Iterator[tuple]:
+    """
+    Return the rows of a file with a JSON object per line, from the given position on.
+
+    :param lines: Lines of the file
+
+    :type lines: LineReader
+
+    :param posicao: Position of the first row to be read
+
+    :type posicao: int
+
+    :param linha: Number of lines before that position
+
+    :type linha: int
+
+    :rtype: Iterator[tuple]
+    """
+    lines.seek(posicao, linha)
+
+    for line in lines:
+        if not line.strip():
+            continue
+
+        try:
+            valores = json.loads(line)
+        except ValueError:
+            yield lines.linha, None, 'A linha não contém um JSON válido.'
+            continue
+
+        if isinstance(valores, dict):
+            yield lines.linha, valores, None
+        else:
+            yield lines.linha, None, 'A linha deve conter um objeto JSON.'
+
+READERS = {
+    'csv': read_csv,
+    'ndjson': read_ndjson,
+}
+
+def clean_row(valores: dict, cleaned_values: dict) -> tuple:
+    """
+    Return the values of a row cleaned by the fields of CadastroVagasForm, and the errors keyed by field.
+
+    Columns that are not fields of the form are ignored. Values repeat a lot across rows, such as
+    the site of a company or the reference site, so the result of cleaning each value is kept in
+    the given dictionary and reused for the next rows.
+
+    :param valores: Values of the row keyed by column
+
+    :type valores: dict
+
+    :param cleaned_values: Cleaned value or error messages keyed by field and value
+
+    :type cleaned_values: dict
+
+    :rtype: tuple
+    """
+    cleaned = {}
+    errors = {}
+
+    for name, field in FIELDS.items():
+        value = valores.get(name)
+
+        try:
+            result = cleaned_values.get((name, value))
+        except TypeError:
+            result = None
+
+        if result is None:
+            try:
+                result = (field.clean(value), None)
+            except ValidationError as e:
+                result = (None, e.messages)
+
+            if name not in UNREPEATED_FIELDS and isinstance(value, (str, int, float, bool)):
+                cleaned_values[(name, value)] = result
+
+        if result[1] is None:
+            cleaned[name] = result[0]
+        else:
+            errors[name] = list(result[1])
+
+    error = validate_entrevista(cleaned.get('situacao'), cleaned.get('data_hora_entrevista'))
+
+    if error is not None:
+        errors.setdefault('data_hora_entrevista', []).extend(error.messages)
+
+    return cleaned, errors
+
+def start_import(arquivo: str, restart: bool = False) -> ImportacaoVagas:
+    """
+    Return the progress of the import of a file, which starts from scratch for a new file or if restart is given.
+
+    :param arquivo: Path of the file
+
+    :type arquivo: str
+
+    :param restart: Whether previous progress is discarded
+
+    :type restart: bool
+
+    :raises InvalidFile: If the file was already fully imported and restart is not given.
+
+    :rtype: ImportacaoVagas
+    """
+    importacao, created = ImportacaoVagas.objects.get_or_create(arquivo=os.path.realpath(arquivo))
+
+    if restart and not created:
+        importacao.delete()
+        importacao = ImportacaoVagas.objects.create(arquivo=importacao.arquivo)
+    elif importacao.concluida:
+        raise InvalidFile('O arquivo já foi importado.')
+
+    return importacao
+
+def open_report(path: str, importacao: ImportacaoVagas) -> TextIO:
+    """
+    Open the error report of an import for appending, dropping the errors of rows that were not imported.
+
+    :param path: Path of the report, a CSV file
+
+    :type path: str
+
+    :param importacao: Progress of the import
+
+    :type importacao: ImportacaoVagas
+
+    :rtype: TextIO
+    """
+    if importacao.posicao_erros:
+        os.truncate(path, min(importacao.posicao_erros, os.path.getsize(path)))
+        return open(path, 'a', newline='', encoding='utf-8')
+
+    report = open(path, 'w', newline='', encoding='utf-8')
+    csv.writer(report).writerow(REPORT_HEADER)
+
+    return report
+
+class VagaImporter:
+    """
+    Import job opportunities from a CSV or NDJSON file, in batches.
+
+    Each row is validated with the rules of CadastroVagasForm: the fields of the form, the
+    interview datetime for the status, and overlaps with the scheduled interviews, both the ones
+    already saved and the ones of earlier rows of the batch. Valid rows are inserted with
+    bulk_create and invalid ones are written to the error report, one line per error. Every
+    batch is inserted in a transaction that also saves the progress of the import.
+    """
+
+    def __init__(self, file: BinaryIO, formato: str, importacao: ImportacaoVagas, report: TextIO, batch_size: int) -> None:
+        """
+        :param file: File to be imported, opened in binary mode
+
+        :type file: BinaryIO
+
+        :param formato: Format of the file, one of FORMATS
+
+        :type formato: str
+
+        :param importacao: Progress of the import, where it is resumed from
+
+        :type importacao: ImportacaoVagas
+
+        :param report: Error report, opened by open_report
+
+        :type report: TextIO
+
+        :param batch_size: Number of rows validated and inserted at a time
+
+        :type batch_size: int
+        """
+        self.lines = LineReader(file)
+        self.formato = formato
+        self.importacao = importacao
+        self.report = report
+        self.writer = csv.writer(report)
+        self.batch_size = batch_size
+        self.duracao = timedelta(minutes=settings.VAGAS_INTERVIEW_DURATION)
+
+    def run(self) -> Iterator[ImportacaoVagas]:
+        """
+        Import the rows not imported yet, returning the progress after each batch.
+
+        :raises InvalidFile: If the file cannot be read.
+
+        :rtype: Iterator[ImportacaoVagas]
+        """
+        rows = READERS[self.formato](self.lines, self.importacao.posicao, self.importacao.linha)
+        batch = []
+
+        for row in rows:
+            batch.append(row)
+
+            if len(batch) == self.batch_size:
+                self.import_batch(batch, concluida=False)
+                batch = []
+                yield self.importacao
+
+        self.import_batch(batch, concluida=True)
+        yield self.importacao
+
+    def import_batch(self, batch: list, concluida: bool) -> None:
+        """
+        Validate a batch of rows, insert the valid ones and report the errors of the others.
+
+        :param batch: Line number, values and error of each row, as returned by the readers
+
+        :type batch: list
+
+        :param concluida: Whether this is the last batch of the file
+
+        :type concluida: bool
+
+        :rtype: None
+        """
+        cleaned_values = {}
+        linhas = []
+        erros = []
+
+        for linha, valores, erro in batch:
+            if erro is None:
+                cleaned, errors = clean_row(valores, cleaned_values)
+                linhas.append((linha, cleaned, errors))
+            else:
+                erros.append((linha, '', erro))
+
+        agendadas = self.get_scheduled_interviews(
+            cleaned['data_hora_entrevista'] for linha, cleaned, errors in linhas
+            if not errors and cleaned['situacao'] == Vaga.Status.INTERVIEW_SCHEDULED
+        )
+        vagas = []
+
+        for linha, cleaned, errors in linhas:
+            if not errors and cleaned['situacao'] == Vaga.Status.INTERVIEW_SCHEDULED:
+                conflito = self.get_conflicting_interview(cleaned['data_hora_entrevista'], agendadas)
+
+                if conflito is not None:
+                    errors['data_hora_entrevista'] = conflito.interview_conflict_error().messages
+
+            if errors:
+                erros.extend((linha, campo, message) for campo, messages in errors.items() for message in messages)
+                continue
+
+            vaga = Vaga(**cleaned)
+            vagas.append(vaga)
+
+            if vaga.situacao == Vaga.Status.INTERVIEW_SCHEDULED:
+                insort(agendadas, (vaga.data_hora_entrevista, len(vagas), vaga))
+
+        erros.sort(key=lambda erro: erro[0])
+        self.writer.writerows(erros)
+        self.report.flush()
+
+        importacao = self.importacao
+        importacao.posicao = self.lines.posicao
+        importacao.linha = self.lines.linha
+        importacao.posicao_erros = os.fstat(self.report.fileno()).st_size
+        importacao.importadas += len(vagas)
+        importacao.rejeitadas += len({erro[0] for erro in erros})
+        importacao.concluida = concluida
+
+        with transaction.atomic():
+            self.insert(vagas)
+            importacao.save()
+
+    def insert(self, vagas: list) -> None:
+        """
+        Insert job opportunities along with their descriptions.
+
+        The primary keys are taken from the sequence beforehand so that the descriptions can be
+        inserted first, which the deferred foreign key allows: the search vector of each job
+        opportunity is then computed once, on its insertion, instead of being computed again for
+        every description inserted afterwards.
+
+        :param vagas: Unsaved job opportunities
+
+        :type vagas: list
+
+        :rtype: None
+        """
+        if not vagas:
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT nextval(pg_get_serial_sequence('vagas_vaga', 'id')) FROM generate_series(1, %s)", [len(vagas)])
+
+            for vaga, (pk,) in zip(vagas, cursor.fetchall()):
+                vaga.pk = pk
+
+        VagaDescricao.objects.bulk_create(vaga.descricao for vaga in vagas if vaga.cargo_descricao)
+        Vaga.objects.bulk_create(vagas)
+
+    def get_scheduled_interviews(self, datas_horas) -> list:
+        """
+        Return the saved scheduled interviews that may overlap the given ones, in chronological order.
+
+        :param datas_horas: Datetimes of the interviews
+
+        :type datas_horas: Iterable[datetime]
+
+        :rtype: list
+        """
+        datas_horas = list(datas_horas)
+
+        if not datas_horas:
+            return []
+
+        vagas = list(Vaga.objects.filter(
+            situacao=Vaga.Status.INTERVIEW_SCHEDULED,
+            data_hora_entrevista__gt=min(datas_horas) - self.duracao,
+            data_hora_entrevista__lt=max(datas_horas) + self.duracao,
+        ).only('empresa_nome', 'cargo_titulo', 'data_hora_entrevista').order_by('data_hora_entrevista', 'id'))
+
+        # Negative positions keep the saved interviews ahead of the rows of the batch at the same time.
+        return [(vaga.data_hora_entrevista, i - len(vagas), vaga) for i, vaga in enumerate(vagas)]
+
+    def get_conflicting_interview(self, data_hora_entrevista, agendadas: list) -> Optional[Vaga]:
+        """
+        Return the earliest scheduled interview overlapping the given one, if any.
+
+        :param data_hora_entrevista: Datetime of the interview
+
+        :type data_hora_entrevista: datetime
+
+        :param agendadas: Datetime, position and job opportunity of the scheduled interviews, in chronological order
+
+        :type agendadas: list
+
+        :rtype: Vaga or None
+        """
+        # The first interview that starts after the given one minus the duration.
+        i = bisect_right(agendadas, (data_hora_entrevista - self.duracao, float('inf')))
+
+        if i < len(agendadas) and agendadas[i][0] < data_hora_entrevista + self.duracao:
+            return agendadas[i][2]
+
+        return None
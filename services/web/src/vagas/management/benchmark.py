@@ -0,0 +1,58 @@
+from contextlib import contextmanager
+from datetime import timedelta
+from django.db import reset_queries, transaction
+from django.utils import timezone
+from vagas.models import Vaga, VagaDescricao
+
+def build_vaga(i: int) -> Vaga:
+    """
+    Return an unsaved job opportunity filled with sample data.
+
+    :param i: Sequence number of the sample
+
+    :type i: int
+
+    :rtype: Vaga
+    """
+    situacao = Vaga.Status.values[i % len(Vaga.Status.values)]
+    now = timezone.now()
+
+    return Vaga(
+        empresa_nome=f'Empresa {i}',
+        empresa_endereco=f'Rua {i}, {i % 1000}',
+        empresa_email=f'contato{i}@empresa.com.br',
+        empresa_site=f'https://empresa{i}.com.br',
+        empresa_telefone_celular=f'(11) 9{i % 10000:04d}-{i % 9999:04d}',
+        empresa_telefone_comercial=f'(11) {i % 10000:04d}-{i % 9999:04d}',
+        cargo_titulo=f'Cargo {i}',
+        cargo_descricao=f'Descrição do cargo {i}. ' * 20,
+        site_referencia='https://sitereferencia.com.br',
+        data_hora_entrevista=now + timedelta(hours=i % 500) if Vaga.Status.INTERVIEW_SCHEDULED == situacao else None,
+        situacao=situacao,
+    )
+
+@contextmanager
+def sample_vagas(count: int, batch_size: int = 10000):
+    """
+    Insert sample job opportunities inside a transaction that is rolled back on exit.
+
+    :param count: Number of job opportunities to insert
+
+    :type count: int
+
+    :param batch_size: Number of job opportunities inserted per query
+
+    :type batch_size: int
+    """
+    with transaction.atomic():
+        for start in range(0, count, batch_size):
+            vagas = Vaga.objects.bulk_create(build_vaga(i) for i in range(start, min(start + batch_size, count)))
+            # Unlike save(), bulk_create() leaves the descriptions held by the instances to be inserted.
+            VagaDescricao.objects.bulk_create(vaga.descricao for vaga in vagas)
+            # With DEBUG on, the logged insert statements would otherwise dominate the memory of the process.
+            reset_queries()
+
+        try:
+            yield
+        finally:
+            transaction.set_rollback(True)
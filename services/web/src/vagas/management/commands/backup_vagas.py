@@ -0,0 +1,36 @@
+import gzip
+from time import perf_counter
+from django.core.management.base import BaseCommand, CommandError
+from vagas.backup import dump
+
+class Command(BaseCommand):
+    help = (
+        'Write every job opportunity and its description to a gzip-compressed file, streamed from the database '
+        'with COPY, so that it can be brought back with restore_vagas.'
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('arquivo', help='File the backup is written to.')
+        parser.add_argument(
+            '--compress-level', type=int, default=6, choices=range(1, 10), metavar='{1-9}',
+            help='Compression level of the file, from the fastest to the smallest.',
+        )
+
+    def handle(self, *args, **options) -> None:
+        arquivo = options['arquivo']
+        start = perf_counter()
+
+        try:
+            file = gzip.open(arquivo, 'wb', compresslevel=options['compress_level'])
+        except OSError as e:
+            raise CommandError(f'{arquivo} could not be opened: {e.strerror}.')
+
+        with file:
+            linhas = dump(file)
+
+        elapsed = perf_counter() - start
+
+        for table, count in linhas.items():
+            self.stdout.write(f'{table}: {count} rows.')
+
+        self.stdout.write(f'Backup written to {arquivo} in {elapsed:.2f} s.')
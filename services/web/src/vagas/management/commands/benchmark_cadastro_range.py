@@ -0,0 +1,131 @@
+import re
+from datetime import timedelta
+from time import perf_counter
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.http import QueryDict
+from django.utils import timezone
+from vagas.filters import filter_vagas
+from vagas.models import Vaga
+
+# Indexes whose leading column is data_hora_cadastro, dropped in turn so that a single kind of index serves the queries.
+BTREE_INDEXES = ('vaga_listagem_idx', 'vaga_situacao_cadastro_idx')
+
+BRIN_INDEX = 'vaga_cadastro_brin_idx'
+
+# A plain B-tree on the same column, created only for the comparison.
+PLAIN_BTREE_INDEX = 'vaga_cadastro_benchmark_idx'
+
+INSERT_HISTORY = """
+INSERT INTO vagas_vaga (
+    empresa_nome, empresa_endereco, empresa_email, empresa_site, empresa_telefone_celular,
+    empresa_telefone_comercial, cargo_titulo, site_referencia, situacao,
+    data_hora_cadastro, data_hora_atualizacao
+)
+SELECT
+    'Empresa ' || i, 'Rua ' || i, 'contato' || i || '@empresa.com.br', 'https://empresa' || i || '.com.br',
+    '', '', 'Cargo ' || i, 'https://sitereferencia.com.br',
+    (ARRAY['C', 'W', 'S', 'R', 'A'])[1 + i %% 5],
+    %(now)s - (%(rows)s - i) * %(step)s, %(now)s
+FROM generate_series(1, %(rows)s) AS i
+"""
+
+class Command(BaseCommand):
+    help = (
+        'Compare the size and latency of the BRIN and B-tree indexes on data_hora_cadastro for date range filters. '
+        'Sample rows are inserted in registration order and, like the indexes dropped during the comparison, '
+        'rolled back at the end; the vagas_vaga table stays locked meanwhile, so run it on a development database.'
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--rows', type=int, default=1000000, help='Number of sample rows.')
+        parser.add_argument('--days', type=int, default=3 * 365, help='Number of days over which the rows were registered.')
+        parser.add_argument('--repeat', type=int, default=5, help='Number of runs of each query, of which the fastest is kept.')
+
+    def handle(self, *args, **options) -> None:
+        now = timezone.now()
+        today = timezone.localdate()
+        ranges = {
+            'last 7 days': (today - timedelta(days=6), today),
+            '30 days, a year ago': (today - timedelta(days=395), today - timedelta(days=366)),
+            'last 90 days': (today - timedelta(days=89), today),
+        }
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(INSERT_HISTORY, {
+                    'now': now,
+                    'rows': options['rows'],
+                    'step': timedelta(days=options['days']) / options['rows'],
+                })
+                cursor.execute(f'CREATE INDEX {PLAIN_BTREE_INDEX} ON vagas_vaga (data_hora_cadastro)')
+                cursor.execute('ANALYZE vagas_vaga')
+
+            self.stdout.write(f"Rows: {Vaga.objects.count()}")
+
+            for index in (BRIN_INDEX, PLAIN_BTREE_INDEX) + BTREE_INDEXES:
+                self.stdout.write(f'  Size of {index}: {self.index_size(index) / 2 ** 20:.2f} MiB')
+
+            variants = {
+                'BRIN': BTREE_INDEXES + (PLAIN_BTREE_INDEX,),
+                'plain B-tree': BTREE_INDEXES + (BRIN_INDEX,),
+                'schema indexes': (PLAIN_BTREE_INDEX,),
+            }
+
+            for variant, dropped in variants.items():
+                self.stdout.write(f'{variant}:')
+
+                with transaction.atomic():
+                    with connection.cursor() as cursor:
+                        for index in dropped:
+                            cursor.execute(f'DROP INDEX {index}')
+
+                    for name, (inicio, fim) in ranges.items():
+                        vagas = filter_vagas(QueryDict(f'data_cadastro_inicio={inicio}&data_cadastro_fim={fim}'))
+                        self.measure(f'{name}, first page', vagas.only(*Vaga.LISTING_FIELDS).order_by('-data_hora_cadastro', '-id')[:50], options['repeat'])
+                        self.measure(f'{name}, count', vagas.values('pk'), options['repeat'], count=True)
+
+                    transaction.set_rollback(True)
+
+            transaction.set_rollback(True)
+
+    def index_size(self, index: str) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_relation_size(%s::regclass)', [index])
+
+            return cursor.fetchone()[0]
+
+    def measure(self, name: str, queryset, repeat: int, count: bool = False) -> None:
+        """
+        Print the fastest run of the query, along with its plan and the number of buffers it touched.
+
+        :param count: Whether the rows of the query are counted instead of fetched
+
+        :type count: bool
+
+        :rtype: None
+        """
+        sql, params = queryset.query.sql_with_params()
+
+        if count:
+            sql = f'SELECT COUNT(*) FROM ({sql}) AS vagas'
+
+        timings = []
+
+        with connection.cursor() as cursor:
+            for _ in range(repeat):
+                start = perf_counter()
+                cursor.execute(sql, params)
+                cursor.fetchall()
+                timings.append(perf_counter() - start)
+
+            cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS, FORMAT TEXT) {sql}', params)
+            plan = '\n'.join(row[0] for row in cursor.fetchall())
+
+        scans = sorted(set(re.findall(r'((?:Bitmap Index|Index Only|Index|Seq) Scan)(?: Backward)?(?: using| on) (\w+)', plan)))
+        buffers = re.search(r'Buffers: shared ((?:hit|read)=\d+(?: read=\d+)?)', plan)
+        self.stdout.write(
+            f"  {name}: {min(timings) * 1000:.1f} ms, "
+            f"{', '.join(f'{scan} {index}' for scan, index in scans)}, "
+            f"buffers {buffers.group(1) if buffers else '-'}"
+        )
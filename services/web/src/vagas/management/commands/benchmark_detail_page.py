@@ -0,0 +1,94 @@
+from time import perf_counter
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from vagas.caching import detail_cache_key, render_detail, store_detail
+from vagas.models import Vaga, VagaDescricao
+
+# A paragraph of a pasted job posting, with the links and lists such postings usually carry.
+PARAGRAPH = (
+    'Sobre a vaga {i}: buscamos uma pessoa desenvolvedora para atuar em um time de produto, '
+    'com foco em qualidade, testes automatizados e entregas contínuas. Saiba mais em '
+    'https://empresa.com.br/carreiras/vaga-{i} ou escreva para vagas{i}@empresa.com.br.\n'
+    '- Experiência com Python e Django\n'
+    '- Conhecimento de PostgreSQL\n'
+    '- Inglês intermediário\n\n'
+)
+
+def build_descricao(size: int) -> str:
+    """
+    Return a sample description of about the given size, in bytes.
+
+    :param size: Size of the description
+
+    :type size: int
+
+    :rtype: str
+    """
+    paragraphs = []
+    length = 0
+    i = 0
+
+    while length < size:
+        paragraphs.append(PARAGRAPH.format(i=i))
+        length += len(paragraphs[-1].encode())
+        i += 1
+
+    return ''.join(paragraphs)
+
+class Command(BaseCommand):
+    help = (
+        'Compare the time spent on the detail card of job opportunities with long descriptions when it is '
+        'rendered on every view, as before, and when it is served from the cache filled on save.'
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--vagas', type=int, default=200, help='Number of job opportunities to show.')
+        parser.add_argument('--size', type=int, default=50 * 1024, help='Size of each description, in bytes.')
+        parser.add_argument('--repeat', type=int, default=3, help='Number of runs of each variant, of which the fastest is kept.')
+
+    def handle(self, *args, **options) -> None:
+        now = timezone.now()
+        descricao = build_descricao(options['size'])
+        # Unsaved instances keep the database out of the measurement, and their primary keys are far
+        # beyond any real row so the benchmark never touches real cache entries.
+        vagas = []
+
+        for i in range(1, options['vagas'] + 1):
+            vaga = Vaga(
+                pk=10 ** 15 + i,
+                empresa_nome=f'Empresa {i}',
+                empresa_email=f'contato{i}@empresa.com.br',
+                empresa_site=f'https://empresa{i}.com.br',
+                cargo_titulo=f'Cargo {i}',
+                site_referencia='https://sitereferencia.com.br',
+                situacao=Vaga.Status.WAITING,
+                data_hora_cadastro=now,
+                data_hora_atualizacao=now,
+            )
+            vaga.descricao = VagaDescricao(cargo_descricao=descricao)
+            vagas.append(vaga)
+
+        keys = [detail_cache_key(vaga.pk, vaga.data_hora_atualizacao) for vaga in vagas]
+
+        try:
+            rendered = self.measure(lambda: [store_detail(vaga) for vaga in vagas], options['repeat'])
+            cached = self.measure(lambda: [render_detail(vaga) for vaga in vagas], options['repeat'])
+        finally:
+            cache.delete_many(keys)
+
+        count = len(vagas)
+        self.stdout.write(f'Job opportunities: {count}, descriptions of {len(descricao.encode()) / 1024:.1f} KiB')
+        self.stdout.write(f'Rendered on every view: {rendered * 1000 / count:.2f} ms per view')
+        self.stdout.write(f'Served from the cache: {cached * 1000 / count:.2f} ms per view')
+        self.stdout.write(f'Speedup: {rendered / cached:.1f}x')
+
+    def measure(self, function, repeat: int) -> float:
+        best = float('inf')
+
+        for _ in range(repeat):
+            start = perf_counter()
+            function()
+            best = min(best, perf_counter() - start)
+
+        return best
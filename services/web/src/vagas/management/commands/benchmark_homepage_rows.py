@@ -0,0 +1,53 @@
+from time import perf_counter
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from vagas.caching import render_rows, row_cache_key
+from vagas.models import Vaga
+
+class Command(BaseCommand):
+    help = 'Compare the time spent rendering homepage rows with a cold and a warm row cache.'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--rows', type=int, default=10000, help='Number of rows to render.')
+        parser.add_argument('--repeat', type=int, default=3, help='Number of warm renders to average.')
+
+    def handle(self, *args, **options) -> None:
+        now = timezone.now()
+        # Unsaved instances are enough to exercise the template, and keep the database out of the measurement.
+        # Their primary keys are far beyond any real row so the benchmark never touches real cache entries.
+        vagas = [
+            Vaga(
+                pk=10 ** 15 + i,
+                empresa_nome=f'Empresa {i}',
+                empresa_site=f'https://empresa{i}.com.br',
+                cargo_titulo=f'Cargo {i}',
+                situacao=Vaga.Status.values[i % len(Vaga.Status.values)],
+                data_hora_entrevista=now if i % 3 else None,
+                data_hora_cadastro=now,
+                data_hora_atualizacao=now,
+            )
+            for i in range(1, options['rows'] + 1)
+        ]
+        keys = [row_cache_key(vaga.pk, vaga.data_hora_atualizacao) for vaga in vagas]
+        cache.delete_many(keys)
+
+        try:
+            start = perf_counter()
+            render_rows(vagas)
+            cold = perf_counter() - start
+
+            warm = []
+
+            for _ in range(options['repeat']):
+                start = perf_counter()
+                render_rows(vagas)
+                warm.append(perf_counter() - start)
+        finally:
+            cache.delete_many(keys)
+
+        warm = sum(warm) / len(warm)
+        self.stdout.write(f'Rows: {len(vagas)}')
+        self.stdout.write(f'Cold cache: {cold * 1000:.1f} ms')
+        self.stdout.write(f'Warm cache: {warm * 1000:.1f} ms')
+        self.stdout.write(f'Speedup: {cold / warm:.1f}x')
@@ -0,0 +1,51 @@
+from time import perf_counter
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from vagas.management.benchmark import sample_vagas
+from vagas.views import index
+
+def current_rss() -> int:
+    """
+    Return the resident set size of the current process, in bytes.
+
+    :rtype: int
+    """
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) * 1024
+
+    return 0
+
+class Command(BaseCommand):
+    help = 'Measure time to first byte and memory used by the homepage when it streams every job opportunity.'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--rows', type=int, nargs='+', default=[100000, 1000000], help='Numbers of rows to stream.')
+
+    def handle(self, *args, **options) -> None:
+        for rows in sorted(options['rows']):
+            with sample_vagas(rows):
+                self.stream(rows)
+
+    def stream(self, rows: int) -> None:
+        request = RequestFactory().get('/', {'exibir': 'todas'})
+        rss_before = peak_rss = current_rss()
+        start = perf_counter()
+        response = index(request)
+        content = iter(response.streaming_content)
+        size = len(next(content))
+        first_byte = perf_counter() - start
+
+        for chunk in content:
+            size += len(chunk)
+            peak_rss = max(peak_rss, current_rss())
+
+        elapsed = perf_counter() - start
+
+        self.stdout.write(f'Rows: {rows}')
+        self.stdout.write(f'  Time to first byte: {first_byte * 1000:.1f} ms')
+        self.stdout.write(f'  Total time: {elapsed:.1f} s')
+        self.stdout.write(f'  Bytes sent: {size / 2 ** 20:.1f} MiB')
+        self.stdout.write(f'  RSS before streaming: {rss_before / 2 ** 20:.1f} MiB')
+        self.stdout.write(f'  Peak RSS while streaming: {peak_rss / 2 ** 20:.1f} MiB')
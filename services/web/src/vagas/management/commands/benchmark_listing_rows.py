@@ -0,0 +1,92 @@
+import tracemalloc
+from time import perf_counter
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.template.loader import get_template
+from django.utils import timezone
+from vagas.caching import ROW_TEMPLATE
+from vagas.models import Vaga
+from vagas.rows import listing_rows
+
+INSERT_ROWS = """
+INSERT INTO vagas_vaga (
+    empresa_nome, empresa_endereco, empresa_email, empresa_site, empresa_telefone_celular,
+    empresa_telefone_comercial, cargo_titulo, site_referencia, situacao,
+    data_hora_cadastro, data_hora_atualizacao, data_hora_entrevista
+)
+SELECT
+    'Empresa ' || i, 'Rua ' || i, 'contato' || i || '@empresa.com.br', 'https://empresa' || i || '.com.br',
+    '11987654321', '1133334444', 'Cargo ' || i, 'https://sitereferencia.com.br',
+    (ARRAY['C', 'W', 'S', 'R', 'A'])[1 + i %% 5], %(now)s, %(now)s,
+    CASE WHEN i %% 5 = 2 THEN %(now)s END
+FROM generate_series(1, %(rows)s) AS i
+"""
+
+class Command(BaseCommand):
+    help = (
+        'Compare the time and memory spent reading and rendering homepage rows as Vaga instances and as VagaRow '
+        'objects, without the row cache. Sample rows are inserted and rolled back at the end, so run it on a '
+        'development database.'
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--rows', type=int, default=10000, help='Number of rows to read and render.')
+        parser.add_argument('--repeat', type=int, default=5, help='Number of runs of each variant, of which the fastest is kept.')
+
+    def handle(self, *args, **options) -> None:
+        template = get_template(ROW_TEMPLATE)
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(INSERT_ROWS, {'now': timezone.now(), 'rows': options['rows']})
+                cursor.execute('ANALYZE vagas_vaga')
+
+            vagas = Vaga.objects.order_by('-data_hora_cadastro', '-id')[:options['rows']]
+            variants = {
+                'Vaga instances': vagas.only(*Vaga.LISTING_FIELDS),
+                'Vaga instances, all columns': vagas,
+                'VagaRow objects': listing_rows(vagas),
+            }
+
+            self.stdout.write(f"Rows: {options['rows']}")
+
+            for name, queryset in variants.items():
+                fetch, render = self.measure(queryset, template, options['repeat'])
+                blocks, size = self.allocations(queryset)
+                self.stdout.write(
+                    f'{name}: fetch {fetch * 1000:.1f} ms, render {render * 1000:.1f} ms, '
+                    f'{blocks} blocks / {size / 2 ** 20:.1f} MiB held by the fetched rows'
+                )
+
+            transaction.set_rollback(True)
+
+    def measure(self, queryset, template, repeat: int) -> tuple:
+        fetch = render = float('inf')
+
+        for _ in range(repeat):
+            start = perf_counter()
+            rows = list(queryset.all())
+            fetched = perf_counter()
+
+            for row in rows:
+                template.render({'vaga': row})
+
+            fetch = min(fetch, fetched - start)
+            render = min(render, perf_counter() - fetched)
+
+        return fetch, render
+
+    def allocations(self, queryset) -> tuple:
+        """Return the number of memory blocks and bytes still allocated by the fetched rows."""
+        tracemalloc.start()
+
+        try:
+            before = tracemalloc.take_snapshot()
+            rows = list(queryset.all())
+            stats = tracemalloc.take_snapshot().compare_to(before, 'filename')
+        finally:
+            tracemalloc.stop()
+
+        del rows
+
+        return sum(stat.count_diff for stat in stats), sum(stat.size_diff for stat in stats)
@@ -0,0 +1,87 @@
+import json
+from time import perf_counter
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from vagas.models import Vaga
+
+LISTING_COLUMNS = ', '.join(('id',) + Vaga.LISTING_FIELDS)
+
+# The first page of the homepage, as served by vaga_listagem_idx.
+FIRST_PAGE = f'SELECT {LISTING_COLUMNS} FROM vagas_vaga ORDER BY data_hora_cadastro DESC, id DESC LIMIT 50'
+
+# The first page of a search, whose rows are filtered by reading them from the table.
+SEARCH_PAGE = (
+    f"SELECT {LISTING_COLUMNS} FROM vagas_vaga WHERE busca @@ websearch_to_tsquery('portuguese', 'desenvolvedor') "
+    'ORDER BY data_hora_cadastro DESC, id DESC LIMIT 50'
+)
+
+# Every row of the listing read from the table itself, as any filter the indexes cannot serve does.
+FULL_SCAN = f'SELECT {LISTING_COLUMNS} FROM vagas_vaga'
+
+class Command(BaseCommand):
+    help = (
+        'Report the storage of the vagas_vaga table as it is: size, rows per page, average row width, '
+        'and the time and pages read to list the homepage columns. Nothing is written, so it can be run '
+        'before and after a migration on the same data to compare both layouts.'
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--repeat', type=int, default=5, help='Number of runs of each query, of which the fastest is kept.')
+
+    def handle(self, *args, **options) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT count(*), pg_relation_size('vagas_vaga'), pg_total_relation_size('vagas_vaga'),
+                    current_setting('block_size')::int
+                FROM vagas_vaga
+            """)
+            rows, heap_size, total_size, block_size = cursor.fetchone()
+            cursor.execute("""
+                SELECT indexrelid::regclass::text, pg_relation_size(indexrelid)
+                FROM pg_index WHERE indrelid = 'vagas_vaga'::regclass ORDER BY 1
+            """)
+            indexes = cursor.fetchall()
+            cursor.execute('SELECT avg(pg_column_size(vaga.*)) FROM vagas_vaga AS vaga')
+            [width] = cursor.fetchone()
+            columns = ', '.join(f'avg(pg_column_size({name}))' for name in LISTING_COLUMNS.split(', '))
+            cursor.execute(f'SELECT {columns} FROM vagas_vaga')
+            listing_width = sum(value or 0 for value in cursor.fetchone())
+
+        pages = heap_size // block_size
+        self.stdout.write(f'Rows: {rows}')
+        self.stdout.write(f'Heap: {heap_size / 2 ** 20:.1f} MiB in {pages} pages, {rows / max(pages, 1):.1f} rows per page')
+        self.stdout.write(f'Heap, TOAST and indexes: {total_size / 2 ** 20:.1f} MiB')
+
+        for index, size in indexes:
+            self.stdout.write(f'  {index}: {size / 2 ** 20:.1f} MiB')
+
+        self.stdout.write(f'Average row: {width or 0:.1f} bytes, of which {listing_width:.1f} in the listing columns')
+        self.measure('First page', FIRST_PAGE, options['repeat'])
+        self.measure('Search page', SEARCH_PAGE, options['repeat'])
+        self.measure('Full scan', FULL_SCAN, options['repeat'], force_seqscan=True)
+
+    def measure(self, name: str, sql: str, repeat: int, force_seqscan: bool = False) -> None:
+        best = None
+
+        for _ in range(repeat):
+            with transaction.atomic(), connection.cursor() as cursor:
+                if force_seqscan:
+                    cursor.execute('SET LOCAL enable_indexscan = off')
+                    cursor.execute('SET LOCAL enable_indexonlyscan = off')
+                    cursor.execute('SET LOCAL enable_bitmapscan = off')
+
+                start = perf_counter()
+                cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}')
+                elapsed = perf_counter() - start
+                [[plan]] = cursor.fetchone()
+
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+
+            buffers = plan['Plan'].get('Shared Hit Blocks', 0) + plan['Plan'].get('Shared Read Blocks', 0)
+
+            if best is None or elapsed < best[0]:
+                best = (elapsed, buffers, plan['Plan']['Node Type'])
+
+        elapsed, buffers, node = best
+        self.stdout.write(f'{name}: {elapsed * 1000:.1f} ms, {buffers} pages / {buffers * 8 / 1024:.1f} MiB read ({node})')
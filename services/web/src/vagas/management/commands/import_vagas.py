@@ -0,0 +1,77 @@
+import os
+from time import perf_counter
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from vagas.importing import FORMATS, InvalidFile, VagaImporter, open_report, start_import
+
+class Command(BaseCommand):
+    help = (
+        'Import job opportunities from a CSV file with a header row or from an NDJSON file, whose columns are the '
+        'fields of the registration form. Rows are validated like the form, invalid ones are written to an error '
+        'report, and an interrupted import resumes where it stopped when run again with the same file.'
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('arquivo', help='File to be imported.')
+        parser.add_argument(
+            '--format', choices=FORMATS,
+            help='Format of the file. By default, taken from its extension: .csv, or .ndjson / .jsonl.',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=settings.VAGAS_IMPORT_BATCH_SIZE,
+            help='Number of rows validated and inserted in each transaction.',
+        )
+        parser.add_argument('--errors', help='Path of the error report. By default, the file name followed by .erros.csv.')
+        parser.add_argument('--restart', action='store_true', help='Import the file from the start, discarding previous progress.')
+
+    def handle(self, *args, **options) -> None:
+        arquivo = options['arquivo']
+        formato = options['format'] or self.guess_format(arquivo)
+        errors = options['errors'] or f'{arquivo}.erros.csv'
+
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be positive.')
+
+        try:
+            file = open(arquivo, 'rb')
+        except OSError as e:
+            raise CommandError(f'{arquivo} could not be opened: {e.strerror}.')
+
+        start = perf_counter()
+
+        try:
+            with file:
+                importacao = start_import(arquivo, options['restart'])
+                importadas, rejeitadas = importacao.importadas, importacao.rejeitadas
+
+                if importacao.linha:
+                    self.stdout.write(f'Resuming after line {importacao.linha}.')
+
+                with open_report(errors, importacao) as report:
+                    for importacao in VagaImporter(file, formato, importacao, report, options['batch_size']).run():
+                        if options['verbosity'] >= 2:
+                            self.stdout.write(f'Line {importacao.linha}: {importacao.importadas} imported, {importacao.rejeitadas} rejected.')
+        except InvalidFile as e:
+            raise CommandError(str(e))
+
+        elapsed = perf_counter() - start
+        importadas = importacao.importadas - importadas
+        rejeitadas = importacao.rejeitadas - rejeitadas
+        self.stdout.write(
+            f'Imported {importadas} job opportunities and rejected {rejeitadas} rows in {elapsed:.2f} s '
+            f'({(importadas + rejeitadas) / elapsed:.0f} rows/s).'
+        )
+
+        if importacao.rejeitadas:
+            self.stdout.write(f'Errors were written to {errors}.')
+
+    def guess_format(self, arquivo: str) -> str:
+        extension = os.path.splitext(arquivo)[1].lower()
+
+        if extension == '.csv':
+            return 'csv'
+
+        if extension in ('.ndjson', '.jsonl'):
+            return 'ndjson'
+
+        raise CommandError('The format of the file could not be told from its extension; use --format.')
@@ -0,0 +1,50 @@
+import gzip
+import zlib
+from time import perf_counter
+from django.core.management.base import BaseCommand, CommandError
+from vagas.backup import InvalidBackup, restore, verify
+
+class Command(BaseCommand):
+    help = (
+        'Restore the job opportunities and their descriptions from a file written by backup_vagas, streamed into '
+        'the database with COPY in a single transaction. The primary key sequence and the status counters are '
+        'updated afterwards.'
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('arquivo', help='File written by backup_vagas.')
+        parser.add_argument(
+            '--replace', action='store_true',
+            help='Remove the current job opportunities, along with their descriptions and reminders, before restoring.',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Only check the file, without writing to the database.')
+
+    def handle(self, *args, **options) -> None:
+        arquivo = options['arquivo']
+        start = perf_counter()
+
+        try:
+            file = gzip.open(arquivo, 'rb')
+        except OSError as e:
+            raise CommandError(f'{arquivo} could not be opened: {e.strerror}.')
+
+        try:
+            with file:
+                if options['dry_run']:
+                    linhas = verify(file)
+                else:
+                    linhas = restore(file, options['replace'])
+        except InvalidBackup as e:
+            raise CommandError(str(e))
+        except (EOFError, OSError, zlib.error) as e:
+            raise CommandError(f'{arquivo} is not a valid gzip file: {e}')
+
+        elapsed = perf_counter() - start
+
+        for table, count in linhas.items():
+            self.stdout.write(f'{table}: {count} rows.')
+
+        if options['dry_run']:
+            self.stdout.write(f'{arquivo} is a valid backup, checked in {elapsed:.2f} s. Nothing was written.')
+        else:
+            self.stdout.write(f'Backup restored from {arquivo} in {elapsed:.2f} s.')
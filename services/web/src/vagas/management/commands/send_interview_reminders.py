@@ -0,0 +1,110 @@
+import logging
+import time
+from datetime import timedelta
+from typing import Optional
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections, connection
+from django.utils import timezone
+from vagas.reminders import ReminderScheduler
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = (
+        'Send an email reminder to the active users some hours before each scheduled interview. '
+        'Runs until interrupted, unless --once is given.'
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--hours', type=float, default=settings.VAGAS_REMINDER_HOURS,
+            help='How many hours before the interview the reminder is sent.',
+        )
+        parser.add_argument(
+            '--poll-interval', type=float, default=settings.VAGAS_REMINDER_POLL_INTERVAL,
+            help='Seconds between polls for new and updated job opportunities.',
+        )
+        parser.add_argument('--once', action='store_true', help='Send the reminders already due and exit.')
+
+    def handle(self, *args, **options) -> None:
+        intervalo = options['poll_interval']
+        scheduler = ReminderScheduler(timedelta(hours=options['hours']), timedelta(seconds=intervalo))
+        self.carregado = False
+
+        try:
+            while True:
+                self.close_old_connections()
+
+                try:
+                    espera = self.run_once(scheduler, intervalo, options['once'])
+                except DatabaseError:
+                    if options['once']:
+                        raise
+
+                    # The database may be restarting or have dropped an idle connection, so the
+                    # iteration is tried again on a new connection.
+                    logger.exception('Could not read the scheduled interviews. Trying again in %s seconds.', intervalo)
+                    self.close_old_connections()
+                    espera = intervalo
+
+                if espera is None:
+                    break
+
+                time.sleep(espera)
+        except KeyboardInterrupt:
+            pass
+
+    def close_old_connections(self) -> None:
+        """
+        Drop the database connection if it broke or outlived CONN_MAX_AGE, as is done around each request.
+
+        Within an enclosing transaction, as when called by a test, the connection is kept.
+
+        :rtype: None
+        """
+        if not connection.in_atomic_block:
+            close_old_connections()
+
+    def run_once(self, scheduler: ReminderScheduler, intervalo: float, once: bool) -> Optional[float]:
+        """
+        Follow the job opportunities updated since the previous iteration and send the reminders due.
+
+        The upcoming interviews are loaded by the first iteration that succeeds.
+
+        :param scheduler: Scheduler of the reminders
+
+        :type scheduler: ReminderScheduler
+
+        :param intervalo: Seconds between polls
+
+        :type intervalo: float
+
+        :param once: Whether the command exits after this iteration
+
+        :type once: bool
+
+        :return: Seconds to wait before the next iteration, or None if there is none
+
+        :rtype: float or None
+        """
+        now = timezone.now()
+
+        if self.carregado:
+            scheduler.poll(now)
+        else:
+            scheduler.load(now)
+            self.carregado = True
+
+        for vaga in scheduler.run_due(now):
+            self.stdout.write(f'Reminder sent for the interview of job opportunity {vaga.pk} ({vaga}).')
+
+        if once:
+            return None
+
+        next_due = scheduler.next_due()
+
+        if next_due is None:
+            return intervalo
+
+        return max(0, min(intervalo, (next_due - now).total_seconds()))
@@ -0,0 +1,28 @@
+from time import perf_counter
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from vagas.digest import build_digest, send_digest
+
+class Command(BaseCommand):
+    help = (
+        'Email every active user a digest of the job opportunities: registrations and updates of the period, '
+        'upcoming interviews and open applications without updates for a while.'
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--days', type=int, default=7, help='Number of days summarized.')
+        parser.add_argument(
+            '--stale-days', type=int, default=settings.VAGAS_DIGEST_STALE_DAYS,
+            help='Days without updates after which an open application is reported as stale.',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=settings.VAGAS_DIGEST_BATCH_SIZE,
+            help='Number of messages sent at a time.',
+        )
+
+    def handle(self, *args, **options) -> None:
+        start = perf_counter()
+        digest = build_digest(timezone.now(), options['days'], options['stale_days'])
+        enviadas = send_digest(digest, options['batch_size'])
+        self.stdout.write(f'Digest sent to {enviadas} users in {perf_counter() - start:.2f} s.')
@@ -0,0 +1,24 @@
+# Generated by Django 4.0.2 on 2026-10-18 12:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('vagas', '0012_alter_vaga_situacao'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='vaga',
+            index=models.Index(fields=['situacao', 'data_hora_cadastro', 'id'], name='vaga_situacao_cadastro_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='vaga',
+            index=models.Index(fields=['data_hora_cadastro', 'id'], include=['situacao', 'empresa_nome', 'empresa_site', 'cargo_titulo', 'data_hora_entrevista'], name='vaga_cadastro_listagem_idx'),
+        ),
+    ]
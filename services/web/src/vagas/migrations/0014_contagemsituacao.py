@@ -0,0 +1,74 @@
+# Generated by Django 4.0.2 on 2026-10-18 12:30
+
+from django.db import migrations, models
+
+
+CREATE_TRIGGERS = """
+CREATE FUNCTION vagas_contagem_situacao() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE vagas_contagemsituacao SET total = total - 1 WHERE situacao = OLD.situacao;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO vagas_contagemsituacao (situacao, total) VALUES (NEW.situacao, 1)
+        ON CONFLICT (situacao) DO UPDATE SET total = vagas_contagemsituacao.total + 1;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION vagas_contagem_situacao_truncate() RETURNS trigger AS $$
+BEGIN
+    UPDATE vagas_contagemsituacao SET total = 0;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER vagas_contagem_situacao_insert_delete
+AFTER INSERT OR DELETE ON vagas_vaga
+FOR EACH ROW EXECUTE FUNCTION vagas_contagem_situacao();
+
+CREATE TRIGGER vagas_contagem_situacao_update
+AFTER UPDATE OF situacao ON vagas_vaga
+FOR EACH ROW WHEN (OLD.situacao IS DISTINCT FROM NEW.situacao)
+EXECUTE FUNCTION vagas_contagem_situacao();
+
+CREATE TRIGGER vagas_contagem_situacao_truncate
+AFTER TRUNCATE ON vagas_vaga
+FOR EACH STATEMENT EXECUTE FUNCTION vagas_contagem_situacao_truncate();
+
+-- Block writes while the counters are seeded, so that no change slips in between the count and the triggers.
+LOCK TABLE vagas_vaga IN SHARE MODE;
+
+INSERT INTO vagas_contagemsituacao (situacao, total)
+SELECT situacao, COUNT(*) FROM vagas_vaga GROUP BY situacao;
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER vagas_contagem_situacao_truncate ON vagas_vaga;
+DROP TRIGGER vagas_contagem_situacao_update ON vagas_vaga;
+DROP TRIGGER vagas_contagem_situacao_insert_delete ON vagas_vaga;
+DROP FUNCTION vagas_contagem_situacao_truncate();
+DROP FUNCTION vagas_contagem_situacao();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vagas', '0013_vaga_listagem_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContagemSituacao',
+            fields=[
+                ('situacao', models.CharField(choices=[('C', 'Candidatado'), ('W', 'Aguardando retorno'), ('S', 'Entrevista agendada'), ('R', 'Rejeitado'), ('A', 'Aprovado')], max_length=1, primary_key=True, serialize=False)),
+                ('total', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.0.2 on 2026-10-18 13:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('vagas', '0014_contagemsituacao'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='vaga',
+            index=models.Index(fields=['data_hora_cadastro', 'id'], include=['situacao', 'empresa_nome', 'empresa_site', 'cargo_titulo', 'data_hora_entrevista', 'data_hora_atualizacao'], name='vaga_listagem_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='vaga',
+            name='vaga_cadastro_listagem_idx',
+        ),
+    ]
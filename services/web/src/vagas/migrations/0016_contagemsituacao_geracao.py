@@ -0,0 +1,70 @@
+# Generated by Django 4.0.2 on 2026-10-18 13:30
+
+from django.db import migrations, models
+
+
+REPLACE_FUNCTIONS = """
+CREATE OR REPLACE FUNCTION vagas_contagem_situacao() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE vagas_contagemsituacao SET total = total - 1, geracao = geracao + 1 WHERE situacao = OLD.situacao;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO vagas_contagemsituacao (situacao, total, geracao) VALUES (NEW.situacao, 1, 0)
+        ON CONFLICT (situacao) DO UPDATE SET total = vagas_contagemsituacao.total + 1;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION vagas_contagem_situacao_truncate() RETURNS trigger AS $$
+BEGIN
+    UPDATE vagas_contagemsituacao SET total = 0, geracao = geracao + 1;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+RESTORE_FUNCTIONS = """
+CREATE OR REPLACE FUNCTION vagas_contagem_situacao() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE vagas_contagemsituacao SET total = total - 1 WHERE situacao = OLD.situacao;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO vagas_contagemsituacao (situacao, total) VALUES (NEW.situacao, 1)
+        ON CONFLICT (situacao) DO UPDATE SET total = vagas_contagemsituacao.total + 1;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION vagas_contagem_situacao_truncate() RETURNS trigger AS $$
+BEGIN
+    UPDATE vagas_contagemsituacao SET total = 0;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vagas', '0015_vaga_listagem_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contagemsituacao',
+            name='geracao',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunSQL(REPLACE_FUNCTIONS, RESTORE_FUNCTIONS),
+    ]
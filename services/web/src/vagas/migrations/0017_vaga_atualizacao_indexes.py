@@ -0,0 +1,24 @@
+# Generated by Django 4.0.2 on 2026-10-18 13:30
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('vagas', '0016_contagemsituacao_geracao'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='vaga',
+            index=models.Index(fields=['situacao', 'data_hora_atualizacao'], name='vaga_situacao_atualizacao_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='vaga',
+            index=models.Index(fields=['data_hora_atualizacao'], name='vaga_atualizacao_idx'),
+        ),
+    ]
@@ -0,0 +1,117 @@
+# Generated by Django 4.0.2 on 2026-10-18 14:00
+
+from django.db import migrations
+
+
+# Each statement applies its changes to the counters at once, in a fixed order of status, so that
+# bulk writes update each counter row a single time instead of once per written row.
+APPLY_DELTAS = """
+ORDER BY situacao
+ON CONFLICT (situacao) DO UPDATE SET
+    total = vagas_contagemsituacao.total + EXCLUDED.total,
+    geracao = vagas_contagemsituacao.geracao + EXCLUDED.geracao;
+"""
+
+CREATE_STATEMENT_TRIGGERS = f"""
+DROP TRIGGER vagas_contagem_situacao_update ON vagas_vaga;
+DROP TRIGGER vagas_contagem_situacao_insert_delete ON vagas_vaga;
+DROP FUNCTION vagas_contagem_situacao();
+
+CREATE FUNCTION vagas_contagem_situacao_insert() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO vagas_contagemsituacao (situacao, total, geracao)
+    SELECT situacao, COUNT(*), 0 FROM novas GROUP BY situacao
+    {APPLY_DELTAS}
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION vagas_contagem_situacao_delete() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO vagas_contagemsituacao (situacao, total, geracao)
+    SELECT situacao, -COUNT(*), 1 FROM antigas GROUP BY situacao
+    {APPLY_DELTAS}
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION vagas_contagem_situacao_update() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO vagas_contagemsituacao (situacao, total, geracao)
+    SELECT situacao, SUM(delta), MAX(saida) FROM (
+        SELECT antigas.situacao, -1 AS delta, 1 AS saida
+        FROM antigas JOIN novas ON novas.id = antigas.id
+        WHERE antigas.situacao IS DISTINCT FROM novas.situacao
+        UNION ALL
+        SELECT novas.situacao, 1 AS delta, 0 AS saida
+        FROM antigas JOIN novas ON novas.id = antigas.id
+        WHERE antigas.situacao IS DISTINCT FROM novas.situacao
+    ) AS mudancas
+    GROUP BY situacao
+    {APPLY_DELTAS}
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER vagas_contagem_situacao_insert
+AFTER INSERT ON vagas_vaga
+REFERENCING NEW TABLE AS novas
+FOR EACH STATEMENT EXECUTE FUNCTION vagas_contagem_situacao_insert();
+
+CREATE TRIGGER vagas_contagem_situacao_delete
+AFTER DELETE ON vagas_vaga
+REFERENCING OLD TABLE AS antigas
+FOR EACH STATEMENT EXECUTE FUNCTION vagas_contagem_situacao_delete();
+
+CREATE TRIGGER vagas_contagem_situacao_update
+AFTER UPDATE ON vagas_vaga
+REFERENCING OLD TABLE AS antigas NEW TABLE AS novas
+FOR EACH STATEMENT EXECUTE FUNCTION vagas_contagem_situacao_update();
+"""
+
+CREATE_ROW_TRIGGERS = """
+DROP TRIGGER vagas_contagem_situacao_update ON vagas_vaga;
+DROP TRIGGER vagas_contagem_situacao_delete ON vagas_vaga;
+DROP TRIGGER vagas_contagem_situacao_insert ON vagas_vaga;
+DROP FUNCTION vagas_contagem_situacao_update();
+DROP FUNCTION vagas_contagem_situacao_delete();
+DROP FUNCTION vagas_contagem_situacao_insert();
+
+CREATE FUNCTION vagas_contagem_situacao() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE vagas_contagemsituacao SET total = total - 1, geracao = geracao + 1 WHERE situacao = OLD.situacao;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO vagas_contagemsituacao (situacao, total, geracao) VALUES (NEW.situacao, 1, 0)
+        ON CONFLICT (situacao) DO UPDATE SET total = vagas_contagemsituacao.total + 1;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER vagas_contagem_situacao_insert_delete
+AFTER INSERT OR DELETE ON vagas_vaga
+FOR EACH ROW EXECUTE FUNCTION vagas_contagem_situacao();
+
+CREATE TRIGGER vagas_contagem_situacao_update
+AFTER UPDATE OF situacao ON vagas_vaga
+FOR EACH ROW WHEN (OLD.situacao IS DISTINCT FROM NEW.situacao)
+EXECUTE FUNCTION vagas_contagem_situacao();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vagas', '0017_vaga_atualizacao_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_STATEMENT_TRIGGERS, CREATE_ROW_TRIGGERS),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 4.0.2 on 2026-10-18 13:30
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+# The search vector is only recomputed when one of its source columns changes, since Django
+# writes every column on save, or when it is missing, as for rows written before the trigger existed.
+CREATE_TRIGGER = """
+CREATE FUNCTION vagas_vaga_busca() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+        AND OLD.busca IS NOT NULL
+        AND NEW.cargo_titulo IS NOT DISTINCT FROM OLD.cargo_titulo
+        AND NEW.empresa_nome IS NOT DISTINCT FROM OLD.empresa_nome
+        AND NEW.cargo_descricao IS NOT DISTINCT FROM OLD.cargo_descricao
+    THEN
+        NEW.busca := OLD.busca;
+    ELSE
+        NEW.busca :=
+            setweight(to_tsvector('portuguese', coalesce(NEW.cargo_titulo, '')), 'A') ||
+            setweight(to_tsvector('portuguese', coalesce(NEW.empresa_nome, '')), 'B') ||
+            setweight(to_tsvector('portuguese', coalesce(NEW.cargo_descricao, '')), 'C');
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER vagas_vaga_busca BEFORE INSERT OR UPDATE ON vagas_vaga
+FOR EACH ROW EXECUTE FUNCTION vagas_vaga_busca();
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER vagas_vaga_busca ON vagas_vaga;
+DROP FUNCTION vagas_vaga_busca();
+"""
+
+FILL_BUSCA = """
+UPDATE vagas_vaga SET busca =
+    setweight(to_tsvector('portuguese', coalesce(cargo_titulo, '')), 'A') ||
+    setweight(to_tsvector('portuguese', coalesce(empresa_nome, '')), 'B') ||
+    setweight(to_tsvector('portuguese', coalesce(cargo_descricao, '')), 'C');
+"""
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('vagas', '0018_contagemsituacao_statement_triggers'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vaga',
+            name='busca',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(FILL_BUSCA, migrations.RunSQL.noop),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+        AddIndexConcurrently(
+            model_name='vaga',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['busca'], name='vaga_busca_idx'),
+        ),
+    ]
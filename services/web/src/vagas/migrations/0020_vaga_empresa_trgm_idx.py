@@ -0,0 +1,39 @@
+# Generated by Django 4.0.2 on 2026-10-18 13:30
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension, UnaccentExtension
+from django.db import migrations
+import vagas.models
+
+
+# unaccent() is only stable, since its dictionary may change, so it cannot be used in an index
+# expression. The wrapper pins the dictionary and is declared immutable.
+CREATE_FUNCTION = """
+CREATE FUNCTION vagas_unaccent(text) RETURNS text AS $$
+    SELECT public.unaccent('public.unaccent'::regdictionary, $1)
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT;
+"""
+
+DROP_FUNCTION = 'DROP FUNCTION vagas_unaccent(text);'
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('vagas', '0019_vaga_busca'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        UnaccentExtension(),
+        migrations.RunSQL(CREATE_FUNCTION, DROP_FUNCTION),
+        AddIndexConcurrently(
+            model_name='vaga',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(vagas.models.Unaccent('empresa_nome'), name='gin_trgm_ops'),
+                name='vaga_empresa_trgm_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.0.2 on 2026-10-18 13:30
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+import django.db.models.functions.text
+import vagas.models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('vagas', '0020_vaga_empresa_trgm_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='vaga',
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(vagas.models.Unaccent('empresa_nome')),
+                    name='text_pattern_ops',
+                ),
+                name='vaga_empresa_prefixo_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='vaga',
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(vagas.models.Unaccent('cargo_titulo')),
+                    name='text_pattern_ops',
+                ),
+                name='vaga_cargo_prefixo_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.0.2 on 2026-10-18 13:30
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('vagas', '0021_vaga_prefixo_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='vaga',
+            index=django.contrib.postgres.indexes.BrinIndex(
+                autosummarize=True,
+                fields=['data_hora_cadastro'],
+                name='vaga_cadastro_brin_idx',
+            ),
+        ),
+    ]
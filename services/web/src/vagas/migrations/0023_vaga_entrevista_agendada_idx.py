@@ -0,0 +1,24 @@
+# Generated by Django 4.0.2 on 2026-10-18 14:10
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('vagas', '0022_vaga_cadastro_brin_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='vaga',
+            index=models.Index(
+                condition=models.Q(('situacao', 'S')),
+                fields=['data_hora_entrevista'],
+                name='vaga_entrevista_agendada_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.0.2 on 2026-10-18 14:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vagas', '0023_vaga_entrevista_agendada_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LembreteEntrevista',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('data_hora_entrevista', models.DateTimeField()),
+                ('data_hora_envio', models.DateTimeField(auto_now_add=True)),
+                ('vaga', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lembretes', to='vagas.vaga')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='lembreteentrevista',
+            constraint=models.UniqueConstraint(fields=('vaga', 'data_hora_entrevista'), name='lembrete_entrevista_unico'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.0.2 on 2026-10-18 15:10
+
+from django.db import migrations
+
+
+# TelefoneField has always stripped the formatting on save, but rows written by other means (raw SQL,
+# fixtures) may still hold it, and Telefone formats the stored value by slicing, expecting digits only.
+NORMALIZE_TELEFONES = r"""
+UPDATE vagas_vaga SET
+    empresa_telefone_celular = regexp_replace(empresa_telefone_celular, '\D', '', 'g'),
+    empresa_telefone_comercial = regexp_replace(empresa_telefone_comercial, '\D', '', 'g')
+WHERE empresa_telefone_celular ~ '\D' OR empresa_telefone_comercial ~ '\D';
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vagas', '0024_lembreteentrevista'),
+    ]
+
+    operations = [
+        migrations.RunSQL(NORMALIZE_TELEFONES, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,113 @@
+# Generated by Django 4.0.2 on 2026-10-18 16:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+COPY_DESCRICOES = """
+INSERT INTO vagas_vagadescricao (vaga_id, cargo_descricao)
+SELECT id, cargo_descricao FROM vagas_vaga WHERE cargo_descricao <> '';
+"""
+
+RESTORE_DESCRICOES = """
+UPDATE vagas_vaga SET cargo_descricao = descricao.cargo_descricao
+FROM vagas_vagadescricao AS descricao
+WHERE descricao.vaga_id = vagas_vaga.id;
+"""
+
+# The search vector of a job opportunity now reads its description from vagas_vagadescricao, whose
+# changes set the vector to NULL so that the trigger on vagas_vaga computes it again. An UPDATE
+# statement that sets the vector to NULL therefore recomputes it even if no source column changed.
+CREATE_TRIGGERS = """
+CREATE OR REPLACE FUNCTION vagas_vaga_busca() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+        AND NEW.busca IS NOT NULL
+        AND NEW.cargo_titulo IS NOT DISTINCT FROM OLD.cargo_titulo
+        AND NEW.empresa_nome IS NOT DISTINCT FROM OLD.empresa_nome
+    THEN
+        NEW.busca := OLD.busca;
+    ELSE
+        NEW.busca :=
+            setweight(to_tsvector('portuguese', coalesce(NEW.cargo_titulo, '')), 'A') ||
+            setweight(to_tsvector('portuguese', coalesce(NEW.empresa_nome, '')), 'B') ||
+            setweight(to_tsvector('portuguese', coalesce(
+                (SELECT cargo_descricao FROM vagas_vagadescricao WHERE vaga_id = NEW.id), ''
+            )), 'C');
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION vagas_vagadescricao_busca() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' OR NEW.cargo_descricao IS DISTINCT FROM OLD.cargo_descricao THEN
+        UPDATE vagas_vaga SET busca = NULL WHERE id = NEW.vaga_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER vagas_vagadescricao_busca AFTER INSERT OR UPDATE ON vagas_vagadescricao
+FOR EACH ROW EXECUTE FUNCTION vagas_vagadescricao_busca();
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER vagas_vagadescricao_busca ON vagas_vagadescricao;
+DROP FUNCTION vagas_vagadescricao_busca();
+
+CREATE OR REPLACE FUNCTION vagas_vaga_busca() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+        AND OLD.busca IS NOT NULL
+        AND NEW.cargo_titulo IS NOT DISTINCT FROM OLD.cargo_titulo
+        AND NEW.empresa_nome IS NOT DISTINCT FROM OLD.empresa_nome
+        AND NEW.cargo_descricao IS NOT DISTINCT FROM OLD.cargo_descricao
+    THEN
+        NEW.busca := OLD.busca;
+    ELSE
+        NEW.busca :=
+            setweight(to_tsvector('portuguese', coalesce(NEW.cargo_titulo, '')), 'A') ||
+            setweight(to_tsvector('portuguese', coalesce(NEW.empresa_nome, '')), 'B') ||
+            setweight(to_tsvector('portuguese', coalesce(NEW.cargo_descricao, '')), 'C');
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# The job opportunities cannot be written until the migration is committed, so that no description is
+# saved to vagas_vaga.cargo_descricao after it was copied. They can still be read.
+LOCK_VAGAS = 'LOCK TABLE vagas_vaga IN SHARE MODE;'
+
+# Rows migrated while 0019 created its trigger before filling the search vectors were left without
+# one. Setting them to NULL has the trigger compute them.
+FILL_BUSCA = 'UPDATE vagas_vaga SET busca = NULL WHERE busca IS NULL;'
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vagas', '0025_vaga_telefone_digits'),
+    ]
+
+    operations = [
+        migrations.RunSQL(LOCK_VAGAS, migrations.RunSQL.noop),
+        migrations.CreateModel(
+            name='VagaDescricao',
+            fields=[
+                ('vaga', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='descricao', serialize=False, to='vagas.vaga')),
+                ('cargo_descricao', models.TextField(blank=True)),
+            ],
+        ),
+        migrations.RunSQL(COPY_DESCRICOES, RESTORE_DESCRICOES),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+        migrations.RunSQL(FILL_BUSCA, migrations.RunSQL.noop),
+        migrations.RemoveField(
+            model_name='vaga',
+            name='cargo_descricao',
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.0.2 on 2026-10-18 14:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vagas', '0026_vagadescricao'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportacaoVagas',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('arquivo', models.CharField(max_length=500, unique=True)),
+                ('posicao', models.BigIntegerField(default=0)),
+                ('linha', models.BigIntegerField(default=0)),
+                ('posicao_erros', models.BigIntegerField(default=0)),
+                ('importadas', models.BigIntegerField(default=0)),
+                ('rejeitadas', models.BigIntegerField(default=0)),
+                ('concluida', models.BooleanField(default=False)),
+                ('data_hora_atualizacao', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,134 @@
+# Generated by Django 4.0.2 on 2026-10-18 17:30
+
+from django.db import migrations, models
+
+
+# Like the former ones, but the statements deleting job opportunities also increment geracao_exclusao.
+APPLY_DELTAS = """
+ORDER BY situacao
+ON CONFLICT (situacao) DO UPDATE SET
+    total = vagas_contagemsituacao.total + EXCLUDED.total,
+    geracao = vagas_contagemsituacao.geracao + EXCLUDED.geracao,
+    geracao_exclusao = vagas_contagemsituacao.geracao_exclusao + EXCLUDED.geracao_exclusao;
+"""
+
+REPLACE_FUNCTIONS = f"""
+CREATE OR REPLACE FUNCTION vagas_contagem_situacao_insert() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO vagas_contagemsituacao (situacao, total, geracao, geracao_exclusao)
+    SELECT situacao, COUNT(*), 0, 0 FROM novas GROUP BY situacao
+    {APPLY_DELTAS}
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION vagas_contagem_situacao_delete() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO vagas_contagemsituacao (situacao, total, geracao, geracao_exclusao)
+    SELECT situacao, -COUNT(*), 1, 1 FROM antigas GROUP BY situacao
+    {APPLY_DELTAS}
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION vagas_contagem_situacao_update() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO vagas_contagemsituacao (situacao, total, geracao, geracao_exclusao)
+    SELECT situacao, SUM(delta), MAX(saida), 0 FROM (
+        SELECT antigas.situacao, -1 AS delta, 1 AS saida
+        FROM antigas JOIN novas ON novas.id = antigas.id
+        WHERE antigas.situacao IS DISTINCT FROM novas.situacao
+        UNION ALL
+        SELECT novas.situacao, 1 AS delta, 0 AS saida
+        FROM antigas JOIN novas ON novas.id = antigas.id
+        WHERE antigas.situacao IS DISTINCT FROM novas.situacao
+    ) AS mudancas
+    GROUP BY situacao
+    {APPLY_DELTAS}
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION vagas_contagem_situacao_truncate() RETURNS trigger AS $$
+BEGIN
+    UPDATE vagas_contagemsituacao SET total = 0, geracao = geracao + 1, geracao_exclusao = geracao_exclusao + 1;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+FORMER_APPLY_DELTAS = """
+ORDER BY situacao
+ON CONFLICT (situacao) DO UPDATE SET
+    total = vagas_contagemsituacao.total + EXCLUDED.total,
+    geracao = vagas_contagemsituacao.geracao + EXCLUDED.geracao;
+"""
+
+RESTORE_FUNCTIONS = f"""
+CREATE OR REPLACE FUNCTION vagas_contagem_situacao_insert() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO vagas_contagemsituacao (situacao, total, geracao)
+    SELECT situacao, COUNT(*), 0 FROM novas GROUP BY situacao
+    {FORMER_APPLY_DELTAS}
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION vagas_contagem_situacao_delete() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO vagas_contagemsituacao (situacao, total, geracao)
+    SELECT situacao, -COUNT(*), 1 FROM antigas GROUP BY situacao
+    {FORMER_APPLY_DELTAS}
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION vagas_contagem_situacao_update() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO vagas_contagemsituacao (situacao, total, geracao)
+    SELECT situacao, SUM(delta), MAX(saida) FROM (
+        SELECT antigas.situacao, -1 AS delta, 1 AS saida
+        FROM antigas JOIN novas ON novas.id = antigas.id
+        WHERE antigas.situacao IS DISTINCT FROM novas.situacao
+        UNION ALL
+        SELECT novas.situacao, 1 AS delta, 0 AS saida
+        FROM antigas JOIN novas ON novas.id = antigas.id
+        WHERE antigas.situacao IS DISTINCT FROM novas.situacao
+    ) AS mudancas
+    GROUP BY situacao
+    {FORMER_APPLY_DELTAS}
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION vagas_contagem_situacao_truncate() RETURNS trigger AS $$
+BEGIN
+    UPDATE vagas_contagemsituacao SET total = 0, geracao = geracao + 1;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vagas', '0027_importacaovagas'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contagemsituacao',
+            name='geracao_exclusao',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunSQL(REPLACE_FUNCTIONS, RESTORE_FUNCTIONS),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 4.0.2 on 2026-10-18 18:20
+
+from django.db import migrations
+
+
+APPLY_DELTAS = """
+ORDER BY situacao
+ON CONFLICT (situacao) DO UPDATE SET
+    total = vagas_contagemsituacao.total + EXCLUDED.total,
+    geracao = vagas_contagemsituacao.geracao + EXCLUDED.geracao,
+    geracao_exclusao = vagas_contagemsituacao.geracao_exclusao + EXCLUDED.geracao_exclusao;
+"""
+
+# Like the former one, but the statements changing the company name or the job title of job opportunities
+# also increment geracao_exclusao, since the former values may no longer be registered.
+REPLACE_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION vagas_contagem_situacao_update() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO vagas_contagemsituacao (situacao, total, geracao, geracao_exclusao)
+    SELECT situacao, SUM(delta), MAX(saida), MAX(renomeacao) FROM (
+        SELECT antigas.situacao, -1 AS delta, 1 AS saida, 0 AS renomeacao
+        FROM antigas JOIN novas ON novas.id = antigas.id
+        WHERE antigas.situacao IS DISTINCT FROM novas.situacao
+        UNION ALL
+        SELECT novas.situacao, 1 AS delta, 0 AS saida, 0 AS renomeacao
+        FROM antigas JOIN novas ON novas.id = antigas.id
+        WHERE antigas.situacao IS DISTINCT FROM novas.situacao
+        UNION ALL
+        SELECT novas.situacao, 0 AS delta, 0 AS saida, 1 AS renomeacao
+        FROM antigas JOIN novas ON novas.id = antigas.id
+        WHERE antigas.empresa_nome IS DISTINCT FROM novas.empresa_nome
+            OR antigas.cargo_titulo IS DISTINCT FROM novas.cargo_titulo
+    ) AS mudancas
+    GROUP BY situacao
+    {APPLY_DELTAS}
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+RESTORE_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION vagas_contagem_situacao_update() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO vagas_contagemsituacao (situacao, total, geracao, geracao_exclusao)
+    SELECT situacao, SUM(delta), MAX(saida), 0 FROM (
+        SELECT antigas.situacao, -1 AS delta, 1 AS saida
+        FROM antigas JOIN novas ON novas.id = antigas.id
+        WHERE antigas.situacao IS DISTINCT FROM novas.situacao
+        UNION ALL
+        SELECT novas.situacao, 1 AS delta, 0 AS saida
+        FROM antigas JOIN novas ON novas.id = antigas.id
+        WHERE antigas.situacao IS DISTINCT FROM novas.situacao
+    ) AS mudancas
+    GROUP BY situacao
+    {APPLY_DELTAS}
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vagas', '0028_contagemsituacao_geracao_exclusao'),
+    ]
+
+    operations = [
+        migrations.RunSQL(REPLACE_FUNCTION, RESTORE_FUNCTION),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.0.2 on 2026-10-18 18:40
+
+from django.db import migrations
+
+
+# Dropping cargo_descricao in 0026 left its values in the existing rows until they are rewritten, so
+# the table is rewritten at once. It is locked meanwhile, which takes about a minute per million rows.
+# VACUUM cannot run inside a transaction, so this is the only operation of a non-atomic migration, and
+# running it again after a failure is harmless.
+REWRITE_TABLE = 'VACUUM (FULL, ANALYZE) vagas_vaga;'
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('vagas', '0029_contagemsituacao_geracao_exclusao_renomeacao'),
+    ]
+
+    operations = [
+        migrations.RunSQL(REWRITE_TABLE, migrations.RunSQL.noop),
+    ]
@@ -1,27 +1,119 @@
-from django.db import models
+from django.conf import settings
+from django.contrib.postgres.indexes import BrinIndex, GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.db.models.functions import Upper
 from django.core.validators import RegexValidator
 from django.core.exceptions import ValidationError
-from typing import Any
-import re
-from datetime import datetime
+from typing import Any, Optional
+from datetime import datetime, timedelta
+from django.utils import timezone
 from vagas.validators import is_equal_to_or_later_than_current_datetime
 
+DIGITS = frozenset('0123456789')
+
+def only_digits(value: Any) -> str:
+    """
+    Return the digits of a value, in order, dropping every other character.
+
+    :param value: Phone number, either formatted or not
+
+    :type value: Any
+
+    :rtype: str
+    """
+    value = str(value)
+
+    if value.isascii() and value.isdigit():
+        return value
+
+    return ''.join(filter(DIGITS.__contains__, value))
+
+class Telefone:
+    """
+    Phone number read from the database, stored with digits only and formatted only when displayed.
+
+    The number is formatted as (DDD) NNNN-NNNN or (DDD) NNNNN-NNNN by slicing the digits: two
+    for the area code, the last four, and the ones in between. Numbers too short to be split
+    that way are shown as stored. A Telefone compares equal to its formatted text.
+    """
+
+    __slots__ = ('digitos', '_formatado')
+
+    def __init__(self, digitos: str) -> None:
+        """
+        :param digitos: Digits of the phone number
+
+        :type digitos: str
+        """
+        self.digitos = digitos
+        self._formatado = None
+
+    def __str__(self) -> str:
+        if self._formatado is None:
+            digitos = self.digitos
+            self._formatado = f'({digitos[:2]}) {digitos[2:-4]}-{digitos[-4:]}' if len(digitos) > 6 else digitos
+
+        return self._formatado
+
+    def __repr__(self) -> str:
+        return f'<Telefone: {self}>'
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Telefone):
+            return self.digitos == other.digitos
+
+        if isinstance(other, str):
+            return str(self) == other
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __bool__(self) -> bool:
+        return bool(self.digitos)
+
 class TelefoneField(models.CharField):
-    
+    """
+    Phone number stored with digits only and read as a Telefone.
+
+    Validators and forms keep working with the formatted text, which to_python returns.
+    """
+
     def get_prep_value(self, value: Any) -> Any:
-        regex = re.compile('\D+')
+        if isinstance(value, Telefone):
+            return value.digitos
+
+        return only_digits(value)
 
-        return regex.sub('', str(value))
-    
     def from_db_value(self, value: Any, expression, connection):
         if value:
-            phone_regex = re.compile(r'^(\d{2})(\d{1,})(\d{4})$')
-            p1, p2, p3 = phone_regex.search(value).groups()
-            
-            return f'({p1}) {p2}-{p3}'
-        
+            return Telefone(value)
+
         return value
 
+    def to_python(self, value: Any) -> Any:
+        if isinstance(value, Telefone):
+            return str(value)
+
+        return super().to_python(value)
+
+    def value_to_string(self, obj) -> str:
+        value = self.value_from_object(obj)
+
+        return '' if value is None else str(value)
+
+class Unaccent(models.Func):
+    """
+    Strip the accents of a text.
+
+    Unlike unaccent(), the vagas_unaccent() function is declared immutable, so it can be used in
+    index expressions.
+    """
+    function = 'vagas_unaccent'
+    output_field = models.CharField()
+
 class Vaga(models.Model):
     """A job opportunity model."""
 
@@ -98,11 +190,6 @@ class Vaga(models.Model):
         }
     )
 
-    cargo_descricao = models.TextField(
-        null=False,
-        blank=True
-    )
-
     site_referencia = models.URLField(
         null=False,
         blank=False,
@@ -137,6 +224,69 @@ class Vaga(models.Model):
     
     data_hora_atualizacao = models.DateTimeField(auto_now=True)
 
+    # Maintained by the vagas_vaga_busca trigger from cargo_titulo, empresa_nome and the description
+    # in vagas_vagadescricao. Setting it to NULL has it computed again.
+    busca = SearchVectorField(null=True, editable=False)
+
+    # Columns rendered by the homepage listing.
+    LISTING_FIELDS = (
+        'empresa_nome',
+        'empresa_site',
+        'cargo_titulo',
+        'situacao',
+        'data_hora_entrevista',
+        'data_hora_cadastro',
+        'data_hora_atualizacao',
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['situacao', 'data_hora_cadastro', 'id'],
+                name='vaga_situacao_cadastro_idx',
+            ),
+            models.Index(
+                fields=['data_hora_cadastro', 'id'],
+                include=['situacao', 'empresa_nome', 'empresa_site', 'cargo_titulo', 'data_hora_entrevista', 'data_hora_atualizacao'],
+                name='vaga_listagem_idx',
+            ),
+            models.Index(
+                fields=['situacao', 'data_hora_atualizacao'],
+                name='vaga_situacao_atualizacao_idx',
+            ),
+            models.Index(
+                fields=['data_hora_atualizacao'],
+                name='vaga_atualizacao_idx',
+            ),
+            GinIndex(
+                fields=['busca'],
+                name='vaga_busca_idx',
+            ),
+            GinIndex(
+                OpClass(Unaccent('empresa_nome'), name='gin_trgm_ops'),
+                name='vaga_empresa_trgm_idx',
+            ),
+            models.Index(
+                OpClass(Upper(Unaccent('empresa_nome')), name='text_pattern_ops'),
+                name='vaga_empresa_prefixo_idx',
+            ),
+            models.Index(
+                OpClass(Upper(Unaccent('cargo_titulo')), name='text_pattern_ops'),
+                name='vaga_cargo_prefixo_idx',
+            ),
+            BrinIndex(
+                fields=['data_hora_cadastro'],
+                name='vaga_cadastro_brin_idx',
+                autosummarize=True,
+            ),
+            # Only the rows with Status.INTERVIEW_SCHEDULED are indexed, which the agenda reads.
+            models.Index(
+                fields=['data_hora_entrevista'],
+                name='vaga_entrevista_agendada_idx',
+                condition=models.Q(situacao='S'),
+            ),
+        ]
+
     def __str__(self) -> str:
         """
         Return user-friendly representation of this model.
@@ -152,6 +302,49 @@ class Vaga(models.Model):
         :return: str
         """
         return f'/oportunidades/{str(self.id)}'
+
+    @property
+    def cargo_descricao(self) -> str:
+        """
+        Return the description of the job, read from VagaDescricao on first access unless it was loaded with select_related('descricao').
+
+        :return: str
+        """
+        try:
+            return self.descricao.cargo_descricao
+        except VagaDescricao.DoesNotExist:
+            return ''
+
+    @cargo_descricao.setter
+    def cargo_descricao(self, value: str) -> None:
+        try:
+            descricao = self.descricao
+        except VagaDescricao.DoesNotExist:
+            descricao = VagaDescricao()
+            self.descricao = descricao
+
+        descricao.cargo_descricao = value
+        self._descricao_alterada = True
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Save the job opportunity and, if it was changed, its description.
+
+        A description row is only created for a description that is not empty.
+
+        :rtype: None
+        """
+        if not self.__dict__.pop('_descricao_alterada', False):
+            super().save(*args, **kwargs)
+            return
+
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+            descricao = self.descricao
+
+            if descricao.cargo_descricao or not descricao._state.adding:
+                descricao.vaga = self
+                descricao.save(force_insert=descricao._state.adding, using=kwargs.get('using'))
     
     def clean(self):
         if self.situacao == self.Status.INTERVIEW_SCHEDULED and self.data_hora_entrevista is None:
@@ -179,3 +372,201 @@ class Vaga(models.Model):
                         code='invalid_datetime'
                     )
                 })
+
+            if self.situacao == self.Status.INTERVIEW_SCHEDULED:
+                try:
+                    self.validate_interview_conflict()
+                except ValidationError as e:
+                    raise ValidationError({'data_hora_entrevista': e})
+
+    def get_conflicting_interview(self) -> Optional['Vaga']:
+        """
+        Return the earliest other scheduled interview overlapping the interview of this job opportunity, if any.
+
+        Every interview lasts settings.VAGAS_INTERVIEW_DURATION minutes, so two of them overlap exactly
+        when they start less than that apart. The overlapping ones are therefore found by a range scan
+        of the partial vaga_entrevista_agendada_idx index, which only holds the scheduled interviews.
+
+        :rtype: Vaga or None
+        """
+        duracao = timedelta(minutes=settings.VAGAS_INTERVIEW_DURATION)
+        conflitos = Vaga.objects.filter(
+            situacao=self.Status.INTERVIEW_SCHEDULED,
+            data_hora_entrevista__gt=self.data_hora_entrevista - duracao,
+            data_hora_entrevista__lt=self.data_hora_entrevista + duracao,
+        )
+
+        if self.pk is not None:
+            conflitos = conflitos.exclude(pk=self.pk)
+
+        return conflitos.order_by('data_hora_entrevista', 'id').first()
+
+    def validate_interview_conflict(self) -> None:
+        """
+        Ensure that the interview of this job opportunity does not overlap another scheduled interview.
+
+        :raises ValidationError: If the interview overlaps another one, naming the other job opportunity.
+
+        :rtype: None
+        """
+        conflito = self.get_conflicting_interview()
+
+        if conflito is not None:
+            raise conflito.interview_conflict_error()
+
+    def interview_conflict_error(self) -> ValidationError:
+        """
+        Return the error of another interview overlapping the interview of this job opportunity.
+
+        :rtype: ValidationError
+        """
+        data_hora = timezone.localtime(self.data_hora_entrevista).strftime('%d/%m/%Y %H:%M')
+
+        return ValidationError(
+            'A entrevista coincide com a entrevista de %(cargo_titulo)s na empresa %(empresa_nome)s, agendada para %(data_hora)s.',
+            code='conflict',
+            params={
+                'cargo_titulo': self.cargo_titulo,
+                'empresa_nome': self.empresa_nome,
+                'data_hora': data_hora,
+            },
+        )
+
+
+class VagaDescricao(models.Model):
+    """
+    Description of the job of a job opportunity.
+
+    Descriptions are often whole job postings pasted in, and are only shown by the detail, edit and
+    delete pages. They are kept out of the vagas_vaga table, so that the pages listing job
+    opportunities read narrower rows. Job opportunities without a description have no row.
+    """
+
+    vaga = models.OneToOneField(Vaga, on_delete=models.CASCADE, primary_key=True, related_name='descricao')
+
+    cargo_descricao = models.TextField(
+        null=False,
+        blank=True
+    )
+
+    def __str__(self) -> str:
+        """
+        Return user-friendly representation of this model.
+
+        :return: str
+        """
+        return self.cargo_descricao
+
+
+class ContagemSituacao(models.Model):
+    """
+    Number of job opportunities in each status.
+
+    The rows are kept up to date by database triggers on the vagas_vaga table, so that
+    totals can be read without counting the whole table. The generation is incremented
+    whenever a job opportunity leaves the status, either by being deleted or by having its
+    status changed, which the latest update datetime of the remaining rows cannot reveal.
+    The deletion generation is only incremented when job opportunities are deleted or have their
+    company name or job title changed, which may remove a value from the registered ones.
+    """
+
+    situacao = models.CharField(
+        primary_key=True,
+        max_length=1,
+        choices=Vaga.Status.choices,
+    )
+
+    total = models.BigIntegerField(default=0)
+
+    geracao = models.BigIntegerField(default=0)
+
+    geracao_exclusao = models.BigIntegerField(default=0)
+
+    def __str__(self) -> str:
+        """
+        Return user-friendly representation of this model.
+
+        :return: str
+        """
+        return f'{self.get_situacao_display()}: {self.total}'
+
+    @classmethod
+    def totais(cls) -> dict:
+        """
+        Return the number of job opportunities keyed by status.
+
+        :return: dict
+        """
+        totais = dict.fromkeys(Vaga.Status.values, 0)
+        totais.update(cls.objects.values_list('situacao', 'total'))
+
+        return totais
+
+
+class LembreteEntrevista(models.Model):
+    """
+    Reminder sent for the interview of a job opportunity.
+
+    A reminder is recorded in the same transaction in which it is sent, and the unique constraint
+    ensures that a given interview is reminded of only once, even across restarts of the scheduler
+    or with more than one of them running. Rescheduling the interview allows a new reminder.
+    """
+
+    vaga = models.ForeignKey(Vaga, on_delete=models.CASCADE, related_name='lembretes')
+
+    data_hora_entrevista = models.DateTimeField()
+
+    data_hora_envio = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['vaga', 'data_hora_entrevista'],
+                name='lembrete_entrevista_unico',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """
+        Return user-friendly representation of this model.
+
+        :return: str
+        """
+        return f'{self.vaga}: {self.data_hora_entrevista}'
+
+
+class ImportacaoVagas(models.Model):
+    """
+    Progress of an import of job opportunities from a file by the import_vagas command.
+
+    The progress is saved in the same transaction as each batch of imported job opportunities,
+    so an interrupted import resumes right after the last batch committed, without importing a
+    row twice or skipping one. The position of the error report is kept as well, so that the
+    errors of a batch that was not committed are not reported twice.
+    """
+
+    arquivo = models.CharField(max_length=500, unique=True)
+
+    # Bytes and lines of the file read up to the end of the last imported batch.
+    posicao = models.BigIntegerField(default=0)
+
+    linha = models.BigIntegerField(default=0)
+
+    # Size of the error report at the end of the last imported batch.
+    posicao_erros = models.BigIntegerField(default=0)
+
+    importadas = models.BigIntegerField(default=0)
+
+    rejeitadas = models.BigIntegerField(default=0)
+
+    concluida = models.BooleanField(default=False)
+
+    data_hora_atualizacao = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        """
+        Return user-friendly representation of this model.
+
+        :return: str
+        """
+        return f'{self.arquivo}: {self.importadas}'
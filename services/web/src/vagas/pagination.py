@@ -0,0 +1,199 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Iterable, Optional
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q, QuerySet
+
+
+class InvalidCursor(Exception):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class CursorPage:
+    """A page of results obtained through keyset pagination."""
+
+    def __init__(self, object_list: list, next_cursor: Optional[str], previous_cursor: Optional[str]) -> None:
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+
+class CursorPaginator:
+    """
+    Paginate a queryset by the values of its ordering fields (keyset pagination).
+
+    Instead of OFFSET, each page is fetched with a WHERE clause that starts right
+    after (or right before) the row referenced by an opaque cursor, so the cost of
+    fetching a page does not depend on how deep the user has paged.
+    The ordering may refer to annotations, such as a search rank. Its last field must be
+    unique (usually the primary key).
+    """
+
+    def __init__(self, queryset: QuerySet, ordering: Iterable[str], per_page: int) -> None:
+        self.queryset = queryset
+        self.ordering = tuple(ordering)
+        self.per_page = per_page
+
+    def get_page(self, after: Optional[str] = None, before: Optional[str] = None) -> CursorPage:
+        """
+        Return a page of results, falling back to the first page if a cursor is invalid.
+
+        :param after: Cursor of the row after which the page starts
+
+        :type after: str
+
+        :param before: Cursor of the row before which the page ends
+
+        :type before: str
+
+        :rtype: CursorPage
+        """
+        try:
+            return self.page(after=after, before=before)
+        except InvalidCursor:
+            return self.page()
+
+    def page(self, after: Optional[str] = None, before: Optional[str] = None) -> CursorPage:
+        """
+        Return a page of results.
+
+        :param after: Cursor of the row after which the page starts
+
+        :type after: str
+
+        :param before: Cursor of the row before which the page ends
+
+        :type before: str
+
+        :raises InvalidCursor: If the given cursor cannot be decoded.
+
+        :rtype: CursorPage
+        """
+        if before:
+            rows = self._fetch(self.decode_cursor(before), backwards=True)
+            has_more = len(rows) > self.per_page
+            rows = rows[:self.per_page]
+            rows.reverse()
+
+            return CursorPage(
+                rows,
+                next_cursor=self.encode_cursor(rows[-1]) if rows else None,
+                previous_cursor=self.encode_cursor(rows[0]) if rows and has_more else None,
+            )
+
+        rows = self._fetch(self.decode_cursor(after) if after else None)
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        return CursorPage(
+            rows,
+            next_cursor=self.encode_cursor(rows[-1]) if rows and has_more else None,
+            previous_cursor=self.encode_cursor(rows[0]) if rows and after else None,
+        )
+
+    def encode_cursor(self, obj: Any) -> str:
+        """
+        Return an opaque cursor pointing at the given row.
+
+        :param obj: A row fetched from the paginated queryset, either a model instance or a dict from values()
+
+        :type obj: Any
+
+        :rtype: str
+        """
+        values = []
+
+        for field_name in self._field_names():
+            value = obj[field_name] if isinstance(obj, dict) else getattr(obj, field_name)
+            values.append(value.isoformat() if isinstance(value, datetime) else value)
+
+        payload = json.dumps(values, separators=(',', ':')).encode()
+
+        return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+    def decode_cursor(self, cursor: str) -> list:
+        """
+        Return the ordering values referenced by the given cursor.
+
+        :param cursor: A cursor previously returned by encode_cursor
+
+        :type cursor: str
+
+        :raises InvalidCursor: If the cursor cannot be decoded.
+
+        :rtype: list
+        """
+        try:
+            payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            values = json.loads(payload)
+        except (binascii.Error, ValueError, TypeError) as e:
+            raise InvalidCursor(cursor) from e
+
+        field_names = self._field_names()
+
+        if not isinstance(values, list) or len(values) != len(field_names):
+            raise InvalidCursor(cursor)
+
+        try:
+            return [self._to_python(name, value) for name, value in zip(field_names, values)]
+        except ValidationError as e:
+            raise InvalidCursor(cursor) from e
+
+    def _fetch(self, values: Optional[list], backwards: bool = False) -> list:
+        ordering = self._reverse_ordering() if backwards else self.ordering
+        queryset = self.queryset.order_by(*ordering)
+
+        if values is not None:
+            queryset = queryset.filter(self._seek(ordering, values))
+
+        return list(queryset[:self.per_page + 1])
+
+    def _seek(self, ordering: tuple, values: list) -> Q:
+        """Return the condition selecting the rows that come after the given values in the given ordering."""
+        lookups = [
+            (name.lstrip('-'), 'lt' if name.startswith('-') else 'gt')
+            for name in ordering
+        ]
+        condition = Q()
+
+        for i, (field_name, lookup) in enumerate(lookups):
+            equal = {name: value for (name, _), value in zip(lookups[:i], values)}
+            condition |= Q(**equal, **{f'{field_name}__{lookup}': values[i]})
+
+        # The redundant bound on the leading column lets the database use a range scan on it.
+        leading_field, leading_lookup = lookups[0]
+
+        return Q(**{f'{leading_field}__{leading_lookup}e': values[0]}) & condition
+
+    def _reverse_ordering(self) -> tuple:
+        return tuple(name[1:] if name.startswith('-') else f'-{name}' for name in self.ordering)
+
+    def _field_names(self) -> list:
+        return [name.lstrip('-') for name in self.ordering]
+
+    def _to_python(self, field_name: str, value: Any) -> Any:
+        if field_name in self.queryset.query.annotations:
+            return self.queryset.query.annotations[field_name].output_field.to_python(value)
+
+        try:
+            field = self.queryset.model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return value
+
+        return field.to_python(value)
@@ -0,0 +1,234 @@
+import heapq
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+from django.contrib.auth import get_user_model
+from django.core.mail import send_mail
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, Max, OuterRef
+from django.utils import timezone
+from vagas.models import LembreteEntrevista, Vaga
+
+logger = logging.getLogger(__name__)
+
+# Rows saved shortly before a poll may only be committed after it, so each poll looks
+# this far behind the latest update it has already seen.
+POLL_OVERLAP = timedelta(minutes=1)
+
+class ReminderScheduler:
+    """
+    Send an email reminder some hours before each scheduled interview.
+
+    The upcoming interviews are loaded once, through the partial vaga_entrevista_agendada_idx
+    index, and kept in a min-heap ordered by the time their reminder is due. Afterwards only the
+    rows updated since the previous poll are read, through the vaga_atualizacao_idx index, to
+    schedule new and rescheduled interviews and to drop the cancelled ones. Heap entries are
+    never removed in place: an entry whose interview no longer matches the one kept for its job
+    opportunity is discarded when it reaches the top.
+
+    Every reminder is recorded in LembreteEntrevista within the transaction that sends it, so
+    it is sent once per interview even if the scheduler is restarted. Reminders whose time
+    passed while the scheduler was stopped are sent as soon as it starts, as long as the
+    interview has not started yet.
+    """
+
+    def __init__(self, antecedencia: timedelta, intervalo: timedelta) -> None:
+        """
+        :param antecedencia: How long before the interview the reminder is sent
+
+        :type antecedencia: timedelta
+
+        :param intervalo: Time between polls, after which a reminder that could not be sent is tried again
+
+        :type intervalo: timedelta
+        """
+        self.antecedencia = antecedencia
+        self.intervalo = intervalo
+        self.heap = []
+        self.entrevistas = {}
+        self.ultima_atualizacao = None
+
+    def schedule(self, pk: int, data_hora_entrevista: datetime) -> None:
+        """
+        Schedule the reminder of an interview, replacing the one of a previous interview of the same job opportunity.
+
+        :param pk: Primary key of the job opportunity
+
+        :type pk: int
+
+        :param data_hora_entrevista: Datetime of the interview
+
+        :type data_hora_entrevista: datetime
+
+        :rtype: None
+        """
+        if self.entrevistas.get(pk) == data_hora_entrevista:
+            return
+
+        self.entrevistas[pk] = data_hora_entrevista
+        heapq.heappush(self.heap, (data_hora_entrevista - self.antecedencia, pk, data_hora_entrevista))
+
+    def load(self, now: datetime) -> None:
+        """
+        Schedule the reminders of every upcoming interview not reminded of yet.
+
+        :param now: Current datetime
+
+        :type now: datetime
+
+        :rtype: None
+        """
+        self.heap = []
+        self.entrevistas = {}
+        self.ultima_atualizacao = Vaga.objects.aggregate(ultima=Max('data_hora_atualizacao'))['ultima']
+        lembrados = LembreteEntrevista.objects.filter(
+            vaga=OuterRef('pk'),
+            data_hora_entrevista=OuterRef('data_hora_entrevista'),
+        )
+        agendadas = (
+            Vaga.objects.filter(situacao=Vaga.Status.INTERVIEW_SCHEDULED, data_hora_entrevista__gt=now)
+            .exclude(Exists(lembrados))
+            .values_list('pk', 'data_hora_entrevista')
+        )
+
+        for pk, data_hora_entrevista in agendadas:
+            self.schedule(pk, data_hora_entrevista)
+
+    def poll(self, now: datetime) -> None:
+        """
+        Follow the job opportunities updated since the previous poll.
+
+        Deleted job opportunities are not seen here; their reminders are discarded when due.
+
+        :param now: Current datetime
+
+        :type now: datetime
+
+        :rtype: None
+        """
+        if self.ultima_atualizacao is None:
+            vagas = Vaga.objects.all()
+        else:
+            vagas = Vaga.objects.filter(data_hora_atualizacao__gt=self.ultima_atualizacao - POLL_OVERLAP)
+
+        campos = ('pk', 'situacao', 'data_hora_entrevista', 'data_hora_atualizacao')
+
+        for pk, situacao, data_hora_entrevista, data_hora_atualizacao in vagas.values_list(*campos).iterator():
+            self.ultima_atualizacao = max(self.ultima_atualizacao or data_hora_atualizacao, data_hora_atualizacao)
+
+            if (Vaga.Status.INTERVIEW_SCHEDULED == situacao
+                    and data_hora_entrevista is not None and data_hora_entrevista > now):
+                self.schedule(pk, data_hora_entrevista)
+            else:
+                self.entrevistas.pop(pk, None)
+
+        # Interviews already reminded of are kept until they start, so that the overlap of the next poll does not schedule them again.
+        for pk, data_hora_entrevista in list(self.entrevistas.items()):
+            if data_hora_entrevista <= now:
+                del self.entrevistas[pk]
+
+    def next_due(self) -> Optional[datetime]:
+        """
+        Return the datetime of the next reminder, if any.
+
+        :rtype: datetime or None
+        """
+        return self.heap[0][0] if self.heap else None
+
+    def run_due(self, now: datetime) -> list:
+        """
+        Send the reminders due up to the given datetime.
+
+        A reminder that could not be sent is tried again one poll interval later.
+
+        :param now: Current datetime
+
+        :type now: datetime
+
+        :return: The job opportunities whose reminders were sent
+
+        :rtype: list
+        """
+        enviadas = []
+        falhas = []
+
+        while self.heap and self.heap[0][0] <= now:
+            lembrete = heapq.heappop(self.heap)
+            _, pk, data_hora_entrevista = lembrete
+
+            if self.entrevistas.get(pk) != data_hora_entrevista or data_hora_entrevista <= now:
+                continue
+
+            try:
+                vaga = self.send(pk, data_hora_entrevista)
+            except Exception:
+                logger.exception('Could not send the reminder of the interview of job opportunity %s.', pk)
+                falhas.append((now + self.intervalo, pk, data_hora_entrevista))
+                continue
+
+            if vaga is not None:
+                enviadas.append(vaga)
+
+        for falha in falhas:
+            heapq.heappush(self.heap, falha)
+
+        return enviadas
+
+    def send(self, pk: int, data_hora_entrevista: datetime) -> Optional[Vaga]:
+        """
+        Send the reminder of an interview to every active user with an email address, unless it was already sent.
+
+        :param pk: Primary key of the job opportunity
+
+        :type pk: int
+
+        :param data_hora_entrevista: Datetime of the interview
+
+        :type data_hora_entrevista: datetime
+
+        :return: The job opportunity, or None if the reminder was not sent
+
+        :rtype: Vaga or None
+        """
+        destinatarios = list(
+            get_user_model().objects.filter(is_active=True).exclude(email='').values_list('email', flat=True)
+        )
+
+        if not destinatarios:
+            logger.warning('No active user with an email address to remind of the interview of job opportunity %s.', pk)
+
+            return None
+
+        with transaction.atomic():
+            vaga = (
+                Vaga.objects.select_for_update()
+                .filter(pk=pk, situacao=Vaga.Status.INTERVIEW_SCHEDULED, data_hora_entrevista=data_hora_entrevista)
+                .first()
+            )
+
+            if vaga is None:
+                return None
+
+            try:
+                with transaction.atomic():
+                    LembreteEntrevista.objects.create(vaga=vaga, data_hora_entrevista=data_hora_entrevista)
+            except IntegrityError:
+                return None
+
+            data_hora = timezone.localtime(data_hora_entrevista).strftime('%d/%m/%Y às %H:%M')
+            send_mail(
+                f'Lembrete: entrevista na empresa {vaga.empresa_nome} em {data_hora}',
+                '\n'.join(linha for linha in [
+                    f'Você tem uma entrevista agendada para {data_hora}.',
+                    '',
+                    f'Empresa: {vaga.empresa_nome}',
+                    f'Cargo: {vaga.cargo_titulo}',
+                    f'Endereço: {vaga.empresa_endereco}' if vaga.empresa_endereco else None,
+                    f'Site da empresa: {vaga.empresa_site}',
+                    f'Referência: {vaga.site_referencia}',
+                ] if linha is not None),
+                None,
+                destinatarios,
+            )
+
+        return vaga
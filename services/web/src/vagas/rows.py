@@ -0,0 +1,131 @@
+from django.db.models import QuerySet
+from django.db.models.query import BaseIterable
+from vagas.models import Vaga
+
+# Every attribute a listing row may hold: the primary key, the rendered columns and the search rank annotation.
+ROW_FIELDS = ('id',) + Vaga.LISTING_FIELDS + ('rank',)
+
+class VagaRow:
+    """
+    Read-only row of the homepage listing.
+
+    It holds only the columns the listing renders, read with values_list, and provides the part
+    of the Vaga API used by the row template, at a fraction of the cost of building a model
+    instance for each row.
+    """
+
+    __slots__ = ROW_FIELDS
+
+    Status = Vaga.Status
+
+    LABELS = dict(Vaga.Status.choices)
+
+    def __init__(self, fields: tuple, values: tuple) -> None:
+        """
+        :param fields: Names of the given values, which must be in ROW_FIELDS
+
+        :type fields: tuple
+
+        :param values: Values of a row, in the order of the fields
+
+        :type values: tuple
+        """
+        for field, value in zip(fields, values):
+            setattr(self, field, value)
+
+    def __str__(self) -> str:
+        """
+        Return user-friendly representation of this row, like Vaga does.
+
+        :return: str
+        """
+        return self.empresa_nome
+
+    def __repr__(self) -> str:
+        return f'<VagaRow: {self}>'
+
+    def __eq__(self, other) -> bool:
+        """Compare by primary key, with other rows and with Vaga instances, as model instances do."""
+        if isinstance(other, (VagaRow, Vaga)):
+            return self.pk == other.pk
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.pk)
+
+    @property
+    def pk(self) -> int:
+        return self.id
+
+    def get_situacao_display(self) -> str:
+        """
+        Return the label of the status of the job opportunity.
+
+        :rtype: str
+        """
+        return self.LABELS.get(self.situacao, self.situacao)
+
+
+class VagaRowIterable(BaseIterable):
+    """Iterable yielding a VagaRow for each row of a values_list() queryset."""
+
+    def __iter__(self):
+        queryset = self.queryset
+        query = queryset.query
+        # Columns are selected in this order by the SQL compiler, whatever the order given to values_list().
+        fields = (
+            tuple(query.extra_select)
+            + tuple(query.values_select)
+            + tuple(query.annotation_select)
+        )
+        compiler = query.get_compiler(queryset.db)
+
+        for values in compiler.results_iter(chunked_fetch=self.chunked_fetch, chunk_size=self.chunk_size):
+            yield VagaRow(fields, values)
+
+class VagaRowQuerySet(QuerySet):
+    """
+    Queryset of job opportunities yielding a VagaRow for each row, as returned by listing_rows().
+
+    Like values_list(), which it is built on, it owns the columns it selects and the class of the
+    iterable that turns them into objects. It can be ordered, filtered, sliced and iterated in chunks,
+    which keep both, but values() and values_list() cannot be chained after it, since they would
+    replace them and silently yield plain tuples or dicts instead of rows.
+    """
+
+    def select_listing_columns(self) -> 'VagaRowQuerySet':
+        """
+        Return a copy of this queryset reading only the columns of the listing, and the search rank if annotated.
+
+        :rtype: VagaRowQuerySet
+        """
+        fields = ('id',) + Vaga.LISTING_FIELDS + tuple(name for name in self.query.annotations if name in ROW_FIELDS)
+        clone = super().values_list(*fields)
+        clone._iterable_class = VagaRowIterable
+
+        return clone
+
+    def values(self, *fields, **expressions):
+        raise TypeError('values() cannot be chained after listing_rows().')
+
+    def values_list(self, *fields, flat=False, named=False):
+        raise TypeError('values_list() cannot be chained after listing_rows().')
+
+def listing_rows(vagas: QuerySet) -> VagaRowQuerySet:
+    """
+    Return the given job opportunities as a queryset of VagaRow, reading only the columns of the listing.
+
+    The queryset can still be ordered, filtered, sliced and iterated in chunks, so it can be
+    paginated with CursorPaginator or streamed like a queryset of Vaga, but nothing else may be
+    chained after it, see VagaRowQuerySet.
+
+    :param vagas: Job opportunities, optionally annotated with the search rank
+
+    :type vagas: QuerySet
+
+    :rtype: VagaRowQuerySet
+    """
+    rows = VagaRowQuerySet(model=vagas.model, query=vagas.query.chain(), using=vagas.db)
+
+    return rows.select_listing_columns()
@@ -0,0 +1,26 @@
+from django.db.models.signals import pre_save, post_delete, post_save
+from django.dispatch import receiver
+from vagas.caching import invalidate_detail, invalidate_row, store_detail
+from vagas.models import Vaga
+
+@receiver(pre_save, sender=Vaga)
+def invalidate_row_on_save(sender, instance: Vaga, **kwargs) -> None:
+    """Remove the cached homepage row and detail card of a job opportunity before it is updated."""
+    # auto_now has not been applied yet, so the instance still holds the datetime the row was cached under.
+    if instance.pk is not None and instance.data_hora_atualizacao is not None:
+        invalidate_row(instance.pk, instance.data_hora_atualizacao)
+        invalidate_detail(instance.pk, instance.data_hora_atualizacao)
+
+@receiver(post_save, sender=Vaga)
+def store_detail_on_save(sender, instance: Vaga, raw: bool = False, **kwargs) -> None:
+    """Render the detail card of a saved job opportunity, so that its detail page is served from the cache."""
+    # Without its description at hand, the card is rendered when the detail page is first shown instead.
+    if not raw and Vaga.descricao.related.is_cached(instance):
+        store_detail(instance)
+
+@receiver(post_delete, sender=Vaga)
+def invalidate_row_on_delete(sender, instance: Vaga, **kwargs) -> None:
+    """Remove the cached homepage row and detail card of a deleted job opportunity."""
+    if instance.data_hora_atualizacao is not None:
+        invalidate_row(instance.pk, instance.data_hora_atualizacao)
+        invalidate_detail(instance.pk, instance.data_hora_atualizacao)
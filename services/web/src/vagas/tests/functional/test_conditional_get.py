@@ -0,0 +1,185 @@
+from django.contrib import messages
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from vagas.models import Vaga
+from vagas.tests.helpers import create_vaga
+
+class HomepageConditionalGetTest(TestCase):
+    """
+    As a user of the website
+
+    I want my browser to reuse the homepage it already has when nothing changed
+
+    So that reloading the list of opportunities is fast
+    """
+
+    def setUp(self) -> None:
+        self.vaga = create_vaga(situacao=Vaga.Status.WAITING)
+        self.url = f"{reverse('homepage')}?situacao={Vaga.Status.WAITING}"
+        self.etag = self.client.get(self.url)['ETag']
+
+    def test_should_answer_not_modified_without_rendering(self) -> None:
+        """
+        GIVEN a homepage I have already visited
+
+        WHEN I reload it and nothing has changed
+
+        THEN it should answer 304 Not Modified without rendering the page
+
+        :rtype: None
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=self.etag)
+
+        self.assertEqual(304, response.status_code)
+        self.assertTemplateNotUsed(response, 'homepage.html')
+        self.assertLessEqual(len(queries), 2)
+
+    def test_should_reload_after_creation(self) -> None:
+        """
+        WHEN an opportunity is created
+
+        THEN the homepage should be rendered again
+
+        :rtype: None
+        """
+        create_vaga(situacao=Vaga.Status.WAITING)
+        self.assertEqual(200, self.client.get(self.url, HTTP_IF_NONE_MATCH=self.etag).status_code)
+
+    def test_should_reload_after_update(self) -> None:
+        """
+        WHEN a listed opportunity is updated
+
+        THEN the homepage should be rendered again
+
+        :rtype: None
+        """
+        self.vaga.cargo_titulo = 'Novo título'
+        self.vaga.save()
+        self.assertEqual(200, self.client.get(self.url, HTTP_IF_NONE_MATCH=self.etag).status_code)
+
+    def test_should_reload_after_deletion(self) -> None:
+        """
+        WHEN a listed opportunity is deleted
+
+        THEN the homepage should be rendered again
+
+        :rtype: None
+        """
+        create_vaga(situacao=Vaga.Status.REJECTED)
+        etag = self.client.get(self.url)['ETag']
+        self.vaga.delete()
+        self.assertEqual(200, self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code)
+
+    def test_should_reload_after_opportunity_leaves_filter(self) -> None:
+        """
+        WHEN a listed opportunity has its status changed to one outside the filter
+
+        THEN the homepage should be rendered again
+
+        :rtype: None
+        """
+        Vaga.objects.filter(pk=self.vaga.pk).update(situacao=Vaga.Status.REJECTED)
+        self.assertEqual(200, self.client.get(self.url, HTTP_IF_NONE_MATCH=self.etag).status_code)
+
+    def test_should_depend_on_query_parameters(self) -> None:
+        """
+        WHEN I visit the homepage with other query parameters
+
+        THEN the homepage should be rendered again
+
+        :rtype: None
+        """
+        response = self.client.get(f'{self.url}&data_hora_cadastro_order=A', HTTP_IF_NONE_MATCH=self.etag)
+        self.assertEqual(200, response.status_code)
+
+    def test_should_render_pending_messages(self) -> None:
+        """
+        WHEN there is a message waiting to be displayed to me
+
+        THEN the homepage should be rendered to show the message
+
+        :rtype: None
+        """
+        storage = CookieStorage(RequestFactory().get(self.url))
+        storage.add(messages.SUCCESS, 'Mensagem pendente')
+        response = HttpResponse()
+        storage.update(response)
+        self.client.cookies[storage.cookie_name] = response.cookies[storage.cookie_name].value
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=self.etag)
+        self.assertEqual(200, response.status_code)
+        self.assertContains(response, 'Mensagem pendente')
+
+class VagaConditionalGetTest(TestCase):
+    """
+    As a user of the website
+
+    I want my browser to reuse the pages of an opportunity it already has when nothing changed
+
+    So that reloading them is fast
+    """
+
+    def setUp(self) -> None:
+        self.vaga = create_vaga(situacao=Vaga.Status.WAITING)
+        self.urls = [
+            reverse('oportunidades_detail', args=[self.vaga.pk]),
+            reverse('oportunidades_edit', args=[self.vaga.pk]),
+        ]
+
+    def test_should_answer_not_modified_for_same_etag(self) -> None:
+        """
+        WHEN I reload the detail and edit pages and the opportunity has not changed
+
+        THEN they should answer 304 Not Modified
+
+        :rtype: None
+        """
+        for url in self.urls:
+            etag = self.client.get(url)['ETag']
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(304, response.status_code)
+
+    def test_should_answer_not_modified_since_last_modified(self) -> None:
+        """
+        WHEN I reload the detail and edit pages with the date they were last modified
+
+        THEN they should answer 304 Not Modified
+
+        :rtype: None
+        """
+        for url in self.urls:
+            last_modified = self.client.get(url)['Last-Modified']
+            response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+            self.assertEqual(304, response.status_code)
+
+    def test_should_reload_after_update(self) -> None:
+        """
+        WHEN the opportunity is updated
+
+        THEN the detail and edit pages should be rendered again
+
+        :rtype: None
+        """
+        etags = [self.client.get(url)['ETag'] for url in self.urls]
+        self.vaga.save()
+
+        for url, etag in zip(self.urls, etags):
+            self.assertEqual(200, self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code)
+
+    def test_should_not_find_deleted_opportunity(self) -> None:
+        """
+        WHEN the opportunity is deleted
+
+        THEN the detail and edit pages should not be found
+
+        :rtype: None
+        """
+        etags = [self.client.get(url)['ETag'] for url in self.urls]
+        self.vaga.delete()
+
+        for url, etag in zip(self.urls, etags):
+            self.assertEqual(404, self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code)
@@ -263,20 +263,19 @@ class HomePageTest(TestCase):
 
         WHEN I visit the homepage
 
-        THEN it should have a way to filter the opportunities by status
+        THEN it should have a way to filter the opportunities by status, showing how many opportunities have each status
 
         :rtype: None
         """
         response = self.client.get(self.url)
         situacao = response.context['form'].fields['situacao']
         self.assertIsInstance(situacao, ChoiceField)
-        self.assertIn(('C', 'Candidatado',), situacao.choices)
-        self.assertIn(('W', 'Aguardando retorno',), situacao.choices)
-        self.assertIn(('S', 'Entrevista agendada',), situacao.choices)
-        self.assertIn(('R', 'Rejeitado',), situacao.choices)
-        self.assertIn(('A', 'Aprovado',), situacao.choices)
-        self.assertIn((None, 'Todas',), situacao.choices)
-        self.assertEqual((None, 'Todas',), situacao.initial)
+        self.assertIn(('C', 'Candidatado (0)',), situacao.choices)
+        self.assertIn(('W', 'Aguardando retorno (0)',), situacao.choices)
+        self.assertIn(('S', 'Entrevista agendada (0)',), situacao.choices)
+        self.assertIn(('R', 'Rejeitado (0)',), situacao.choices)
+        self.assertIn(('A', 'Aprovado (1)',), situacao.choices)
+        self.assertEqual([], situacao.initial)
     
     def test_should_have_order_by_data_hora_cadastro(self) -> None:
         """
@@ -0,0 +1,66 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from vagas.models import Vaga
+from vagas.tests.helpers import create_vaga
+
+class OportunidadesAgendaTest(TestCase):
+    """
+    As a user of the website
+
+    I want to see my upcoming interviews grouped by day
+
+    So that I know which interviews I have this week without reading the whole list
+    """
+
+    def setUp(self) -> None:
+        """
+        GIVEN interviews scheduled for tomorrow and the day after, a past interview and an opportunity no longer waiting for its interview
+
+        :rtype: None
+        """
+        amanha = timezone.localtime().replace(hour=10, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        self.depois = create_vaga(empresa_nome='Empresa Depois', data_hora_entrevista=amanha + timedelta(days=1), situacao=Vaga.Status.INTERVIEW_SCHEDULED)
+        self.tarde = create_vaga(empresa_nome='Empresa Tarde', data_hora_entrevista=amanha + timedelta(hours=5), situacao=Vaga.Status.INTERVIEW_SCHEDULED)
+        self.manha = create_vaga(empresa_nome='Empresa Manhã', data_hora_entrevista=amanha, situacao=Vaga.Status.INTERVIEW_SCHEDULED)
+        self.passada = create_vaga(empresa_nome='Empresa Passada', data_hora_entrevista=amanha - timedelta(days=3), situacao=Vaga.Status.INTERVIEW_SCHEDULED)
+        self.rejeitada = create_vaga(empresa_nome='Empresa Rejeitada', data_hora_entrevista=amanha, situacao=Vaga.Status.REJECTED)
+        self.url = reverse('oportunidades_agenda')
+
+    def test_should_group_upcoming_interviews_by_day(self) -> None:
+        """
+        WHEN I visit the agenda
+
+        THEN the upcoming scheduled interviews should be shown grouped by day in chronological order
+
+        :rtype: None
+        """
+        response = self.client.get(self.url)
+        agenda = response.context['agenda']
+        self.assertEqual([[self.manha, self.tarde], [self.depois]], [vagas for dia, vagas in agenda])
+        self.assertEqual(timezone.localtime(self.manha.data_hora_entrevista).date(), agenda[0][0])
+        self.assertNotContains(response, 'Empresa Passada')
+        self.assertNotContains(response, 'Empresa Rejeitada')
+        self.assertContains(response, reverse('oportunidades_detail', args=[self.manha.pk]))
+
+    def test_should_show_message_without_interviews(self) -> None:
+        """
+        WHEN I visit the agenda without upcoming interviews
+
+        THEN a message should say so
+
+        :rtype: None
+        """
+        Vaga.objects.filter(situacao=Vaga.Status.INTERVIEW_SCHEDULED).update(situacao=Vaga.Status.WAITING)
+        self.assertContains(self.client.get(self.url), 'Nenhuma entrevista agendada.')
+
+    def test_should_be_linked_from_navbar(self) -> None:
+        """
+        WHEN I visit the homepage
+
+        THEN there should be a link to the agenda
+
+        :rtype: None
+        """
+        self.assertContains(self.client.get(reverse('homepage')), f'href="{self.url}"')
@@ -0,0 +1,114 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from vagas.models import Vaga
+from vagas.tests.helpers import create_vaga
+
+class OportunidadesAgendaIcsTest(TestCase):
+    """
+    As a user of the website
+
+    I want to subscribe to my scheduled interviews in my calendar client
+
+    So that the interviews show up next to my other appointments
+    """
+
+    def setUp(self) -> None:
+        """
+        GIVEN a scheduled interview and an opportunity without an interview
+
+        :rtype: None
+        """
+        cache.clear()
+        self.entrevista = timezone.localtime().replace(microsecond=0) + timedelta(days=1)
+        self.vaga = create_vaga(empresa_nome='Empresa Alfa', cargo_titulo='Desenvolvedor; Python, Django', data_hora_entrevista=self.entrevista, situacao=Vaga.Status.INTERVIEW_SCHEDULED)
+        self.outra = create_vaga(empresa_nome='Empresa Beta', cargo_titulo='Desenvolvedor; Python, Django', data_hora_entrevista=self.entrevista, situacao=Vaga.Status.WAITING)
+        self.url = reverse('oportunidades_agenda_ics')
+        self.response = self.client.get(self.url)
+        self.content = self.response.content.decode()
+
+    def test_should_have_one_event_per_scheduled_interview(self) -> None:
+        """
+        WHEN I download the feed
+
+        THEN it should have one event per scheduled interview, with the title, the company and the address of the opportunity
+
+        :rtype: None
+        """
+        self.assertEqual('text/calendar; charset=utf-8', self.response['Content-Type'])
+        self.assertTrue(self.content.startswith('BEGIN:VCALENDAR\r\n'))
+        self.assertTrue(self.content.endswith('END:VCALENDAR\r\n'))
+        self.assertEqual(1, self.content.count('BEGIN:VEVENT'))
+        self.assertIn(f'UID:vaga-{self.vaga.pk}@cadastrevagas\r\n', self.content)
+        self.assertIn('SUMMARY:Entrevista: Desenvolvedor\\; Python\\, Django - Empresa Alfa\r\n', self.content)
+        self.assertIn(f'URL:http://testserver{self.vaga.get_absolute_url()}\r\n', self.content)
+        inicio = self.vaga.data_hora_entrevista.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+        self.assertIn(f'DTSTART:{inicio}\r\n', self.content)
+        self.assertNotIn('Empresa Beta', self.content)
+
+    def test_should_fold_long_lines(self) -> None:
+        """
+        WHEN a line of the feed is longer than 75 octets
+
+        THEN it should be folded, without changing its content
+
+        :rtype: None
+        """
+        self.vaga.empresa_nome = 'Ação ' * 20
+        self.vaga.save()
+        content = self.client.get(self.url).content
+
+        self.assertTrue(all(len(line) <= 75 for line in content.split(b'\r\n')))
+        self.assertIn(f"Entrevista: Desenvolvedor\\; Python\\, Django - {'Ação ' * 20}".encode(), content.replace(b'\r\n ', b''))
+
+    def test_should_answer_not_modified(self) -> None:
+        """
+        WHEN my calendar client polls the feed and nothing has changed
+
+        THEN it should answer 304 Not Modified
+
+        :rtype: None
+        """
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=self.response['ETag'])
+        self.assertEqual(304, response.status_code)
+
+    def test_should_change_after_update(self) -> None:
+        """
+        WHEN a scheduled interview is rescheduled or an opportunity leaves the scheduled status
+
+        THEN the feed should be sent again with the change
+
+        :rtype: None
+        """
+        self.vaga.data_hora_entrevista += timedelta(hours=2)
+        self.vaga.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=self.response['ETag'])
+        self.assertEqual(200, response.status_code)
+        inicio = self.vaga.data_hora_entrevista.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+        self.assertIn(f'DTSTART:{inicio}', response.content.decode())
+
+        self.vaga.situacao = Vaga.Status.REJECTED
+        self.vaga.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(200, response.status_code)
+        self.assertNotIn('BEGIN:VEVENT', response.content.decode())
+
+    def test_should_render_only_changed_events(self) -> None:
+        """
+        WHEN another interview is scheduled
+
+        THEN only its event should be read and serialized, the others being reused
+
+        :rtype: None
+        """
+        create_vaga(empresa_nome='Empresa Gama', cargo_titulo='Desenvolvedor; Python, Django', data_hora_entrevista=self.entrevista, situacao=Vaga.Status.INTERVIEW_SCHEDULED)
+        cached_content = self.content
+
+        # ETag, computed once for the condition and the cache key, scheduled rows, and the single missing row.
+        with self.assertNumQueries(2 + 1 + 1):
+            content = self.client.get(self.url).content.decode()
+
+        self.assertEqual(2, content.count('BEGIN:VEVENT'))
+        self.assertIn(cached_content[cached_content.index('BEGIN:VEVENT'):cached_content.index('END:VCALENDAR')], content)
@@ -0,0 +1,203 @@
+import json
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from vagas.forms import OportunidadesFilterForm
+from vagas.models import Vaga, VagaDescricao
+
+@override_settings(VAGAS_PAGE_SIZE=2)
+class OportunidadesApiListTest(TestCase):
+    """
+    As a developer writing scripts
+
+    I want to list the job opportunities as JSON
+
+    So that I don't need to scrape the homepage
+    """
+
+    def setUp(self) -> None:
+        """
+        GIVEN five previously registered opportunities and a page size of two
+
+        :rtype: None
+        """
+        self.vagas = [
+            Vaga.objects.create(
+                empresa_nome=f'Minha empresa {i}',
+                empresa_site=f'https://empresa{i}.com.br',
+                cargo_titulo=f'Cargo título {i}',
+                cargo_descricao='Descrição do cargo',
+                site_referencia='https://sitereferencia.com.br',
+                situacao=Vaga.Status.WAITING if i % 2 else Vaga.Status.APPLIED,
+            )
+            for i in range(5)
+        ]
+        self.url = reverse('oportunidades_api_list')
+
+    def get_json(self, url: str, status_code: int = 200) -> dict:
+        response = self.client.get(url)
+        self.assertEqual(status_code, response.status_code)
+        self.assertEqual('application/json', response['Content-Type'])
+        content = b''.join(response.streaming_content) if response.streaming else response.content
+
+        return json.loads(content)
+
+    def test_should_list_first_page(self) -> None:
+        """
+        WHEN I request the list of opportunities
+
+        THEN the newest opportunities that fit in a page should be returned with the fields shown on the homepage
+
+        :rtype: None
+        """
+        data = self.get_json(self.url)
+        self.assertEqual([self.vagas[4].pk, self.vagas[3].pk], [row['id'] for row in data['results']])
+        self.assertEqual({'id', *Vaga.LISTING_FIELDS}, set(data['results'][0]))
+        self.assertEqual('Minha empresa 4', data['results'][0]['empresa_nome'])
+        self.assertIsNotNone(data['next'])
+        self.assertIsNone(data['previous'])
+
+    def test_should_follow_cursors(self) -> None:
+        """
+        WHEN I follow the next links until the last page and then the previous link
+
+        THEN every opportunity should be returned exactly once and the previous page should be returned again
+
+        :rtype: None
+        """
+        pages = [self.get_json(self.url)]
+
+        while pages[-1]['next']:
+            pages.append(self.get_json(pages[-1]['next']))
+
+        ids = [row['id'] for page in pages for row in page['results']]
+        self.assertEqual([vaga.pk for vaga in reversed(self.vagas)], ids)
+        self.assertEqual(pages[-2]['results'], self.get_json(pages[-1]['previous'])['results'])
+
+    def test_should_filter_and_order(self) -> None:
+        """
+        WHEN I filter the opportunities by status and order them from the oldest
+
+        THEN only the opportunities with that status should be returned, oldest first
+
+        :rtype: None
+        """
+        data = self.get_json(
+            f'{self.url}?situacao={Vaga.Status.WAITING}'
+            f'&data_hora_cadastro_order={OportunidadesFilterForm.DataHoraCadastroOrder.OLDEST}'
+        )
+        self.assertEqual([self.vagas[1].pk, self.vagas[3].pk], [row['id'] for row in data['results']])
+        self.assertIsNone(data['next'])
+
+    def test_should_return_only_requested_fields(self) -> None:
+        """
+        WHEN I request only some fields
+
+        THEN each opportunity should contain only those fields
+
+        :rtype: None
+        """
+        data = self.get_json(f'{self.url}?fields=empresa_nome,situacao')
+        self.assertEqual([{'empresa_nome': 'Minha empresa 4', 'situacao': Vaga.Status.APPLIED}], data['results'][:1])
+        self.assertEqual(['Minha empresa 2'], [row['empresa_nome'] for row in self.get_json(data['next'])['results'][:1]])
+
+    def test_should_reject_unknown_fields(self) -> None:
+        """
+        WHEN I request a field that does not exist
+
+        THEN an error should be returned
+
+        :rtype: None
+        """
+        data = self.get_json(f'{self.url}?fields=empresa_nome,senha', status_code=400)
+        self.assertIn('senha', data['error'])
+
+    def test_should_reject_invalid_cursor(self) -> None:
+        """
+        WHEN I request a page with an invalid cursor
+
+        THEN an error should be returned
+
+        :rtype: None
+        """
+        self.get_json(f'{self.url}?after=invalido', status_code=400)
+
+    def test_should_not_render_templates(self) -> None:
+        """
+        WHEN I request the list of opportunities
+
+        THEN no template should be rendered
+
+        :rtype: None
+        """
+        with self.assertTemplateNotUsed('homepage_row.html'):
+            b''.join(self.client.get(self.url).streaming_content)
+
+class OportunidadesApiDetailTest(TestCase):
+    """
+    As a developer writing scripts
+
+    I want to fetch a job opportunity as JSON
+
+    So that I don't need to scrape its detail page
+    """
+
+    def setUp(self) -> None:
+        self.vaga = Vaga.objects.create(
+            empresa_nome='Minha empresa',
+            empresa_site='https://meusite.com.br',
+            empresa_telefone_celular='(11) 98765-4321',
+            cargo_titulo='Título do cargo',
+            cargo_descricao='Descrição do cargo',
+            site_referencia='https://sitereferencia.com.br',
+            situacao=Vaga.Status.WAITING,
+        )
+        self.url = reverse('oportunidades_api_detail', args=[self.vaga.pk])
+
+    def test_should_return_all_fields(self) -> None:
+        """
+        WHEN I fetch an opportunity
+
+        THEN all of its fields should be returned
+
+        :rtype: None
+        """
+        data = self.client.get(self.url).json()
+        self.assertEqual(self.vaga.pk, data['id'])
+        self.assertEqual('Descrição do cargo', data['cargo_descricao'])
+        self.assertEqual('(11) 98765-4321', data['empresa_telefone_celular'])
+        self.assertIn('data_hora_atualizacao', data)
+
+    def test_should_return_only_requested_fields(self) -> None:
+        """
+        WHEN I fetch an opportunity requesting only some fields
+
+        THEN only those fields should be returned
+
+        :rtype: None
+        """
+        data = self.client.get(f'{self.url}?fields=cargo_titulo').json()
+        self.assertEqual({'cargo_titulo': 'Título do cargo'}, data)
+
+    def test_should_return_empty_description(self) -> None:
+        """
+        WHEN I fetch an opportunity without a description
+
+        THEN its description should be returned empty
+
+        :rtype: None
+        """
+        VagaDescricao.objects.filter(vaga=self.vaga).delete()
+        data = self.client.get(f'{self.url}?fields=id,cargo_descricao').json()
+        self.assertEqual({'id': self.vaga.pk, 'cargo_descricao': ''}, data)
+
+    def test_should_not_find_missing_opportunity(self) -> None:
+        """
+        WHEN I fetch an opportunity that does not exist
+
+        THEN an error should be returned
+
+        :rtype: None
+        """
+        response = self.client.get(reverse('oportunidades_api_detail', args=[self.vaga.pk + 1]))
+        self.assertEqual(404, response.status_code)
+        self.assertIn('error', response.json())
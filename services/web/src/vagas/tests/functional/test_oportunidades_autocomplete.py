@@ -0,0 +1,68 @@
+from django.test import TestCase
+from django.urls import reverse
+from vagas.autocomplete import autocompletes
+from vagas.models import Vaga
+
+class OportunidadesAutocompleteTest(TestCase):
+    """
+    As a user of the website
+
+    I want the company name and the job title to be completed while I type them
+
+    So that I can register opportunities faster and with consistent names
+    """
+
+    def setUp(self) -> None:
+        """
+        GIVEN previously registered opportunities
+
+        :rtype: None
+        """
+        for autocomplete in autocompletes.values():
+            autocomplete.clear()
+
+        for empresa_nome, cargo_titulo in [('Itaú Unibanco', 'Desenvolvedor Python'), ('Itautec', 'Desenvolvedora Java')]:
+            Vaga.objects.create(
+                empresa_nome=empresa_nome,
+                empresa_site='https://meusite.com.br',
+                cargo_titulo=cargo_titulo,
+                site_referencia='https://sitereferencia.com.br',
+            )
+
+    def test_should_link_fields_to_autocomplete(self) -> None:
+        """
+        WHEN I visit the page for registering an opportunity
+
+        THEN the company name and the job title fields should be linked to their suggestions
+
+        :rtype: None
+        """
+        response = self.client.get(reverse('oportunidades_new'))
+
+        for field_name in ['empresa_nome', 'cargo_titulo']:
+            self.assertContains(response, f'''data-autocomplete-url="{reverse('oportunidades_api_autocomplete', args=[field_name])}"''')
+            self.assertContains(response, f'<datalist id="{field_name}_sugestoes">')
+
+    def test_should_suggest_values(self) -> None:
+        """
+        WHEN I type the beginning of a registered company name or job title
+
+        THEN the registered values should be suggested
+
+        :rtype: None
+        """
+        response = self.client.get(reverse('oportunidades_api_autocomplete', args=['empresa_nome']), {'q': 'ita'})
+        self.assertEqual({'sugestoes': ['Itaú Unibanco', 'Itautec']}, response.json())
+        response = self.client.get(reverse('oportunidades_api_autocomplete', args=['cargo_titulo']), {'q': 'desenvolvedora'})
+        self.assertEqual({'sugestoes': ['Desenvolvedora Java']}, response.json())
+
+    def test_should_not_complete_other_fields(self) -> None:
+        """
+        WHEN the autocomplete of a field that is not completed is requested
+
+        THEN it should not be found
+
+        :rtype: None
+        """
+        response = self.client.get(reverse('oportunidades_api_autocomplete', args=['empresa_email']), {'q': 'a'})
+        self.assertEqual(404, response.status_code)
@@ -0,0 +1,120 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from vagas.models import Vaga
+from vagas.tests.helpers import create_vaga
+
+class OportunidadesEmpresaFilterTest(TestCase):
+    """
+    As a user of the website
+
+    I want to filter the job opportunities by company even if I don't remember how I spelled its name
+
+    So that I can find every opportunity of a company
+    """
+
+    def setUp(self) -> None:
+        """
+        GIVEN opportunities registered with different spellings of the same company
+
+        :rtype: None
+        """
+        self.itau = [create_vaga(empresa_nome='Itaú', situacao=Vaga.Status.WAITING), create_vaga(empresa_nome='Itau Unibanco', situacao=Vaga.Status.WAITING), create_vaga(empresa_nome='itau', situacao=Vaga.Status.WAITING)]
+        self.outra = create_vaga(empresa_nome='Nubank', situacao=Vaga.Status.WAITING)
+        self.url = reverse('homepage')
+
+    def test_should_have_empresa_filter(self) -> None:
+        """
+        WHEN I visit the homepage
+
+        THEN there should be a field to filter by company
+
+        :rtype: None
+        """
+        self.assertIn('empresa', self.client.get(self.url).context['form'].fields)
+
+    def test_should_ignore_case_and_accents(self) -> None:
+        """
+        WHEN I filter by a company name without accents
+
+        THEN every opportunity of a company with a similar name should be shown
+
+        :rtype: None
+        """
+        response = self.client.get(f'{self.url}?empresa=ITAU')
+        self.assertCountEqual(self.itau, response.context['vagas'])
+        self.assertContains(response, 'Total: 3')
+        self.assertEqual('ITAU', response.context['form'].fields['empresa'].initial)
+
+    def test_should_tolerate_typos(self) -> None:
+        """
+        WHEN I filter by a misspelled company name
+
+        THEN the opportunities of the company should be shown
+
+        :rtype: None
+        """
+        self.assertIn(self.itau[1], self.client.get(f'{self.url}?empresa=itau unibamco').context['vagas'])
+
+    @override_settings(VAGAS_MAX_FILTERED_TOTAL=2)
+    def test_should_limit_total(self) -> None:
+        """
+        WHEN more opportunities match than are counted
+
+        THEN the total should say that there are more of them
+
+        :rtype: None
+        """
+        self.assertContains(self.client.get(f'{self.url}?empresa=itau'), 'Total: mais de 2')
+
+class EmpresasSemelhantesTest(TestCase):
+    """
+    As a user of the website
+
+    I want to be told about companies with similar names while registering an opportunity
+
+    So that I don't register the same company twice with different spellings
+    """
+
+    def setUp(self) -> None:
+        """
+        GIVEN opportunities registered with different spellings of the same company
+
+        :rtype: None
+        """
+        for empresa_nome in ['Itaú Unibanco', 'Itaú Unibanco', 'Banco Itaú', 'Nubank']:
+            create_vaga(empresa_nome=empresa_nome, situacao=Vaga.Status.WAITING)
+
+        self.url = reverse('oportunidades_api_empresas')
+
+    def test_should_have_hint_on_create_form(self) -> None:
+        """
+        WHEN I visit the page for registering an opportunity
+
+        THEN the company name field should be linked to the hint
+
+        :rtype: None
+        """
+        response = self.client.get(reverse('oportunidades_new'))
+        self.assertContains(response, f'data-semelhantes-url="{self.url}"')
+        self.assertContains(response, '<datalist id="empresa_nome_sugestoes">')
+
+    def test_should_suggest_similar_companies(self) -> None:
+        """
+        WHEN I type a company name similar to registered ones
+
+        THEN each of the registered names should be suggested once
+
+        :rtype: None
+        """
+        data = self.client.get(f'{self.url}?empresa_nome=itau').json()
+        self.assertCountEqual(['Itaú Unibanco', 'Banco Itaú'], data['empresas'])
+
+    def test_should_not_suggest_for_short_names(self) -> None:
+        """
+        WHEN I have typed too few characters
+
+        THEN no company should be suggested
+
+        :rtype: None
+        """
+        self.assertEqual({'empresas': []}, self.client.get(f'{self.url}?empresa_nome=it').json())
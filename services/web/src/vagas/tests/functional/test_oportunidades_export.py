@@ -0,0 +1,162 @@
+import csv
+import gzip
+import json
+import os
+import tempfile
+from datetime import datetime
+from io import StringIO
+from django.core.management import call_command
+from django.http import StreamingHttpResponse
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from vagas.forms import OportunidadesFilterForm
+from vagas.models import Vaga
+
+@override_settings(VAGAS_PAGE_SIZE=2, VAGAS_STREAM_CHUNK_SIZE=2)
+class OportunidadesExportTest(TestCase):
+    """
+    As a user of the website
+
+    I want to export the job opportunities I'm looking at
+
+    So that I can work on them in a spreadsheet or another tool
+    """
+
+    def setUp(self) -> None:
+        """
+        GIVEN five previously registered opportunities, the first with phones, an interview and a description
+
+        :rtype: None
+        """
+        self.entrevista = timezone.make_aware(datetime(2030, 5, 20, 14, 30))
+        self.vagas = [
+            Vaga.objects.create(
+                empresa_nome=f'Minha empresa {i}',
+                empresa_site=f'https://empresa{i}.com.br',
+                empresa_telefone_celular='(11) 98765-4321' if i == 0 else '',
+                empresa_telefone_comercial='(11) 3456-7890' if i == 0 else '',
+                cargo_titulo=f'Cargo título {i}',
+                cargo_descricao='Experiência com Python, "Django" e\nPostgreSQL.' if i == 0 else '',
+                site_referencia='https://sitereferencia.com.br',
+                data_hora_entrevista=self.entrevista if i == 0 else None,
+                situacao=Vaga.Status.INTERVIEW_SCHEDULED if i == 0 else Vaga.Status.WAITING if i % 2 else Vaga.Status.APPLIED,
+            )
+            for i in range(5)
+        ]
+        self.url = reverse('oportunidades_export')
+
+    def get_content(self, querystring: str) -> bytes:
+        response = self.client.get(f'{self.url}?{querystring}')
+        self.assertIsInstance(response, StreamingHttpResponse)
+
+        return b''.join(response.streaming_content)
+
+    def read_csv(self, content: bytes) -> list:
+        return list(csv.DictReader(StringIO(content.decode(), newline='')))
+
+    def test_should_have_export_links_keeping_the_filter(self) -> None:
+        """
+        WHEN I visit the homepage with a filter, on any page
+
+        THEN the export links should keep the filter
+
+        :rtype: None
+        """
+        response = self.client.get(reverse('homepage'), {'situacao': Vaga.Status.WAITING, 'exibir': 'todas'})
+        content = b''.join(response.streaming_content).decode()
+        self.assertIn('Exportar', content)
+        self.assertIn(f'{self.url}?situacao={Vaga.Status.WAITING}&amp;formato=csv&amp;compactar=1', content)
+
+    def test_should_export_csv(self) -> None:
+        """
+        WHEN I export the opportunities as CSV
+
+        THEN every opportunity should be in the file, newest first, with phones formatted and as digits
+
+        :rtype: None
+        """
+        response = self.client.get(f'{self.url}?formato=csv')
+        self.assertEqual('text/csv; charset=utf-8', response['Content-Type'])
+        self.assertRegex(response['Content-Disposition'], r'^attachment; filename="vagas-\d{8}-\d{4}\.csv"$')
+        rows = self.read_csv(b''.join(response.streaming_content))
+        self.assertEqual([f'Cargo título {i}' for i in reversed(range(5))], [row['cargo_titulo'] for row in rows])
+        row = rows[-1]
+        self.assertEqual(str(self.vagas[0].pk), row['id'])
+        self.assertEqual('(11) 98765-4321', row['empresa_telefone_celular'])
+        self.assertEqual('11987654321', row['empresa_telefone_celular_digitos'])
+        self.assertEqual('(11) 3456-7890', row['empresa_telefone_comercial'])
+        self.assertEqual('1134567890', row['empresa_telefone_comercial_digitos'])
+        self.assertEqual('Experiência com Python, "Django" e\nPostgreSQL.', row['cargo_descricao'])
+        self.assertEqual('20/05/2030 14:30', row['data_hora_entrevista'])
+        self.assertEqual(Vaga.Status.INTERVIEW_SCHEDULED, row['situacao'])
+        self.assertEqual(timezone.localtime(self.vagas[0].data_hora_cadastro).isoformat(), row['data_hora_cadastro'])
+        self.assertEqual(('', '', '', ''), (rows[0]['empresa_telefone_celular'], rows[0]['empresa_telefone_celular_digitos'], rows[0]['cargo_descricao'], rows[0]['data_hora_entrevista']))
+
+    def test_should_export_only_filtered_opportunities(self) -> None:
+        """
+        WHEN I export the opportunities with a status, oldest first, as compressed NDJSON
+
+        THEN only the opportunities with that status should be in the file, oldest first
+
+        :rtype: None
+        """
+        response = self.client.get(self.url, {
+            'formato': 'ndjson',
+            'compactar': '1',
+            'situacao': Vaga.Status.WAITING,
+            'data_hora_cadastro_order': OportunidadesFilterForm.DataHoraCadastroOrder.OLDEST,
+        })
+        self.assertEqual('application/gzip', response['Content-Type'])
+        self.assertTrue(response['Content-Disposition'].endswith('.ndjson.gz"'))
+        rows = [json.loads(line) for line in gzip.decompress(b''.join(response.streaming_content)).decode().splitlines()]
+        self.assertEqual(['Cargo título 1', 'Cargo título 3'], [row['cargo_titulo'] for row in rows])
+        self.assertEqual(self.vagas[1].pk, rows[0]['id'])
+        self.assertEqual('', rows[0]['empresa_telefone_celular_digitos'])
+        self.assertIsNone(rows[0]['data_hora_entrevista'])
+
+    def test_should_export_only_search_results(self) -> None:
+        """
+        WHEN I export the results of a search
+
+        THEN only the matching opportunities should be in the file
+
+        :rtype: None
+        """
+        rows = self.read_csv(gzip.decompress(self.get_content('busca=django&compactar=1')))
+        self.assertEqual(['Cargo título 0'], [row['cargo_titulo'] for row in rows])
+
+    def test_should_reject_unknown_format(self) -> None:
+        """
+        WHEN I ask for an unknown format
+
+        THEN the request should be rejected
+
+        :rtype: None
+        """
+        self.assertEqual(400, self.client.get(f'{self.url}?formato=xlsx').status_code)
+
+    def test_should_export_a_file_the_import_accepts(self) -> None:
+        """
+        WHEN I export the opportunities as CSV and import the file
+
+        THEN the imported opportunities should have the same values
+
+        :rtype: None
+        """
+        content = self.get_content('formato=csv')
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'vagas.csv')
+
+            with open(path, 'wb') as file:
+                file.write(content)
+
+            Vaga.objects.all().delete()
+            call_command('import_vagas', path, stdout=StringIO())
+
+        vaga = Vaga.objects.get(cargo_titulo='Cargo título 0')
+        self.assertEqual(5, Vaga.objects.count())
+        self.assertEqual('(11) 98765-4321', str(vaga.empresa_telefone_celular))
+        self.assertEqual(self.entrevista, vaga.data_hora_entrevista)
+        self.assertEqual('Experiência com Python, "Django" e\nPostgreSQL.', vaga.cargo_descricao)
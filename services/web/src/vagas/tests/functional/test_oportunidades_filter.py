@@ -147,7 +147,7 @@ class OportunidadesFilterTest(TestCase):
         vagas = list(response.context['vagas'])
         situacao_field = response.context['form'].fields['situacao']
         self.applied.reverse()
-        self.assertEqual(Vaga.Status.APPLIED, situacao_field.initial)
+        self.assertEqual([Vaga.Status.APPLIED], situacao_field.initial)
         self.assertEqual(self.applied, vagas)
 
     def test_should_show_only_status_interview_scheduled(self) -> None:
@@ -162,7 +162,7 @@ class OportunidadesFilterTest(TestCase):
         vagas = list(response.context['vagas'])
         situacao_field = response.context['form'].fields['situacao']
         self.interview_scheduled.reverse()
-        self.assertEqual(Vaga.Status.INTERVIEW_SCHEDULED, situacao_field.initial)
+        self.assertEqual([Vaga.Status.INTERVIEW_SCHEDULED], situacao_field.initial)
         self.assertEqual(self.interview_scheduled, vagas)
 
     def test_should_show_only_status_waiting(self) -> None:
@@ -177,7 +177,7 @@ class OportunidadesFilterTest(TestCase):
         vagas = list(response.context['vagas'])
         situacao_field = response.context['form'].fields['situacao']
         self.waiting.reverse()
-        self.assertEqual(Vaga.Status.WAITING, situacao_field.initial)
+        self.assertEqual([Vaga.Status.WAITING], situacao_field.initial)
         self.assertEqual(self.waiting, vagas)
 
     def test_should_show_only_status_rejected(self) -> None:
@@ -192,12 +192,12 @@ class OportunidadesFilterTest(TestCase):
         situacao_field = response.context['form'].fields['situacao']
         vagas = list(response.context['vagas'])
         self.rejected.reverse()
-        self.assertEqual(Vaga.Status.REJECTED, situacao_field.initial)
+        self.assertEqual([Vaga.Status.REJECTED], situacao_field.initial)
         self.assertEqual(self.rejected, vagas)
     
     def test_should_show_all(self) -> None:
         """
-        WHEN I submit the filter with a choice of 'Todas' for the status of the opportunity
+        WHEN I submit the filter without choosing any status of the opportunity
 
         THEN all opportunities, ordered by datetime of registration in descending order, should be shown
 
@@ -207,7 +207,7 @@ class OportunidadesFilterTest(TestCase):
         actual = list(response.context['vagas'])
         situacao_field = response.context['form'].fields['situacao']
         expected = list(Vaga.objects.order_by('-data_hora_cadastro'))
-        self.assertEqual((None, 'Todas',), situacao_field.initial)
+        self.assertEqual([], situacao_field.initial)
         self.assertEqual(expected, actual)
     
     def test_should_show_by_oldest_data_hora_cadastro(self) -> None:
@@ -238,4 +238,32 @@ class OportunidadesFilterTest(TestCase):
         expected = list(Vaga.objects.order_by('-data_hora_cadastro'))
         actual = list(response.context['vagas'])
         self.assertEqual(OportunidadesFilterForm.DataHoraCadastroOrder.NEWEST, data_hora_cadastro_order.initial)
-        self.assertEqual(expected, actual)
\ No newline at end of file
+        self.assertEqual(expected, actual)
+
+    def test_should_show_several_statuses(self) -> None:
+        """
+        WHEN I submit the filter with more than one status of the opportunity
+
+        THEN the opportunities with any of those statuses, ordered by datetime of registration in descending order, should be shown
+
+        :rtype: None
+        """
+        response = self.client.get(f'{self.url}?situacao={Vaga.Status.WAITING}&situacao={Vaga.Status.APPLIED}')
+        expected = list(Vaga.objects.filter(situacao__in=[Vaga.Status.APPLIED, Vaga.Status.WAITING]).order_by('-data_hora_cadastro'))
+        self.assertEqual(expected, list(response.context['vagas']))
+        self.assertEqual([Vaga.Status.APPLIED, Vaga.Status.WAITING], response.context['form'].fields['situacao'].initial)
+        self.assertContains(response, f'Total: {len(expected)}')
+
+    def test_should_ignore_order_of_statuses(self) -> None:
+        """
+        WHEN I submit the filter with the same statuses in a different order or repeated
+
+        THEN the page and its links should be the same
+
+        :rtype: None
+        """
+        response = self.client.get(f'{self.url}?situacao={Vaga.Status.WAITING}&situacao={Vaga.Status.APPLIED}&page_size=1')
+        other = self.client.get(f'{self.url}?page_size=1&situacao={Vaga.Status.APPLIED}&situacao={Vaga.Status.WAITING}&situacao={Vaga.Status.APPLIED}')
+        self.assertEqual(response['ETag'], other['ETag'])
+        self.assertEqual(response.context['querystring'], other.context['querystring'])
+        self.assertEqual(f'page_size=1&situacao={Vaga.Status.APPLIED}&situacao={Vaga.Status.WAITING}', response.context['querystring'])
@@ -0,0 +1,105 @@
+from datetime import timedelta
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from vagas.models import Vaga
+
+@override_settings(VAGAS_INTERVIEW_DURATION=60)
+class OportunidadesInterviewConflictTest(TestCase):
+    """
+    As a user of the website
+
+    I want to be warned when an interview overlaps another one I have already scheduled
+
+    So that I do not book two interviews at the same time
+    """
+
+    def setUp(self) -> None:
+        """
+        GIVEN an interview scheduled for tomorrow at 10:00
+
+        :rtype: None
+        """
+        self.inicio = timezone.localtime().replace(hour=10, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        self.agendada = Vaga.objects.create(
+            empresa_nome='Empresa Agendada',
+            empresa_site='https://meusite.com.br',
+            cargo_titulo='Desenvolvedor Python',
+            site_referencia='https://sitereferencia.com.br',
+            data_hora_entrevista=self.inicio,
+            situacao=Vaga.Status.INTERVIEW_SCHEDULED,
+        )
+        self.data = {
+            'empresa_nome': 'Outra empresa',
+            'empresa_site': 'https://outraempresa.com.br',
+            'cargo_titulo': 'Analista de dados',
+            'site_referencia': 'https://sitereferencia.com.br',
+            'situacao': Vaga.Status.INTERVIEW_SCHEDULED,
+        }
+
+    def post(self, url: str, data_hora_entrevista):
+        return self.client.post(url, data={**self.data, 'data_hora_entrevista': data_hora_entrevista.strftime('%d/%m/%Y %H:%M')})
+
+    def test_should_reject_overlapping_interview(self) -> None:
+        """
+        WHEN I register an interview starting before the scheduled one ends
+
+        THEN it should display an error message naming the conflicting opportunity
+
+        :rtype: None
+        """
+        response = self.post(reverse('oportunidades_new'), self.inicio + timedelta(minutes=30))
+        self.assertContains(response, 'A entrevista coincide com a entrevista de Desenvolvedor Python na empresa Empresa Agendada')
+        self.assertContains(response, self.inicio.strftime('%d/%m/%Y %H:%M'))
+        self.assertFalse(Vaga.objects.filter(empresa_nome='Outra empresa').exists())
+
+    def test_should_accept_consecutive_interview(self) -> None:
+        """
+        WHEN I register an interview starting when the scheduled one ends
+
+        THEN it should be registered
+
+        :rtype: None
+        """
+        response = self.post(reverse('oportunidades_new'), self.inicio + timedelta(minutes=60))
+        self.assertRedirects(response, reverse('oportunidades_detail', args=[Vaga.objects.get(empresa_nome='Outra empresa').pk]))
+
+    def test_should_ignore_opportunities_without_scheduled_interview(self) -> None:
+        """
+        WHEN the overlapping opportunity is no longer waiting for its interview
+
+        THEN the interview should be registered
+
+        :rtype: None
+        """
+        Vaga.objects.filter(pk=self.agendada.pk).update(situacao=Vaga.Status.REJECTED)
+        response = self.post(reverse('oportunidades_new'), self.inicio)
+        self.assertEqual(302, response.status_code)
+
+    def test_should_not_conflict_with_itself(self) -> None:
+        """
+        WHEN I update the scheduled interview keeping an overlapping time
+
+        THEN it should be updated
+
+        :rtype: None
+        """
+        response = self.post(reverse('oportunidades_edit', args=[self.agendada.pk]), self.inicio + timedelta(minutes=15))
+        self.assertRedirects(response, reverse('oportunidades_detail', args=[self.agendada.pk]))
+
+    def test_model_validation(self) -> None:
+        """
+        WHEN a job opportunity with an overlapping interview is validated outside the form
+
+        THEN the model validation should report the conflict
+
+        :rtype: None
+        """
+        vaga = Vaga(situacao=Vaga.Status.INTERVIEW_SCHEDULED, data_hora_entrevista=self.inicio - timedelta(minutes=59))
+        self.assertEqual(self.agendada, vaga.get_conflicting_interview())
+
+        with self.assertRaises(ValidationError) as ctx:
+            vaga.clean()
+
+        self.assertEqual(['conflict'], [e.code for e in ctx.exception.error_dict['data_hora_entrevista']])
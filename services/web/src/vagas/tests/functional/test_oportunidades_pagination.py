@@ -0,0 +1,133 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from vagas.forms import OportunidadesFilterForm
+from vagas.models import Vaga
+
+@override_settings(VAGAS_PAGE_SIZE=2)
+class OportunidadesPaginationTest(TestCase):
+    """
+    As a user of the website
+
+    I want the job opportunities to be split into pages
+
+    So that the homepage loads quickly no matter how many opportunities I've registered
+    """
+
+    def setUp(self) -> None:
+        """
+        GIVEN five previously registered opportunities and a page size of two
+
+        :rtype: None
+        """
+        self.vagas = [
+            Vaga.objects.create(
+                empresa_nome=f'Minha empresa {i}',
+                empresa_site=f'empresa{i}.com.br',
+                cargo_titulo=f'Cargo título {i}',
+                site_referencia='www.sitereferencia.com.br',
+                situacao=Vaga.Status.WAITING if i % 2 else Vaga.Status.APPLIED,
+            )
+            for i in range(5)
+        ]
+        self.url = reverse('homepage')
+
+    def follow(self, response, cursor_name: str):
+        """
+        Follow the link to the next or previous page.
+
+        :rtype: HttpResponse
+        """
+        page = response.context['page']
+        cursor = page.next_cursor if 'after' == cursor_name else page.previous_cursor
+        querystring = response.context['querystring']
+
+        return self.client.get(f'{self.url}?{querystring}&{cursor_name}={cursor}')
+
+    def test_should_show_only_first_page(self) -> None:
+        """
+        WHEN I visit the homepage
+
+        THEN only the newest opportunities that fit in a page should be shown along with a link to the next page
+
+        :rtype: None
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(self.vagas[:-3:-1], list(response.context['vagas']))
+        self.assertTrue(response.context['page'].has_next)
+        self.assertFalse(response.context['page'].has_previous)
+        self.assertContains(response, 'rel=next')
+        self.assertContains(response, f'Total: {len(self.vagas)}')
+
+    def test_should_walk_through_all_pages_from_newest(self) -> None:
+        """
+        WHEN I follow the links to the next pages ordering by the newest opportunities
+
+        THEN every opportunity should be shown exactly once in descending order of registration
+
+        :rtype: None
+        """
+        response = self.client.get(self.url)
+        seen = list(response.context['vagas'])
+
+        while response.context['page'].has_next:
+            response = self.follow(response, 'after')
+            seen.extend(response.context['vagas'])
+
+        self.assertEqual(list(reversed(self.vagas)), seen)
+
+    def test_should_walk_through_all_pages_from_oldest(self) -> None:
+        """
+        WHEN I follow the links to the next pages ordering by the oldest opportunities
+
+        THEN every opportunity should be shown exactly once in ascending order of registration
+
+        :rtype: None
+        """
+        response = self.client.get(f'{self.url}?data_hora_cadastro_order={OportunidadesFilterForm.DataHoraCadastroOrder.OLDEST}')
+        seen = list(response.context['vagas'])
+
+        while response.context['page'].has_next:
+            response = self.follow(response, 'after')
+            seen.extend(response.context['vagas'])
+
+        self.assertEqual(self.vagas, seen)
+
+    def test_should_go_back_to_previous_page(self) -> None:
+        """
+        WHEN I go to the next page and then follow the link to the previous page
+
+        THEN the first page should be shown again
+
+        :rtype: None
+        """
+        first = self.client.get(self.url)
+        second = self.follow(first, 'after')
+        back = self.follow(second, 'before')
+        self.assertEqual(list(first.context['vagas']), list(back.context['vagas']))
+        self.assertFalse(back.context['page'].has_previous)
+
+    def test_should_keep_filter_between_pages(self) -> None:
+        """
+        WHEN I filter by status and follow the link to the next page
+
+        THEN only opportunities with that status should be shown
+
+        :rtype: None
+        """
+        response = self.client.get(f'{self.url}?situacao={Vaga.Status.APPLIED}')
+        response = self.follow(response, 'after')
+        expected = [v for v in self.vagas if Vaga.Status.APPLIED == v.situacao][-3::-1]
+        self.assertEqual(expected, list(response.context['vagas']))
+        self.assertContains(response, 'Total: 3')
+
+    def test_should_show_first_page_for_invalid_cursor(self) -> None:
+        """
+        WHEN I visit the homepage with a tampered cursor
+
+        THEN the first page should be shown
+
+        :rtype: None
+        """
+        response = self.client.get(f'{self.url}?after=invalido')
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(self.vagas[:-3:-1], list(response.context['vagas']))
@@ -0,0 +1,104 @@
+import json
+from datetime import datetime, time, timedelta
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from vagas.models import Vaga
+from vagas.tests.helpers import create_vaga
+
+class OportunidadesPeriodoFilterTest(TestCase):
+    """
+    As a user of the website
+
+    I want to filter the job opportunities by the date they were registered
+
+    So that I can focus on the opportunities I applied to recently or in a given period
+    """
+
+    def setUp(self) -> None:
+        """
+        GIVEN opportunities registered today, 10 days ago, 60 days ago and a year ago
+
+        :rtype: None
+        """
+        hoje = timezone.localdate()
+        self.hoje = create_vaga(empresa_nome='Empresa', cargo_titulo='Hoje', situacao=Vaga.Status.WAITING, data_hora_cadastro=timezone.make_aware(datetime.combine(hoje, time(12))))
+        self.dez_dias = create_vaga(empresa_nome='Empresa', cargo_titulo='Dez dias', situacao=Vaga.Status.WAITING, data_hora_cadastro=timezone.make_aware(datetime.combine(hoje - timedelta(days=10), time(12))))
+        self.sessenta_dias = create_vaga(empresa_nome='Empresa', cargo_titulo='Sessenta dias', situacao=Vaga.Status.WAITING, data_hora_cadastro=timezone.make_aware(datetime.combine(hoje - timedelta(days=60), time(12))))
+        self.um_ano = create_vaga(empresa_nome='Empresa', cargo_titulo='Um ano', situacao=Vaga.Status.WAITING, data_hora_cadastro=timezone.make_aware(datetime.combine(hoje - timedelta(days=365), time(12))))
+        self.url = reverse('homepage')
+
+    def test_should_have_periodo_filter(self) -> None:
+        """
+        WHEN I visit the homepage
+
+        THEN there should be fields to choose a preset period or the first and last registration dates
+
+        :rtype: None
+        """
+        fields = self.client.get(self.url).context['form'].fields
+        self.assertIn('periodo_cadastro', fields)
+        self.assertIn('data_cadastro_inicio', fields)
+        self.assertIn('data_cadastro_fim', fields)
+
+    def test_should_filter_by_preset_period(self) -> None:
+        """
+        WHEN I choose the last 30 days
+
+        THEN only the opportunities registered in that period should be shown
+
+        :rtype: None
+        """
+        response = self.client.get(f'{self.url}?periodo_cadastro=30')
+        self.assertEqual([self.hoje, self.dez_dias], list(response.context['vagas']))
+        self.assertContains(response, 'Total: 2')
+        self.assertEqual('30', response.context['form'].fields['periodo_cadastro'].initial)
+
+    def test_should_filter_by_date_range(self) -> None:
+        """
+        WHEN I type the first and last registration dates
+
+        THEN only the opportunities registered between them, inclusive, should be shown
+
+        :rtype: None
+        """
+        inicio = timezone.localtime(self.um_ano.data_hora_cadastro).date()
+        fim = timezone.localtime(self.sessenta_dias.data_hora_cadastro).date()
+        response = self.client.get(f'{self.url}?data_cadastro_inicio={inicio}&data_cadastro_fim={fim}')
+        self.assertEqual([self.sessenta_dias, self.um_ano], list(response.context['vagas']))
+        self.assertEqual(inicio, response.context['form'].fields['data_cadastro_inicio'].initial)
+
+    def test_should_combine_preset_period_and_dates(self) -> None:
+        """
+        WHEN I choose the last 90 days and a last registration date
+
+        THEN only the opportunities registered in the intersection of both should be shown
+
+        :rtype: None
+        """
+        fim = timezone.localdate() - timedelta(days=1)
+        response = self.client.get(f'{self.url}?periodo_cadastro=90&data_cadastro_fim={fim}')
+        self.assertEqual([self.dez_dias, self.sessenta_dias], list(response.context['vagas']))
+
+    def test_should_ignore_invalid_dates(self) -> None:
+        """
+        WHEN I type an invalid date
+
+        THEN every opportunity should be shown
+
+        :rtype: None
+        """
+        response = self.client.get(f'{self.url}?data_cadastro_inicio=2022-02-30&data_cadastro_fim=amanha')
+        self.assertEqual(4, len(response.context['vagas']))
+
+    def test_should_filter_api(self) -> None:
+        """
+        WHEN I list the opportunities registered in the last 7 days through the API
+
+        THEN only those opportunities should be returned
+
+        :rtype: None
+        """
+        response = self.client.get(reverse('oportunidades_api_list') + '?periodo_cadastro=7&fields=id')
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual([{'id': self.hoje.pk}], data['results'])
@@ -0,0 +1,190 @@
+import json
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from vagas.models import Vaga
+from vagas.tests.helpers import create_vaga
+
+class OportunidadesSearchTest(TestCase):
+    """
+    As a user of the website
+
+    I want to search the job opportunities by company, title and description
+
+    So that I can find an opportunity without scrolling through the homepage
+    """
+
+    def setUp(self) -> None:
+        """
+        GIVEN previously registered opportunities mentioning Python in different fields
+
+        :rtype: None
+        """
+        self.descricao = create_vaga(empresa_nome='Empresa Alfa', cargo_titulo='Desenvolvedor backend', cargo_descricao='Experiência com Python e Django. <script>alert(1)</script>', situacao=Vaga.Status.WAITING)
+        self.titulo = create_vaga(empresa_nome='Empresa Beta', cargo_titulo='Desenvolvedor Python', situacao=Vaga.Status.WAITING)
+        self.outra = create_vaga(empresa_nome='Empresa Gama', cargo_titulo='Analista de dados', cargo_descricao='Experiência com SQL.', situacao=Vaga.Status.WAITING)
+        self.url = reverse('homepage')
+
+    def test_should_have_search_box(self) -> None:
+        """
+        WHEN I visit the homepage
+
+        THEN there should be a search box
+
+        :rtype: None
+        """
+        self.assertContains(self.client.get(self.url), 'type="search"')
+
+    def test_should_rank_matches(self) -> None:
+        """
+        WHEN I search for a word
+
+        THEN only the matching opportunities should be shown, those matching in the title first
+
+        :rtype: None
+        """
+        response = self.client.get(f'{self.url}?busca=python')
+        self.assertEqual([self.titulo, self.descricao], list(response.context['vagas']))
+        self.assertContains(response, 'Total: 2')
+        self.assertEqual('python', response.context['form'].fields['busca'].initial)
+
+    def test_should_match_word_variations(self) -> None:
+        """
+        WHEN I search for a different inflection of a word in Portuguese
+
+        THEN the opportunities containing the word should be found
+
+        :rtype: None
+        """
+        response = self.client.get(f'{self.url}?busca=desenvolvedores')
+        self.assertEqual({self.titulo, self.descricao}, set(response.context['vagas']))
+
+    def test_should_combine_with_status(self) -> None:
+        """
+        WHEN I search for a word and filter by status
+
+        THEN only the matching opportunities with that status should be shown
+
+        :rtype: None
+        """
+        self.titulo.situacao = Vaga.Status.REJECTED
+        self.titulo.save()
+        response = self.client.get(f'{self.url}?busca=python&situacao={Vaga.Status.REJECTED}')
+        self.assertEqual([self.titulo], list(response.context['vagas']))
+
+    def test_should_highlight_excerpts(self) -> None:
+        """
+        WHEN I search for a word found in the description of an opportunity
+
+        THEN the matching excerpt of the description should be shown highlighted and escaped
+
+        :rtype: None
+        """
+        response = self.client.get(f'{self.url}?busca=django')
+        self.assertContains(response, '<mark>Django</mark>')
+        self.assertNotContains(response, '<script>alert(1)</script>')
+
+    def test_should_find_updated_description(self) -> None:
+        """
+        WHEN I change the description of an opportunity
+
+        THEN searching for the new description should find it
+
+        :rtype: None
+        """
+        self.outra.cargo_descricao = 'Experiência com Kotlin.'
+        self.outra.save()
+        self.assertEqual([self.outra], list(self.client.get(f'{self.url}?busca=kotlin').context['vagas']))
+        self.assertEqual([], list(self.client.get(f'{self.url}?busca=sql').context['vagas']))
+
+    def test_should_stream_all_matches(self) -> None:
+        """
+        WHEN I search for a word and choose to show all opportunities
+
+        THEN all matching opportunities should be shown with their excerpts
+
+        :rtype: None
+        """
+        response = self.client.get(f'{self.url}?busca=python&exibir=todas')
+        content = b''.join(response.streaming_content).decode()
+        self.assertIn('Desenvolvedor Python', content)
+        self.assertIn('<mark>Python</mark>', content)
+        self.assertNotIn('Analista de dados', content)
+
+    @override_settings(VAGAS_PAGE_SIZE=2)
+    def test_should_paginate_ranked_matches(self) -> None:
+        """
+        WHEN I search for a word matching more opportunities than fit in a page
+
+        THEN following the next links should show every match exactly once
+
+        :rtype: None
+        """
+        vagas = [create_vaga(empresa_nome=f'Empresa {i}', cargo_titulo='Desenvolvedor Python', situacao=Vaga.Status.WAITING) for i in range(3)]
+        url = reverse('oportunidades_api_list') + '?busca=python&fields=id'
+        ids = []
+
+        while url:
+            data = json.loads(b''.join(self.client.get(url).streaming_content))
+            ids += [row['id'] for row in data['results']]
+            url = data['next']
+
+        self.assertCountEqual([vaga.pk for vaga in vagas + [self.titulo, self.descricao]], ids)
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(self.descricao.pk, ids[-1])
+
+class OportunidadesSearchMigrationTest(TransactionTestCase):
+    """
+    As a user of the website
+
+    I want to find the opportunities registered before the search existed
+
+    So that searching does not leave out my oldest opportunities
+    """
+
+    def setUp(self) -> None:
+        """
+        GIVEN opportunities registered before the migration adding the search vector
+
+        :rtype: None
+        """
+        executor = MigrationExecutor(connection)
+        executor.migrate([('vagas', '0018_contagemsituacao_statement_triggers')])
+
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO vagas_vaga (
+                    empresa_nome, empresa_endereco, empresa_email, empresa_site, empresa_telefone_celular,
+                    empresa_telefone_comercial, cargo_titulo, cargo_descricao, site_referencia, situacao,
+                    data_hora_cadastro, data_hora_atualizacao
+                ) VALUES
+                    ('Empresa Alfa', '', '', 'https://meusite.com.br', '', '', 'Desenvolvedor',
+                        'Experiência com Kotlin.', 'https://sitereferencia.com.br', 'W', now(), now()),
+                    ('Empresa Beta', '', '', 'https://outrosite.com.br', '', '', 'Analista de dados', '',
+                        'https://sitereferencia.com.br', 'W', now(), now())
+                RETURNING id
+            """)
+            [self.pk], [self.outro_pk] = cursor.fetchall()
+
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes('vagas'))
+
+    def tearDown(self) -> None:
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes('vagas'))
+
+    def test_should_find_opportunities_registered_before_migration(self) -> None:
+        """
+        WHEN I search for the title, the company or the description of one of them
+
+        THEN that opportunity should be found
+
+        :rtype: None
+        """
+        self.assertFalse(Vaga.objects.filter(busca__isnull=True).exists())
+
+        for busca in ['desenvolvedor', 'alfa', 'kotlin']:
+            with self.subTest(busca=busca):
+                response = self.client.get(f"{reverse('homepage')}?busca={busca}")
+                self.assertEqual([self.pk], [vaga.pk for vaga in response.context['vagas']])
@@ -0,0 +1,78 @@
+from django.http import StreamingHttpResponse
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from vagas.forms import OportunidadesFilterForm
+from vagas.models import Vaga
+
+@override_settings(VAGAS_PAGE_SIZE=2, VAGAS_STREAM_CHUNK_SIZE=2)
+class OportunidadesStreamingTest(TestCase):
+    """
+    As a user of the website
+
+    I want to see all job opportunities in a single page
+
+    So that I can scroll through everything I've registered
+    """
+
+    def setUp(self) -> None:
+        """
+        GIVEN five previously registered opportunities and a page size of two
+
+        :rtype: None
+        """
+        self.vagas = [
+            Vaga.objects.create(
+                empresa_nome=f'Minha empresa {i}',
+                empresa_site=f'empresa{i}.com.br',
+                cargo_titulo=f'Cargo título {i}',
+                site_referencia='www.sitereferencia.com.br',
+                situacao=Vaga.Status.WAITING if i % 2 else Vaga.Status.APPLIED,
+            )
+            for i in range(5)
+        ]
+        self.url = reverse('homepage')
+
+    def get_content(self, querystring: str) -> str:
+        response = self.client.get(f'{self.url}?{querystring}')
+        self.assertIsInstance(response, StreamingHttpResponse)
+
+        return b''.join(response.streaming_content).decode()
+
+    def test_should_have_link_to_show_all(self) -> None:
+        """
+        WHEN I visit the homepage and there are more opportunities than fit in a page
+
+        THEN there should be a link to show all of them
+
+        :rtype: None
+        """
+        self.assertContains(self.client.get(self.url), 'exibir=todas')
+
+    def test_should_show_all_opportunities(self) -> None:
+        """
+        WHEN I choose to show all opportunities
+
+        THEN every opportunity should be shown, newest first, within the page
+
+        :rtype: None
+        """
+        content = self.get_content('exibir=todas')
+        positions = [content.index(f'Cargo título {i}') for i in range(5)]
+        self.assertEqual(sorted(positions, reverse=True), positions)
+        self.assertIn('Total: 5', content)
+        self.assertTrue(content.rstrip().endswith('</html>'))
+        self.assertNotIn('rel=next', content)
+
+    def test_should_keep_filter_and_order(self) -> None:
+        """
+        WHEN I choose to show all opportunities with a status, oldest first
+
+        THEN only the opportunities with that status should be shown, oldest first
+
+        :rtype: None
+        """
+        content = self.get_content(f'exibir=todas&situacao={Vaga.Status.APPLIED}&data_hora_cadastro_order={OportunidadesFilterForm.DataHoraCadastroOrder.OLDEST}')
+        positions = [content.index(f'Cargo título {i}') for i in (0, 2, 4)]
+        self.assertEqual(sorted(positions), positions)
+        self.assertNotIn('Cargo título 1', content)
+        self.assertNotIn('Cargo título 3', content)
@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Optional
+from vagas.models import Vaga
+
+def create_vaga(data_hora_cadastro: Optional[datetime] = None, data_hora_atualizacao: Optional[datetime] = None, **fields) -> Vaga:
+    """
+    Create a job opportunity with its required fields filled in, unless given.
+
+    The registration and update datetimes are set on save, so the given ones are written afterwards by an update.
+
+    :param data_hora_cadastro: Datetime of registration
+
+    :type data_hora_cadastro: datetime or None
+
+    :param data_hora_atualizacao: Datetime of the last update
+
+    :type data_hora_atualizacao: datetime or None
+
+    :rtype: Vaga
+    """
+    vaga = Vaga.objects.create(**{
+        'empresa_nome': 'Minha empresa',
+        'empresa_site': 'https://meusite.com.br',
+        'cargo_titulo': 'Título do cargo',
+        'site_referencia': 'https://sitereferencia.com.br',
+        **fields,
+    })
+    datas = {
+        name: value
+        for name, value in [('data_hora_cadastro', data_hora_cadastro), ('data_hora_atualizacao', data_hora_atualizacao)]
+        if value is not None
+    }
+
+    if datas:
+        Vaga.objects.filter(pk=vaga.pk).update(**datas)
+
+        for name, value in datas.items():
+            setattr(vaga, name, value)
+
+    return vaga
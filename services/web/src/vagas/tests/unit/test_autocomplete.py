@@ -0,0 +1,129 @@
+from django.test import TestCase, override_settings
+from vagas.autocomplete import Autocomplete, fold
+from vagas.models import Vaga
+from vagas.tests.helpers import create_vaga
+
+@override_settings(VAGAS_AUTOCOMPLETE_REFRESH_INTERVAL=60, VAGAS_AUTOCOMPLETE_MAX_AGE=3600)
+class AutocompleteTest(TestCase):
+    """Tests for the in-memory autocomplete of field values."""
+
+    def setUp(self) -> None:
+        for empresa_nome in ['Itaú Unibanco', 'Itaú Unibanco', 'Itautec', 'Ibm', 'Nubank']:
+            create_vaga(empresa_nome=empresa_nome)
+
+        self.autocomplete = Autocomplete('empresa_nome')
+
+    def test_fold(self) -> None:
+        """
+        Ensure that values are compared without accents and case.
+
+        :rtype: None
+        """
+        self.assertEqual('ITAU SAO PAULO', fold('Itaú São Paulo'))
+
+    def test_suggests_distinct_values_by_prefix(self) -> None:
+        """
+        Ensure that the distinct values starting with the prefix are suggested in alphabetical order.
+
+        :rtype: None
+        """
+        self.assertEqual(['Itaú Unibanco', 'Itautec'], self.autocomplete.suggest('itau', 10))
+        self.assertEqual(['Ibm', 'Itaú Unibanco'], self.autocomplete.suggest('I', 2))
+        self.assertEqual([], self.autocomplete.suggest('Santander', 10))
+
+    def test_lookups_do_not_query_database(self) -> None:
+        """
+        Ensure that lookups are answered from memory once the values are loaded.
+
+        :rtype: None
+        """
+        self.autocomplete.suggest('i', 10)
+
+        with self.assertNumQueries(0):
+            for _ in range(100):
+                self.autocomplete.suggest('nu', 10)
+
+    def test_refresh_adds_updated_values(self) -> None:
+        """
+        Ensure that a refresh adds the values of the rows saved since the previous one without reloading everything.
+
+        :rtype: None
+        """
+        self.autocomplete.suggest('i', 10)
+        create_vaga(empresa_nome='Inter')
+
+        with override_settings(VAGAS_AUTOCOMPLETE_REFRESH_INTERVAL=0), self.assertNumQueries(2):
+            suggestions = self.autocomplete.suggest('in', 10)
+
+        self.assertEqual(['Inter'], suggestions)
+
+    def test_deletion_reloads_values(self) -> None:
+        """
+        Ensure that deleting a job opportunity causes the values to be loaded again.
+
+        :rtype: None
+        """
+        self.autocomplete.suggest('i', 10)
+        Vaga.objects.filter(empresa_nome='Nubank').delete()
+
+        with override_settings(VAGAS_AUTOCOMPLETE_REFRESH_INTERVAL=0):
+            self.assertEqual([], self.autocomplete.suggest('nu', 10))
+
+    def test_rename_reloads_values(self) -> None:
+        """
+        Ensure that changing the company name of a job opportunity causes its former name to be no longer suggested.
+
+        :rtype: None
+        """
+        self.autocomplete.suggest('i', 10)
+        vaga = Vaga.objects.get(empresa_nome='Nubank')
+        vaga.empresa_nome = 'Nu Pagamentos'
+        vaga.save()
+
+        with override_settings(VAGAS_AUTOCOMPLETE_REFRESH_INTERVAL=0):
+            self.assertEqual(['Nu Pagamentos'], self.autocomplete.suggest('nu', 10))
+
+    def test_status_change_does_not_reload_values(self) -> None:
+        """
+        Ensure that changing the status of a job opportunity is handled by the refresh without loading the values again.
+
+        :rtype: None
+        """
+        self.autocomplete.suggest('i', 10)
+        vaga = Vaga.objects.get(empresa_nome='Nubank')
+        vaga.situacao = Vaga.Status.WAITING
+        vaga.save()
+
+        with override_settings(VAGAS_AUTOCOMPLETE_REFRESH_INTERVAL=0), self.assertNumQueries(2):
+            self.assertEqual(['Nubank'], self.autocomplete.suggest('nu', 10))
+
+    @override_settings(VAGAS_AUTOCOMPLETE_MAX_VALUES=1)
+    def test_keeps_most_frequent_values_and_falls_back_to_database(self) -> None:
+        """
+        Ensure that only the most frequent values are kept in memory and the others are read from the database.
+
+        :rtype: None
+        """
+        self.autocomplete.suggest('i', 10)
+        self.assertEqual(['ITAU UNIBANCO\x00Itaú Unibanco'], self.autocomplete.entries)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(['Itaú Unibanco'], self.autocomplete.suggest('itau', 1))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(['Itaú Unibanco', 'Itautec'], self.autocomplete.suggest('itau', 10))
+
+    @override_settings(VAGAS_AUTOCOMPLETE_MAX_VALUES=1)
+    def test_database_fallback_skips_duplicate_rows(self) -> None:
+        """
+        Ensure that the values read from the database are distinct and the first ones in order, however many rows share a value.
+
+        :rtype: None
+        """
+        for _ in range(5):
+            create_vaga(empresa_nome='Ibm')
+
+        self.autocomplete.suggest('i', 1)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(['Ibm', 'Itaú Unibanco', 'Itautec'], self.autocomplete.suggest('i', 3))
@@ -0,0 +1,129 @@
+import gzip
+import os
+import tempfile
+from io import StringIO
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+from vagas.models import ContagemSituacao, Vaga
+
+class BackupVagasTest(TestCase):
+    """Tests for the backup_vagas and restore_vagas commands."""
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'vagas.gz')
+
+        for i, situacao in enumerate([Vaga.Status.APPLIED, Vaga.Status.APPLIED, Vaga.Status.WAITING]):
+            Vaga.objects.create(
+                empresa_nome=f'Empresa {i}',
+                empresa_site=f'https://empresa{i}.com.br',
+                empresa_telefone_celular='11987654321' if i == 0 else '',
+                cargo_titulo=f'Cargo {i}',
+                cargo_descricao='Experiência com Kotlin.\n\tBarra invertida: \\' if i == 0 else '',
+                site_referencia='https://sitereferencia.com.br',
+                situacao=situacao,
+            )
+
+    def call(self, command: str, *args) -> str:
+        stdout = StringIO()
+        call_command(command, *args, stdout=stdout)
+
+        return stdout.getvalue()
+
+    def snapshot(self) -> list:
+        return list(Vaga.objects.order_by('id').values_list(
+            'id', 'empresa_nome', 'empresa_telefone_celular', 'cargo_titulo', 'situacao', 'data_hora_cadastro', 'data_hora_atualizacao', 'descricao__cargo_descricao',
+        ))
+
+    def test_restores_backup(self) -> None:
+        """
+        Ensure that a restored backup brings back the same rows, searchable, with the sequence and counters updated.
+
+        :rtype: None
+        """
+        expected = self.snapshot()
+        output = self.call('backup_vagas', self.path)
+        self.assertIn('vagas_vaga: 3 rows.', output)
+        self.assertIn('vagas_vagadescricao: 1 rows.', output)
+        Vaga.objects.create(
+            empresa_nome='Empresa removida',
+            empresa_site='https://empresaremovida.com.br',
+            cargo_titulo='Cargo removido',
+            site_referencia='https://sitereferencia.com.br',
+            situacao=Vaga.Status.REJECTED,
+        )
+        geracao = ContagemSituacao.objects.get(situacao=Vaga.Status.REJECTED).geracao
+
+        with self.assertRaisesMessage(CommandError, 'Já existem vagas cadastradas.'):
+            self.call('restore_vagas', self.path)
+
+        self.call('restore_vagas', self.path, '--replace')
+        self.assertEqual(expected, self.snapshot())
+        self.assertEqual(['Empresa 0'], list(Vaga.objects.filter(busca='kotlin').values_list('empresa_nome', flat=True)))
+        totals = dict(ContagemSituacao.objects.values_list('situacao', 'total'))
+        self.assertEqual((2, 1, 0), (totals[Vaga.Status.APPLIED], totals[Vaga.Status.WAITING], totals[Vaga.Status.REJECTED]))
+        self.assertGreater(ContagemSituacao.objects.get(situacao=Vaga.Status.REJECTED).geracao, geracao)
+        vaga = Vaga.objects.get(empresa_nome='Empresa 1')
+        vaga.cargo_descricao = 'Experiência com Terraform.'
+        vaga.save()
+        self.assertEqual([vaga], list(Vaga.objects.filter(busca='terraform')))
+        vaga = Vaga.objects.create(
+            empresa_nome='Empresa nova',
+            empresa_site='https://empresanova.com.br',
+            cargo_titulo='Cargo novo',
+            site_referencia='https://sitereferencia.com.br',
+            situacao=Vaga.Status.APPLIED,
+            data_hora_cadastro=timezone.now(),
+        )
+        self.assertGreater(vaga.pk, expected[-1][0])
+
+    def test_dry_run_checks_without_writing(self) -> None:
+        """
+        Ensure that a dry run checks a backup without writing, and that truncated or foreign files are refused.
+
+        :rtype: None
+        """
+        self.call('backup_vagas', self.path)
+        expected = self.snapshot()
+        output = self.call('restore_vagas', self.path, '--replace', '--dry-run')
+        self.assertIn('is a valid backup', output)
+        self.assertEqual(expected, self.snapshot())
+
+        with gzip.open(self.path, 'rb') as file:
+            content = file.read()
+
+        with gzip.open(self.path, 'wb') as file:
+            file.write(content[:-40])
+
+        with self.assertRaisesMessage(CommandError, 'O arquivo termina antes do fim das linhas de uma tabela.'):
+            self.call('restore_vagas', self.path, '--dry-run')
+
+        with self.assertRaisesMessage(CommandError, 'O arquivo termina antes do fim das linhas de uma tabela.'):
+            self.call('restore_vagas', self.path, '--replace')
+
+        self.assertEqual(expected, self.snapshot())
+
+        with open(self.path, 'wb') as file:
+            file.write(gzip.compress(content)[:-30])
+
+        with self.assertRaisesMessage(CommandError, 'is not a valid gzip file'):
+            self.call('restore_vagas', self.path, '--dry-run')
+
+        with self.assertRaisesMessage(CommandError, 'is not a valid gzip file'):
+            self.call('restore_vagas', self.path, '--replace')
+
+        self.assertEqual(expected, self.snapshot())
+
+        with gzip.open(self.path, 'wb') as file:
+            file.write(content.replace(b'"colunas": ["vaga_id", ', b'"colunas": ["id", ', 1))
+
+        with self.assertRaisesMessage(CommandError, 'As colunas da tabela vagas_vagadescricao não conferem: id, vaga_id.'):
+            self.call('restore_vagas', self.path, '--dry-run')
+
+        with gzip.open(self.path, 'wb') as file:
+            file.write(b'empresa_nome,cargo_titulo\n')
+
+        with self.assertRaisesMessage(CommandError, 'O arquivo não é uma cópia de segurança completa das vagas.'):
+            self.call('restore_vagas', self.path, '--dry-run')
@@ -1,10 +1,10 @@
-from django.test import SimpleTestCase
+from django.test import TestCase
 from django.utils import timezone
 import datetime as dt
 from vagas.forms import CadastroVagasForm
 from vagas.models import Vaga
 
-class CadastroVagasFormValidationTest(SimpleTestCase):
+class CadastroVagasFormValidationTest(TestCase):
     """Ensure CadastroVagasForm performs the necessary validation."""
     
     def test_empresa_nome_is_required(self) -> None:
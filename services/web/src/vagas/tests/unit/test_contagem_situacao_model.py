@@ -0,0 +1,139 @@
+import threading
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from vagas.models import Vaga, ContagemSituacao
+from vagas.tests.helpers import create_vaga
+
+class ContagemSituacaoModelTest(TestCase):
+    """Tests for model ContagemSituacao."""
+
+    def test_counts_created_opportunities(self) -> None:
+        """
+        Ensure that creating job opportunities increments the total of their status.
+
+        :rtype: None
+        """
+        create_vaga(situacao=Vaga.Status.APPLIED)
+        create_vaga(situacao=Vaga.Status.APPLIED)
+        create_vaga(situacao=Vaga.Status.APPROVED)
+        totais = ContagemSituacao.totais()
+        self.assertEqual(2, totais[Vaga.Status.APPLIED])
+        self.assertEqual(1, totais[Vaga.Status.APPROVED])
+        self.assertEqual(0, totais[Vaga.Status.REJECTED])
+
+    def test_counts_status_transitions(self) -> None:
+        """
+        Ensure that changing the status of a job opportunity moves it between totals.
+
+        :rtype: None
+        """
+        vaga = create_vaga(situacao=Vaga.Status.APPLIED)
+        vaga.situacao = Vaga.Status.WAITING
+        vaga.save()
+        totais = ContagemSituacao.totais()
+        self.assertEqual(0, totais[Vaga.Status.APPLIED])
+        self.assertEqual(1, totais[Vaga.Status.WAITING])
+
+    def test_saving_without_status_change_keeps_totals(self) -> None:
+        """
+        Ensure that saving a job opportunity without changing its status keeps the totals.
+
+        :rtype: None
+        """
+        vaga = create_vaga(situacao=Vaga.Status.WAITING)
+        vaga.cargo_titulo = 'Outro título'
+        vaga.save()
+        self.assertEqual(1, ContagemSituacao.totais()[Vaga.Status.WAITING])
+
+    def test_counts_deleted_opportunities(self) -> None:
+        """
+        Ensure that deleting job opportunities decrements the total of their status.
+
+        :rtype: None
+        """
+        create_vaga(situacao=Vaga.Status.REJECTED).delete()
+        create_vaga(situacao=Vaga.Status.REJECTED)
+        Vaga.objects.filter(situacao=Vaga.Status.REJECTED).delete()
+        self.assertEqual(0, ContagemSituacao.totais()[Vaga.Status.REJECTED])
+
+    def test_counts_bulk_created_opportunities(self) -> None:
+        """
+        Ensure that creating many job opportunities in a single statement increments the totals of their statuses.
+
+        :rtype: None
+        """
+        Vaga.objects.bulk_create(
+            Vaga(
+                empresa_nome='Minha empresa',
+                empresa_site='https://meusite.com.br',
+                cargo_titulo='Título do cargo',
+                site_referencia='https://sitereferencia.com.br',
+                situacao=Vaga.Status.values[i % 2],
+            )
+            for i in range(5)
+        )
+        totais = ContagemSituacao.totais()
+        self.assertEqual(3, totais[Vaga.Status.values[0]])
+        self.assertEqual(2, totais[Vaga.Status.values[1]])
+
+    def test_counts_bulk_updates(self) -> None:
+        """
+        Ensure that updating many job opportunities at once keeps the totals correct.
+
+        :rtype: None
+        """
+        for _ in range(3):
+            create_vaga(situacao=Vaga.Status.APPLIED)
+
+        Vaga.objects.update(situacao=Vaga.Status.REJECTED)
+        totais = ContagemSituacao.totais()
+        self.assertEqual(0, totais[Vaga.Status.APPLIED])
+        self.assertEqual(3, totais[Vaga.Status.REJECTED])
+
+    def test_homepage_does_not_count_opportunities(self) -> None:
+        """
+        Ensure that the homepage reads totals from the counters instead of counting the vagas_vaga table.
+
+        :rtype: None
+        """
+        create_vaga(situacao=Vaga.Status.APPROVED)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f"{reverse('homepage')}?situacao={Vaga.Status.APPROVED}")
+
+        self.assertContains(response, 'Total: 1')
+        self.assertContains(response, 'Aprovado (1)')
+        self.assertFalse([q for q in queries if 'COUNT(' in q['sql'].upper()])
+
+class ContagemSituacaoConcurrencyTest(TransactionTestCase):
+    """Ensure that totals stay correct under concurrent writes."""
+
+    def test_concurrent_writes(self) -> None:
+        """
+        Ensure that job opportunities created and updated from concurrent connections are all counted.
+
+        :rtype: None
+        """
+        def write() -> None:
+            try:
+                for _ in range(10):
+                    vaga = create_vaga(situacao=Vaga.Status.APPLIED)
+                    vaga.situacao = Vaga.Status.WAITING
+                    vaga.save()
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=write) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        totais = ContagemSituacao.totais()
+        self.assertEqual(0, totais[Vaga.Status.APPLIED])
+        self.assertEqual(40, totais[Vaga.Status.WAITING])
+        self.assertEqual(Vaga.objects.count(), sum(totais.values()))
@@ -0,0 +1,65 @@
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from vagas.models import Vaga
+from vagas.pagination import CursorPaginator, InvalidCursor
+
+class CursorPaginatorTest(TestCase):
+    """Tests for the keyset paginator."""
+
+    def setUp(self) -> None:
+        self.vagas = [
+            Vaga.objects.create(
+                empresa_nome=f'Minha empresa {i}',
+                empresa_site=f'empresa{i}.com.br',
+                cargo_titulo=f'Cargo título {i}',
+                site_referencia='www.sitereferencia.com.br',
+            )
+            for i in range(3)
+        ]
+        self.paginator = CursorPaginator(Vaga.objects.all(), ('-data_hora_cadastro', '-id',), 2)
+
+    def test_cursor_round_trip(self) -> None:
+        """
+        Ensure that a cursor decodes to the ordering values of the row it was created from.
+
+        :rtype: None
+        """
+        vaga = self.vagas[0]
+        cursor = self.paginator.encode_cursor(vaga)
+        self.assertEqual([vaga.data_hora_cadastro, vaga.id], self.paginator.decode_cursor(cursor))
+
+    def test_invalid_cursor_raises(self) -> None:
+        """
+        Ensure that an invalid cursor raises InvalidCursor.
+
+        :rtype: None
+        """
+        for cursor in ['invalido', 'WzFd', 'WyJ4IiwxXQ']:
+            with self.assertRaises(InvalidCursor):
+                self.paginator.page(after=cursor)
+
+    def test_rows_with_same_data_hora_cadastro_are_not_skipped(self) -> None:
+        """
+        Ensure that the primary key breaks ties between rows registered at the same datetime.
+
+        :rtype: None
+        """
+        Vaga.objects.update(data_hora_cadastro=self.vagas[0].data_hora_cadastro)
+        first = self.paginator.page()
+        second = self.paginator.page(after=first.next_cursor)
+        self.assertEqual(list(reversed(self.vagas)), first.object_list + second.object_list)
+
+    def test_does_not_use_offset(self) -> None:
+        """
+        Ensure that pages are fetched without OFFSET.
+
+        :rtype: None
+        """
+        first = self.paginator.page()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.paginator.page(after=first.next_cursor)
+
+        self.assertEqual(1, len(queries))
+        self.assertNotIn('OFFSET', queries[0]['sql'])
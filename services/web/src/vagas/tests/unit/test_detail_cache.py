@@ -0,0 +1,76 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from vagas.caching import DETAIL_TEMPLATE, detail_cache_key
+from vagas.models import Vaga
+
+class DetailCacheTest(TestCase):
+    """Tests for the cache of rendered detail cards."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.vaga = Vaga.objects.create(
+            empresa_nome='Minha empresa',
+            empresa_site='https://meusite.com.br',
+            cargo_titulo='Título do cargo',
+            cargo_descricao='Primeiro parágrafo.\n\nSegundo parágrafo.',
+            site_referencia='https://sitereferencia.com.br',
+            situacao=Vaga.Status.WAITING,
+        )
+        self.url = reverse('oportunidades_detail', args=[self.vaga.pk])
+
+    def test_card_is_rendered_on_save(self) -> None:
+        """
+        Ensure that saving a job opportunity stores its rendered card under the primary key and datetime of the last update.
+
+        :rtype: None
+        """
+        card = cache.get(detail_cache_key(self.vaga.pk, self.vaga.data_hora_atualizacao))
+        self.assertInHTML('<p>Primeiro parágrafo.</p>', card)
+        self.assertIn('https://meusite.com.br</a>', card)
+
+    def test_detail_page_reuses_cached_card(self) -> None:
+        """
+        Ensure that the detail page neither renders the card nor reads the description when the card is cached.
+
+        :rtype: None
+        """
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+
+        self.assertTemplateNotUsed(response, DETAIL_TEMPLATE)
+        self.assertContains(response, '<p>Segundo parágrafo.</p>', html=True)
+
+    def test_detail_page_renders_missing_card(self) -> None:
+        """
+        Ensure that the detail page renders and stores the card when it is not cached.
+
+        :rtype: None
+        """
+        cache.clear()
+        response = self.client.get(self.url)
+        self.assertTemplateUsed(response, DETAIL_TEMPLATE)
+        self.assertContains(response, '<p>Segundo parágrafo.</p>', html=True)
+        self.assertIsNotNone(cache.get(detail_cache_key(self.vaga.pk, self.vaga.data_hora_atualizacao)))
+
+    def test_saving_replaces_cached_card(self) -> None:
+        """
+        Ensure that updating a job opportunity removes its former card and the detail page shows the new data.
+
+        :rtype: None
+        """
+        key = detail_cache_key(self.vaga.pk, self.vaga.data_hora_atualizacao)
+        self.vaga.cargo_descricao = 'Nova descrição.'
+        self.vaga.save()
+        self.assertIsNone(cache.get(key))
+        self.assertContains(self.client.get(self.url), 'Nova descrição.')
+
+    def test_deleting_invalidates_cached_card(self) -> None:
+        """
+        Ensure that deleting a job opportunity removes its cached card.
+
+        :rtype: None
+        """
+        key = detail_cache_key(self.vaga.pk, self.vaga.data_hora_atualizacao)
+        self.vaga.delete()
+        self.assertIsNone(cache.get(key))
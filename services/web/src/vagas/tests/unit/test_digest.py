@@ -0,0 +1,78 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from vagas.digest import build_digest, send_digest
+from vagas.models import Vaga
+from vagas.tests.helpers import create_vaga
+
+class DigestTest(TestCase):
+    """Tests for the weekly digest of job opportunities."""
+
+    def setUp(self) -> None:
+        self.now = timezone.now()
+        create_vaga(empresa_nome='Nova candidatura', situacao=Vaga.Status.APPLIED)
+        create_vaga(empresa_nome='Nova aguardando', situacao=Vaga.Status.WAITING, data_hora_cadastro=self.now - timedelta(days=2), data_hora_atualizacao=self.now - timedelta(days=1))
+        create_vaga(empresa_nome='Rejeitada na semana', situacao=Vaga.Status.REJECTED, data_hora_cadastro=self.now - timedelta(days=30), data_hora_atualizacao=self.now - timedelta(days=3))
+        self.entrevista = create_vaga(empresa_nome='Com entrevista', situacao=Vaga.Status.INTERVIEW_SCHEDULED, data_hora_cadastro=self.now - timedelta(days=20), data_hora_atualizacao=self.now - timedelta(days=20),
+            data_hora_entrevista=self.now + timedelta(days=2))
+        create_vaga(empresa_nome='Entrevista distante', situacao=Vaga.Status.INTERVIEW_SCHEDULED, data_hora_cadastro=self.now - timedelta(days=20), data_hora_atualizacao=self.now - timedelta(days=20),
+            data_hora_entrevista=self.now + timedelta(days=30))
+        self.parada = create_vaga(empresa_nome='Parada', situacao=Vaga.Status.WAITING, data_hora_cadastro=self.now - timedelta(days=60), data_hora_atualizacao=self.now - timedelta(days=40))
+        create_vaga(empresa_nome='Rejeitada antiga', situacao=Vaga.Status.REJECTED, data_hora_cadastro=self.now - timedelta(days=60), data_hora_atualizacao=self.now - timedelta(days=40))
+
+    def test_build_digest(self) -> None:
+        """
+        Ensure that the digest summarizes the period with a fixed number of queries.
+
+        :rtype: None
+        """
+        with self.assertNumQueries(7):
+            digest = build_digest(self.now, 7, 14)
+
+        self.assertEqual({'Candidatado': 1, 'Aguardando retorno': 1}, digest['novas'])
+        self.assertEqual({'Rejeitado': 1}, digest['atualizadas'])
+        self.assertEqual([self.entrevista], digest['entrevistas'])
+        self.assertEqual(0, digest['outras_entrevistas'])
+        self.assertEqual([self.parada], digest['paradas'])
+        self.assertEqual(0, digest['outras_paradas'])
+        self.assertEqual(1, digest['total_paradas'])
+
+    def test_send_digest_in_batches_through_one_connection(self) -> None:
+        """
+        Ensure that one message per active user is sent, in batches through a single connection.
+
+        :rtype: None
+        """
+        for i in range(5):
+            get_user_model().objects.create_user(f'usuario{i}', f'usuario{i}@email.com')
+
+        get_user_model().objects.create_user('inativo', 'inativo@email.com', is_active=False)
+        get_user_model().objects.create_user('sememail')
+
+        with mock.patch.object(EmailBackend, 'open', autospec=True, return_value=True) as open_, \
+                mock.patch.object(EmailBackend, 'send_messages', autospec=True, side_effect=EmailBackend.send_messages) as send_messages:
+            self.assertEqual(5, send_digest(build_digest(self.now, 7, 14), batch_size=2))
+
+        self.assertEqual(1, open_.call_count)
+        self.assertEqual([2, 2, 1], [len(call.args[1]) for call in send_messages.call_args_list])
+        self.assertEqual([[f'usuario{i}@email.com'] for i in range(5)], [message.to for message in mail.outbox])
+        self.assertIn('Com entrevista', mail.outbox[0].body)
+        self.assertIn('Parada', mail.outbox[0].body)
+
+    def test_command(self) -> None:
+        """
+        Ensure that the command sends the digest.
+
+        :rtype: None
+        """
+        get_user_model().objects.create_user('usuario', 'usuario@email.com')
+        stdout = StringIO()
+        call_command('send_weekly_digest', stdout=stdout)
+        self.assertIn('Digest sent to 1 users', stdout.getvalue())
+        self.assertEqual(1, len(mail.outbox))
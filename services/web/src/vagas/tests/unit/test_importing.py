@@ -0,0 +1,178 @@
+import csv
+import json
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.utils import timezone
+from vagas.importing import VagaImporter, open_report, start_import
+from vagas.models import ImportacaoVagas, Vaga, VagaDescricao
+
+HEADER = ['empresa_nome', 'empresa_site', 'cargo_titulo', 'cargo_descricao', 'site_referencia', 'data_hora_entrevista', 'situacao']
+
+def row(i: int, **kwargs) -> dict:
+    return {
+        'empresa_nome': f'Empresa {i}',
+        'empresa_site': f'https://empresa{i}.com.br',
+        'cargo_titulo': f'Cargo {i}',
+        'cargo_descricao': '',
+        'site_referencia': 'https://sitereferencia.com.br',
+        'data_hora_entrevista': '',
+        'situacao': Vaga.Status.APPLIED,
+        **kwargs,
+    }
+
+class ImportVagasTest(TestCase):
+    """Tests for the import_vagas command."""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write_csv(self, rows: list, name: str = 'vagas.csv') -> str:
+        path = os.path.join(self.directory.name, name)
+
+        with open(path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, HEADER)
+            writer.writeheader()
+            writer.writerows(rows)
+
+        return path
+
+    def read_report(self, path: str) -> list:
+        with open(f'{path}.erros.csv', newline='', encoding='utf-8') as file:
+            return list(csv.reader(file))[1:]
+
+    def import_vagas(self, path: str, *args) -> str:
+        stdout = StringIO()
+        call_command('import_vagas', path, *args, stdout=stdout)
+
+        return stdout.getvalue()
+
+    def test_imports_valid_rows(self) -> None:
+        """
+        Ensure that valid rows are inserted along with their descriptions, which the search finds.
+
+        :rtype: None
+        """
+        path = self.write_csv([row(1, cargo_descricao='Experiência com Kotlin.\nInglês avançado.'), row(2)])
+        output = self.import_vagas(path, '--batch-size', '1')
+        self.assertIn('Imported 2 job opportunities and rejected 0 rows', output)
+        vaga = Vaga.objects.get(empresa_nome='Empresa 1')
+        self.assertEqual('Experiência com Kotlin.\nInglês avançado.', vaga.cargo_descricao)
+        self.assertEqual(Vaga.Status.APPLIED, vaga.situacao)
+        self.assertEqual([vaga], list(Vaga.objects.filter(busca='kotlin')))
+        self.assertEqual(1, VagaDescricao.objects.count())
+        self.assertEqual([], self.read_report(path))
+
+    def test_reports_invalid_rows(self) -> None:
+        """
+        Ensure that rows breaking the rules of the registration form are reported by line and field, and not inserted.
+
+        :rtype: None
+        """
+        amanha = timezone.localtime() + timedelta(days=1)
+        path = self.write_csv([
+            row(1, cargo_descricao='Primeira linha.\nSegunda linha.'),
+            row(2, empresa_site='invalido'),
+            row(3, data_hora_entrevista=amanha.strftime('%d/%m/%Y %H:%M')),
+            row(4, situacao=Vaga.Status.INTERVIEW_SCHEDULED),
+            row(5, situacao='X', empresa_nome=''),
+        ])
+        self.import_vagas(path)
+        self.assertEqual(['Empresa 1'], list(Vaga.objects.values_list('empresa_nome', flat=True)))
+        report = self.read_report(path)
+        self.assertEqual(
+            [('4', 'empresa_site'), ('5', 'data_hora_entrevista'), ('6', 'data_hora_entrevista'), ('7', 'empresa_nome'), ('7', 'situacao')],
+            [(linha, campo) for linha, campo, mensagem in report],
+        )
+        self.assertEqual('O campo Site da empresa deve conter um endereço web válido.', report[0][2])
+        self.assertEqual(4, ImportacaoVagas.objects.get().rejeitadas)
+
+    def test_rejects_overlapping_interviews(self) -> None:
+        """
+        Ensure that interviews overlapping a saved interview or one of an earlier row are rejected.
+
+        :rtype: None
+        """
+        inicio = timezone.localtime().replace(second=0, microsecond=0) + timedelta(days=1)
+        Vaga.objects.create(
+            empresa_nome='Empresa salva',
+            empresa_site='https://empresasalva.com.br',
+            cargo_titulo='Cargo salvo',
+            site_referencia='https://sitereferencia.com.br',
+            situacao=Vaga.Status.INTERVIEW_SCHEDULED,
+            data_hora_entrevista=inicio,
+        )
+        path = self.write_csv([
+            row(i, situacao=Vaga.Status.INTERVIEW_SCHEDULED, data_hora_entrevista=(inicio + timedelta(minutes=minutos)).strftime('%d/%m/%Y %H:%M'))
+            for i, minutos in enumerate([30, 120, 150, 180])
+        ])
+        self.import_vagas(path)
+        self.assertEqual(['Empresa 1', 'Empresa 3'], list(Vaga.objects.filter(empresa_nome__startswith='Empresa ').order_by('id').values_list('empresa_nome', flat=True)[1:]))
+        report = self.read_report(path)
+        self.assertEqual([('2', 'data_hora_entrevista'), ('4', 'data_hora_entrevista')], [(linha, campo) for linha, campo, mensagem in report])
+        self.assertIn('Empresa salva', report[0][2])
+        self.assertIn('Empresa 1', report[1][2])
+
+    def test_imports_ndjson(self) -> None:
+        """
+        Ensure that a file with a JSON object per line is imported, and lines that are not objects are reported.
+
+        :rtype: None
+        """
+        path = os.path.join(self.directory.name, 'vagas.ndjson')
+
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(json.dumps(row(1, cargo_descricao='Descrição\ncom quebra de linha')) + '\n\n')
+            file.write('{"empresa_nome": \n')
+            file.write('[1, 2]\n')
+
+        self.import_vagas(path)
+        self.assertEqual('Descrição\ncom quebra de linha', Vaga.objects.get().cargo_descricao)
+        self.assertEqual([['3', '', 'A linha não contém um JSON válido.'], ['4', '', 'A linha deve conter um objeto JSON.']], self.read_report(path))
+
+    def test_resumes_interrupted_import(self) -> None:
+        """
+        Ensure that an interrupted import resumes after the last batch inserted, without duplicating rows or errors.
+
+        :rtype: None
+        """
+        path = self.write_csv([row(i, empresa_site='invalido' if i % 2 else f'https://empresa{i}.com.br') for i in range(10)])
+        importacao = start_import(path)
+
+        with open(path, 'rb') as file, open_report(f'{path}.erros.csv', importacao) as report:
+            batches = VagaImporter(file, 'csv', importacao, report, 4).run()
+            next(batches)
+            # Errors of a batch whose transaction was not committed when the import stopped.
+            report.write('9,empresa_site,Erro de um lote não gravado\r\n')
+
+        self.assertEqual(2, Vaga.objects.count())
+        output = self.import_vagas(path, '--batch-size', '4')
+        self.assertIn('Resuming after line 5.', output)
+        self.assertEqual([f'Empresa {i}' for i in range(0, 10, 2)], list(Vaga.objects.order_by('id').values_list('empresa_nome', flat=True)))
+        self.assertEqual([str(i + 2) for i in range(1, 10, 2)], [linha for linha, campo, mensagem in self.read_report(path)])
+
+        with self.assertRaisesMessage(CommandError, 'O arquivo já foi importado.'):
+            self.import_vagas(path)
+
+        self.import_vagas(path, '--restart')
+        self.assertEqual(10, Vaga.objects.count())
+
+    def test_requires_form_columns(self) -> None:
+        """
+        Ensure that a CSV file lacking a required column is not imported.
+
+        :rtype: None
+        """
+        path = os.path.join(self.directory.name, 'vagas.csv')
+
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write('empresa_nome,cargo_titulo\nEmpresa,Cargo\n')
+
+        with self.assertRaisesMessage(CommandError, 'Colunas obrigatórias ausentes: empresa_site, site_referencia, situacao.'):
+            self.import_vagas(path)
+
+        self.assertFalse(Vaga.objects.exists())
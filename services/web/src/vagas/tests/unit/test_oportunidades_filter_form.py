@@ -1,5 +1,5 @@
 from django.test import SimpleTestCase
-from django.forms import ChoiceField
+from django.forms import ChoiceField, MultipleChoiceField
 from vagas.forms import OportunidadesFilterForm
 
 class OportunidadesFilterFormTest(SimpleTestCase):
@@ -10,17 +10,16 @@ class OportunidadesFilterFormTest(SimpleTestCase):
     
     def test_has_choice_field_situacao(self) -> None:
         """
-        Ensure form has choice field for selecting the status of a job opportunity.
+        Ensure form has choice field for selecting the statuses of a job opportunity.
 
         :rtype: None
         """
         situacao = self.form.fields['situacao']
-        self.assertIsInstance(situacao, ChoiceField)
+        self.assertIsInstance(situacao, MultipleChoiceField)
         self.assertIn(('W', 'Aguardando retorno',), situacao.choices)
         self.assertIn(('S', 'Entrevista agendada',), situacao.choices)
         self.assertIn(('R', 'Rejeitado',), situacao.choices)
-        self.assertIn((None, 'Todas',), situacao.choices)
-        self.assertEqual((None, 'Todas',), situacao.initial)
+        self.assertEqual([], situacao.initial)
     
     def test_has_choice_field_data_hora_cadastro_order(self) -> None:
         """
@@ -0,0 +1,119 @@
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.test import TestCase
+from django.utils import timezone
+from io import StringIO
+from smtplib import SMTPException
+from unittest import mock
+from vagas.models import LembreteEntrevista, Vaga
+from vagas.reminders import ReminderScheduler
+from vagas.tests.helpers import create_vaga
+
+class ReminderSchedulerTest(TestCase):
+    """Tests for the scheduler of interview reminders."""
+
+    def setUp(self) -> None:
+        get_user_model().objects.create_user('usuario', 'usuario@email.com')
+        get_user_model().objects.create_user('inativo', 'inativo@email.com', is_active=False)
+        self.now = timezone.now()
+        self.amanha = create_vaga(empresa_nome='Empresa Amanhã', data_hora_entrevista=self.now + timedelta(hours=20), situacao=Vaga.Status.INTERVIEW_SCHEDULED)
+        self.semana = create_vaga(empresa_nome='Empresa Semana', data_hora_entrevista=self.now + timedelta(days=7), situacao=Vaga.Status.INTERVIEW_SCHEDULED)
+        self.scheduler = ReminderScheduler(timedelta(hours=24), timedelta(seconds=30))
+        self.scheduler.load(self.now)
+
+    def test_sends_due_reminders_once(self) -> None:
+        """
+        Ensure that the reminders due are sent once to the active users, and not again by a restarted scheduler.
+
+        :rtype: None
+        """
+        self.assertEqual([self.amanha], self.scheduler.run_due(self.now))
+        self.assertEqual([], self.scheduler.run_due(self.now))
+        self.assertEqual(1, len(mail.outbox))
+        self.assertEqual(['usuario@email.com'], mail.outbox[0].to)
+        self.assertIn('Empresa Amanhã', mail.outbox[0].subject)
+
+        restarted = ReminderScheduler(timedelta(hours=24), timedelta(seconds=30))
+        restarted.load(self.now)
+        self.assertEqual([], restarted.run_due(self.now))
+        self.assertEqual(1, LembreteEntrevista.objects.count())
+
+    def test_sends_reminders_when_due(self) -> None:
+        """
+        Ensure that a reminder is only sent once its time has come.
+
+        :rtype: None
+        """
+        self.scheduler.run_due(self.now)
+        self.assertEqual(self.semana.data_hora_entrevista - timedelta(hours=24), self.scheduler.next_due())
+        self.assertEqual([self.semana], self.scheduler.run_due(self.now + timedelta(days=6)))
+
+    def test_poll_follows_updates(self) -> None:
+        """
+        Ensure that polling schedules new interviews, reschedules moved ones and drops cancelled ones.
+
+        :rtype: None
+        """
+        nova = create_vaga(empresa_nome='Empresa Nova', data_hora_entrevista=self.now + timedelta(hours=2), situacao=Vaga.Status.INTERVIEW_SCHEDULED)
+        self.semana.data_hora_entrevista = self.now + timedelta(hours=3)
+        self.semana.save()
+        self.amanha.situacao = Vaga.Status.REJECTED
+        self.amanha.save()
+
+        with self.assertNumQueries(1):
+            self.scheduler.poll(self.now)
+
+        self.assertCountEqual([nova, self.semana], self.scheduler.run_due(self.now))
+        self.assertEqual([], self.scheduler.run_due(self.now + timedelta(days=7)))
+
+    def test_skips_deleted_vagas(self) -> None:
+        """
+        Ensure that the reminder of a deleted job opportunity is not sent.
+
+        :rtype: None
+        """
+        self.amanha.delete()
+        self.assertEqual([], self.scheduler.run_due(self.now))
+        self.assertEqual(0, len(mail.outbox))
+
+    def test_retries_failed_reminders_after_interval(self) -> None:
+        """
+        Ensure that a reminder that could not be sent is tried again one poll interval later.
+
+        :rtype: None
+        """
+        with mock.patch.object(ReminderScheduler, 'send', side_effect=SMTPException), self.assertLogs('vagas.reminders', 'ERROR'):
+            self.assertEqual([], self.scheduler.run_due(self.now))
+
+        self.assertEqual(self.now + timedelta(seconds=30), self.scheduler.next_due())
+        self.assertEqual([self.amanha], self.scheduler.run_due(self.now + timedelta(seconds=30)))
+
+    def test_command_sends_due_reminders(self) -> None:
+        """
+        Ensure that the command sends the reminders already due when run with --once.
+
+        :rtype: None
+        """
+        stdout = StringIO()
+        call_command('send_interview_reminders', '--once', stdout=stdout)
+        self.assertIn(f'job opportunity {self.amanha.pk}', stdout.getvalue())
+        self.assertEqual(1, len(mail.outbox))
+
+    def test_command_survives_database_errors(self) -> None:
+        """
+        Ensure that the command logs a database error and tries again after the poll interval instead of exiting.
+
+        :rtype: None
+        """
+        poll = mock.patch.object(ReminderScheduler, 'poll', autospec=True, side_effect=[DatabaseError, None])
+        sleep = mock.patch('time.sleep', side_effect=[None, None, KeyboardInterrupt])
+
+        with poll as poll_, sleep as sleep_, self.assertLogs('vagas.management.commands.send_interview_reminders', 'ERROR'):
+            call_command('send_interview_reminders', '--poll-interval', '5', stdout=StringIO())
+
+        self.assertEqual(2, poll_.call_count)
+        self.assertEqual(mock.call(5.0), sleep_.call_args_list[1])
+        self.assertEqual(1, len(mail.outbox))
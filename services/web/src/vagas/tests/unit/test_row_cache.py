@@ -0,0 +1,65 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from vagas.caching import render_rows, row_cache_key
+from vagas.models import Vaga
+
+class RowCacheTest(TestCase):
+    """Tests for the cache of rendered homepage rows."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.vaga = Vaga.objects.create(
+            empresa_nome='Minha empresa',
+            empresa_site='https://meusite.com.br',
+            cargo_titulo='Título do cargo',
+            site_referencia='https://sitereferencia.com.br',
+            situacao=Vaga.Status.WAITING,
+        )
+        self.url = reverse('homepage')
+
+    def test_rendered_row_is_cached(self) -> None:
+        """
+        Ensure that a rendered row is stored under the primary key and datetime of the last update.
+
+        :rtype: None
+        """
+        [row] = render_rows([self.vaga])
+        self.assertEqual(row, cache.get(row_cache_key(self.vaga.pk, self.vaga.data_hora_atualizacao)))
+        self.assertIn(self.vaga.empresa_nome, row)
+
+    def test_homepage_reuses_cached_rows(self) -> None:
+        """
+        Ensure that the homepage does not render the row template when the rows are cached.
+
+        :rtype: None
+        """
+        cold = self.client.get(self.url)
+        self.assertTemplateUsed(cold, 'homepage_row.html')
+        warm = self.client.get(self.url)
+        self.assertTemplateNotUsed(warm, 'homepage_row.html')
+        self.assertContains(warm, self.vaga.cargo_titulo)
+
+    def test_saving_invalidates_cached_row(self) -> None:
+        """
+        Ensure that updating a job opportunity removes its cached row and the homepage shows the new data.
+
+        :rtype: None
+        """
+        render_rows([self.vaga])
+        key = row_cache_key(self.vaga.pk, self.vaga.data_hora_atualizacao)
+        self.vaga.cargo_titulo = 'Novo título do cargo'
+        self.vaga.save()
+        self.assertIsNone(cache.get(key))
+        self.assertContains(self.client.get(self.url), 'Novo título do cargo')
+
+    def test_deleting_invalidates_cached_row(self) -> None:
+        """
+        Ensure that deleting a job opportunity removes its cached row.
+
+        :rtype: None
+        """
+        render_rows([self.vaga])
+        key = row_cache_key(self.vaga.pk, self.vaga.data_hora_atualizacao)
+        self.vaga.delete()
+        self.assertIsNone(cache.get(key))
@@ -0,0 +1,124 @@
+import importlib
+import re
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from vagas.models import Telefone, TelefoneField, Vaga
+
+def legacy_prep_value(value) -> str:
+    """Digits-only value as stored by the former, regex based, TelefoneField.get_prep_value."""
+    return re.compile(r'\D+').sub('', str(value))
+
+def legacy_from_db_value(value):
+    """Value as read by the former, regex based, TelefoneField.from_db_value."""
+    if value:
+        p1, p2, p3 = re.compile(r'^(\d{2})(\d{1,})(\d{4})$').search(value).groups()
+
+        return f'({p1}) {p2}-{p3}'
+
+    return value
+
+class TelefoneTest(SimpleTestCase):
+    """Tests for the Telefone value object and TelefoneField conversions."""
+
+    def setUp(self) -> None:
+        self.field = TelefoneField()
+
+    def test_formats_like_legacy_formatter(self) -> None:
+        """
+        Ensure that phones are formatted exactly as by the former regex based formatter, for every supported length.
+
+        :rtype: None
+        """
+        for digitos in ['1187653201', '11987653201', '1234567', '123456789012345']:
+            with self.subTest(digitos=digitos):
+                self.assertEqual(legacy_from_db_value(digitos), str(self.field.from_db_value(digitos, None, connection)))
+
+    def test_formats_landline_and_mobile(self) -> None:
+        """
+        Ensure that 8 digit landline and 9 digit mobile numbers are formatted as shown by the forms.
+
+        :rtype: None
+        """
+        self.assertEqual('(11) 8765-3201', str(Telefone('1187653201')))
+        self.assertEqual('(11) 98765-3201', str(Telefone('11987653201')))
+
+    def test_keeps_empty_values(self) -> None:
+        """
+        Ensure that empty values are read as they are stored, like the former formatter did.
+
+        :rtype: None
+        """
+        for value in ['', None]:
+            with self.subTest(value=value):
+                self.assertEqual(legacy_from_db_value(value), self.field.from_db_value(value, None, connection))
+
+    def test_shows_short_numbers_as_stored(self) -> None:
+        """
+        Ensure that numbers too short to be split into area code, prefix and suffix are shown as stored.
+
+        :rtype: None
+        """
+        self.assertEqual('123456', str(Telefone('123456')))
+
+    def test_stores_digits_like_legacy_field(self) -> None:
+        """
+        Ensure that values are stored with digits only, exactly as by the former regex based field.
+
+        :rtype: None
+        """
+        for value in ['(11) 98765-3201', '(11) 8765-3201', '11 98765 3201', '', None, Telefone('11987653201')]:
+            with self.subTest(value=value):
+                self.assertEqual(legacy_prep_value(value), self.field.get_prep_value(value))
+
+    def test_formats_lazily(self) -> None:
+        """
+        Ensure that a phone is formatted only when displayed, and only once.
+
+        :rtype: None
+        """
+        telefone = self.field.from_db_value('11987653201', None, connection)
+        self.assertIsNone(telefone._formatado)
+        self.assertTrue(telefone)
+        self.assertIsNone(telefone._formatado)
+        self.assertIs(str(telefone), str(telefone))
+
+    def test_compares_with_formatted_text(self) -> None:
+        """
+        Ensure that a phone equals its formatted text and any other phone with the same digits.
+
+        :rtype: None
+        """
+        self.assertEqual('(11) 98765-3201', Telefone('11987653201'))
+        self.assertEqual(Telefone('11987653201'), Telefone('11987653201'))
+        self.assertNotEqual('11987653201', Telefone('11987653201'))
+        self.assertEqual(hash('(11) 98765-3201'), hash(Telefone('11987653201')))
+
+class TelefoneMigrationTest(TestCase):
+    """Tests for the migration that strips the formatting of stored phones."""
+
+    def test_normalizes_formatted_phones(self) -> None:
+        """
+        Ensure that phones stored with formatting are left with digits only, and read back formatted.
+
+        :rtype: None
+        """
+        migration = importlib.import_module('vagas.migrations.0025_vaga_telefone_digits')
+        vaga = Vaga.objects.create(
+            empresa_nome='Minha empresa',
+            empresa_site='https://meusite.com.br',
+            cargo_titulo='Título do cargo',
+            site_referencia='https://sitereferencia.com.br',
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'UPDATE vagas_vaga SET empresa_telefone_celular = %s, empresa_telefone_comercial = %s WHERE id = %s',
+                ['(11) 98765-3201', '', vaga.pk],
+            )
+            cursor.execute(migration.NORMALIZE_TELEFONES)
+            cursor.execute('SELECT empresa_telefone_celular, empresa_telefone_comercial FROM vagas_vaga WHERE id = %s', [vaga.pk])
+            self.assertEqual(('11987653201', ''), cursor.fetchone())
+
+        vaga.refresh_from_db()
+        self.assertEqual('(11) 98765-3201', vaga.empresa_telefone_celular)
+        self.assertEqual('', vaga.empresa_telefone_comercial)
@@ -0,0 +1,127 @@
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from vagas.models import Vaga, VagaDescricao
+from vagas.tests.helpers import create_vaga
+
+class VagaDescricaoTest(TestCase):
+    """Tests for the description of the job, kept in model VagaDescricao."""
+
+    def test_description_is_stored_apart(self) -> None:
+        """
+        Ensure that the description is stored in its own table and read only when accessed.
+
+        :rtype: None
+        """
+        vaga = create_vaga(cargo_descricao='Descrição do cargo')
+        self.assertEqual('Descrição do cargo', VagaDescricao.objects.get(vaga=vaga).cargo_descricao)
+
+        with self.assertNumQueries(1):
+            vaga = Vaga.objects.get(pk=vaga.pk)
+
+        with self.assertNumQueries(1):
+            self.assertEqual('Descrição do cargo', vaga.cargo_descricao)
+
+        with self.assertNumQueries(1):
+            vaga = Vaga.objects.select_related('descricao').get(pk=vaga.pk)
+            self.assertEqual('Descrição do cargo', vaga.cargo_descricao)
+
+    def test_empty_description_has_no_row(self) -> None:
+        """
+        Ensure that a job opportunity without a description has no VagaDescricao, and reads an empty description.
+
+        :rtype: None
+        """
+        vaga = create_vaga(cargo_descricao='')
+        self.assertFalse(VagaDescricao.objects.exists())
+        self.assertEqual('', Vaga.objects.get(pk=vaga.pk).cargo_descricao)
+
+    def test_description_is_updated(self) -> None:
+        """
+        Ensure that changing the description of a saved job opportunity updates its row, even to an empty description.
+
+        :rtype: None
+        """
+        vaga = create_vaga()
+        vaga = Vaga.objects.get(pk=vaga.pk)
+        vaga.cargo_descricao = 'Nova descrição'
+        vaga.save()
+        self.assertEqual('Nova descrição', Vaga.objects.get(pk=vaga.pk).cargo_descricao)
+
+        vaga = Vaga.objects.get(pk=vaga.pk)
+        vaga.cargo_descricao = ''
+        vaga.save()
+        self.assertEqual([''], list(VagaDescricao.objects.values_list('cargo_descricao', flat=True)))
+
+    def test_unchanged_description_is_not_written(self) -> None:
+        """
+        Ensure that saving a job opportunity whose description was not assigned does not touch the description.
+
+        :rtype: None
+        """
+        vaga = Vaga.objects.get(pk=create_vaga(cargo_descricao='Descrição do cargo').pk)
+        vaga.cargo_titulo = 'Outro cargo'
+
+        with self.assertNumQueries(1):
+            vaga.save()
+
+    def test_search_vector_follows_description(self) -> None:
+        """
+        Ensure that the search vector is computed again when only the description changes.
+
+        :rtype: None
+        """
+        vaga = create_vaga(cargo_descricao='Experiência com Kotlin.')
+        self.assertTrue(Vaga.objects.filter(busca='kotlin').exists())
+
+        VagaDescricao.objects.filter(vaga=vaga).update(cargo_descricao='Experiência com Python.')
+        self.assertFalse(Vaga.objects.filter(busca='kotlin').exists())
+        self.assertTrue(Vaga.objects.filter(busca='python').exists())
+
+    def test_description_is_deleted_with_job_opportunity(self) -> None:
+        """
+        Ensure that the description is deleted along with its job opportunity.
+
+        :rtype: None
+        """
+        create_vaga(cargo_descricao='Descrição do cargo').delete()
+        self.assertFalse(VagaDescricao.objects.exists())
+
+class VagaDescricaoMigrationTest(TransactionTestCase):
+    """Tests for the migration that moves the descriptions out of the vagas_vaga table."""
+
+    def setUp(self) -> None:
+        self.executor = MigrationExecutor(connection)
+        self.executor.migrate([('vagas', '0025_vaga_telefone_digits')])
+
+    def tearDown(self) -> None:
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes('vagas'))
+
+    def test_moves_descriptions(self) -> None:
+        """
+        Ensure that descriptions end up in vagas_vagadescricao, that empty ones are dropped, and that the search vectors are kept.
+
+        :rtype: None
+        """
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO vagas_vaga (
+                    empresa_nome, empresa_endereco, empresa_email, empresa_site, empresa_telefone_celular,
+                    empresa_telefone_comercial, cargo_titulo, cargo_descricao, site_referencia, situacao,
+                    data_hora_cadastro, data_hora_atualizacao
+                ) VALUES
+                    ('Minha empresa', '', '', 'https://meusite.com.br', '', '', 'Título do cargo',
+                        'Experiência com Kotlin.', 'https://sitereferencia.com.br', 'C', now(), now()),
+                    ('Outra empresa', '', '', 'https://outrosite.com.br', '', '', 'Título do cargo', '',
+                        'https://sitereferencia.com.br', 'C', now(), now())
+                RETURNING id
+            """)
+            [pk], [outro_pk] = cursor.fetchall()
+
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes('vagas'))
+
+        self.assertEqual([(pk, 'Experiência com Kotlin.')], list(VagaDescricao.objects.values_list('vaga', 'cargo_descricao')))
+        self.assertEqual([pk], list(Vaga.objects.filter(busca='kotlin').values_list('pk', flat=True)))
+        self.assertEqual('', Vaga.objects.get(pk=outro_pk).cargo_descricao)
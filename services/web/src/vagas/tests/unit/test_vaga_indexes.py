@@ -0,0 +1,161 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from vagas.forms import OportunidadesFilterForm
+from vagas.models import Vaga
+
+class VagaIndexesTest(TestCase):
+    """Ensure that the queries issued by the homepage are served by indexes."""
+
+    def setUp(self) -> None:
+        for i in range(3):
+            Vaga.objects.create(
+                empresa_nome=f'Minha empresa {i}',
+                empresa_site=f'empresa{i}.com.br',
+                cargo_titulo=f'Cargo título {i}',
+                site_referencia='www.sitereferencia.com.br',
+                situacao=Vaga.Status.WAITING,
+            )
+
+    def explain_listing_query(self, querystring: str, disabled: tuple = ('seqscan', 'bitmapscan', 'sort'), url: str = '') -> str:
+        """
+        Return the query plan of the query that fetches the listed rows of a page, the homepage by default.
+
+        :param disabled: Plan types penalized while planning the query
+
+        :type disabled: tuple
+
+        :param url: URL of the page
+
+        :type url: str
+
+        :rtype: str
+        """
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(f"{url or reverse('homepage')}?{querystring}")
+
+        sql = next(q['sql'] for q in queries if 'ORDER BY' in q['sql'])
+
+        with connection.cursor() as cursor:
+            # The test table is tiny, so scans and sorts are penalized to make the planner pick an index
+            # whenever one can serve the query. A missing index still shows up as a Seq Scan followed by a Sort.
+            for plan_type in disabled:
+                cursor.execute(f'SET LOCAL enable_{plan_type} = off')
+
+            cursor.execute(f'EXPLAIN {sql}')
+            plan = '\n'.join(row[0] for row in cursor.fetchall())
+
+        return plan
+
+    def assertUsesIndex(self, plan: str) -> None:
+        self.assertNotIn('Seq Scan', plan, plan)
+        self.assertNotIn('Sort', plan, plan)
+
+    def test_newest_ordering_uses_index(self) -> None:
+        """
+        Ensure that listing all opportunities by newest is served by an index.
+
+        :rtype: None
+        """
+        self.assertUsesIndex(self.explain_listing_query(f'data_hora_cadastro_order={OportunidadesFilterForm.DataHoraCadastroOrder.NEWEST}'))
+
+    def test_oldest_ordering_uses_index(self) -> None:
+        """
+        Ensure that listing all opportunities by oldest is served by an index.
+
+        :rtype: None
+        """
+        self.assertUsesIndex(self.explain_listing_query(f'data_hora_cadastro_order={OportunidadesFilterForm.DataHoraCadastroOrder.OLDEST}'))
+
+    def test_filtered_newest_ordering_uses_index(self) -> None:
+        """
+        Ensure that filtering by status and ordering by newest is served by an index.
+
+        :rtype: None
+        """
+        self.assertUsesIndex(self.explain_listing_query(f'situacao={Vaga.Status.WAITING}&data_hora_cadastro_order={OportunidadesFilterForm.DataHoraCadastroOrder.NEWEST}'))
+
+    def test_filtered_oldest_ordering_uses_index(self) -> None:
+        """
+        Ensure that filtering by status and ordering by oldest is served by an index.
+
+        :rtype: None
+        """
+        self.assertUsesIndex(self.explain_listing_query(f'situacao={Vaga.Status.WAITING}&data_hora_cadastro_order={OportunidadesFilterForm.DataHoraCadastroOrder.OLDEST}'))
+
+    def test_several_statuses_use_index(self) -> None:
+        """
+        Ensure that filtering by several statuses and ordering by newest is served by an index.
+
+        :rtype: None
+        """
+        self.assertUsesIndex(self.explain_listing_query(f'situacao={Vaga.Status.APPLIED}&situacao={Vaga.Status.WAITING}'))
+
+    def test_listing_is_covered_by_index(self) -> None:
+        """
+        Ensure that listing all opportunities can be answered with an index-only scan.
+
+        :rtype: None
+        """
+        plan = self.explain_listing_query('')
+        self.assertIn('Index Only Scan', plan, plan)
+
+    def test_search_uses_index(self) -> None:
+        """
+        Ensure that the full-text search is served by the GIN index on the search vector.
+
+        :rtype: None
+        """
+        plan = self.explain_listing_query('busca=cargo', disabled=('seqscan',))
+        self.assertIn('vaga_busca_idx', plan, plan)
+
+    def test_empresa_filter_uses_index(self) -> None:
+        """
+        Ensure that filtering by a similar company name is served by the trigram index.
+
+        :rtype: None
+        """
+        Vaga.objects.bulk_create(
+            Vaga(
+                empresa_nome=f'Outra companhia {i}',
+                empresa_site='outra.com.br',
+                cargo_titulo='Cargo título',
+                site_referencia='www.sitereferencia.com.br',
+            )
+            for i in range(4000)
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE vagas_vaga')
+
+        plan = self.explain_listing_query('empresa=minha', disabled=())
+        self.assertIn('vaga_empresa_trgm_idx', plan, plan)
+
+    def test_agenda_uses_partial_index(self) -> None:
+        """
+        Ensure that the agenda only reads the scheduled interviews, through the partial index.
+
+        :rtype: None
+        """
+        plan = self.explain_listing_query('', url=reverse('oportunidades_agenda'), disabled=('seqscan', 'bitmapscan'))
+        self.assertIn('vaga_entrevista_agendada_idx', plan, plan)
+
+    def test_interview_conflict_uses_partial_index(self) -> None:
+        """
+        Ensure that looking up overlapping interviews is a range scan of the partial index.
+
+        :rtype: None
+        """
+        vaga = Vaga(situacao=Vaga.Status.INTERVIEW_SCHEDULED, data_hora_entrevista=timezone.localtime())
+
+        with CaptureQueriesContext(connection) as queries:
+            vaga.get_conflicting_interview()
+
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute(f"EXPLAIN {queries[0]['sql']}")
+            plan = '\n'.join(row[0] for row in cursor.fetchall())
+
+        self.assertIn('vaga_entrevista_agendada_idx', plan, plan)
@@ -0,0 +1,99 @@
+from django.core.cache import cache
+from django.http import QueryDict
+from django.template.loader import get_template
+from django.test import TestCase
+from vagas.caching import ROW_TEMPLATE
+from vagas.filters import filter_vagas, rank_vagas
+from vagas.models import Vaga
+from vagas.pagination import CursorPaginator
+from vagas.rows import VagaRow, listing_rows
+
+class VagaRowTest(TestCase):
+    """Tests for the read-only rows of the homepage listing."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.vaga = Vaga.objects.create(
+            empresa_nome='Minha empresa',
+            empresa_site='https://meusite.com.br',
+            empresa_telefone_celular='11987654321',
+            cargo_titulo='Desenvolvedor Python',
+            cargo_descricao='Desenvolvimento de APIs em Django.',
+            site_referencia='https://sitereferencia.com.br',
+            situacao=Vaga.Status.WAITING,
+        )
+
+    def test_reads_only_listing_columns(self) -> None:
+        """
+        Ensure that the rows hold the listing columns and that the other columns are not read.
+
+        :rtype: None
+        """
+        [row] = listing_rows(Vaga.objects.all())
+        self.assertIsInstance(row, VagaRow)
+        self.assertEqual(self.vaga.pk, row.pk)
+        self.assertEqual('Minha empresa', row.empresa_nome)
+        self.assertEqual(Vaga.Status.WAITING, row.situacao)
+        self.assertEqual('Aguardando retorno', row.get_situacao_display())
+        self.assertEqual(self.vaga.data_hora_atualizacao, row.data_hora_atualizacao)
+        self.assertNotIn('empresa_telefone_celular', str(listing_rows(Vaga.objects.all()).query))
+
+        with self.assertRaises(AttributeError):
+            row.cargo_descricao = 'Outra descrição'
+
+    def test_keeps_rows_when_chained(self) -> None:
+        """
+        Ensure that ordering, filtering and slicing still yield rows, and that values() and values_list() cannot be chained.
+
+        :rtype: None
+        """
+        rows = listing_rows(Vaga.objects.all())
+        [row] = rows.filter(situacao=Vaga.Status.WAITING).order_by('-id')[:1]
+        self.assertIsInstance(row, VagaRow)
+
+        with self.assertRaises(TypeError):
+            rows.values_list('id')
+
+        with self.assertRaises(TypeError):
+            rows.values('id')
+
+    def test_renders_like_model_instance(self) -> None:
+        """
+        Ensure that the row template renders a row exactly like the job opportunity it was read from.
+
+        :rtype: None
+        """
+        template = get_template(ROW_TEMPLATE)
+        [row] = listing_rows(Vaga.objects.all())
+        self.assertEqual(template.render({'vaga': self.vaga}), template.render({'vaga': row}))
+
+    def test_compares_with_model_instance(self) -> None:
+        """
+        Ensure that a row equals the job opportunity with the same primary key.
+
+        :rtype: None
+        """
+        [row] = listing_rows(Vaga.objects.all())
+        self.assertEqual(self.vaga, row)
+        self.assertEqual(row, self.vaga)
+        self.assertEqual({self.vaga}, {row})
+
+    def test_paginates_search_results(self) -> None:
+        """
+        Ensure that rows carry the search rank, so that search results can be paginated by cursor.
+
+        :rtype: None
+        """
+        outra = Vaga.objects.create(
+            empresa_nome='Outra empresa',
+            empresa_site='https://outrosite.com.br',
+            cargo_titulo='Analista Python',
+            site_referencia='https://sitereferencia.com.br',
+            situacao=Vaga.Status.APPLIED,
+        )
+        params = QueryDict('busca=python')
+        paginator = CursorPaginator(listing_rows(rank_vagas(filter_vagas(params), params)), ('-rank', '-id'), 1)
+        first = paginator.page()
+        second = paginator.page(after=first.next_cursor)
+        self.assertIsInstance(first.object_list[0].rank, float)
+        self.assertEqual({self.vaga, outra}, set(first.object_list + second.object_list))
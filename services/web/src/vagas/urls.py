@@ -1,9 +1,17 @@
 from django.urls import path
-from .views import create_view, detail_view, edit_view, delete_view
+from . import api, exporting, ical
+from .views import agenda_view, create_view, detail_view, edit_view, delete_view
 
 urlpatterns = [
     path('new', create_view, name='oportunidades_new'),
+    path('agenda', agenda_view, name='oportunidades_agenda'),
+    path('agenda.ics', ical.feed_view, name='oportunidades_agenda_ics'),
+    path('export', exporting.export_view, name='oportunidades_export'),
     path('<int:pk>', detail_view, name='oportunidades_detail'),
     path('<int:pk>/edit', edit_view, name='oportunidades_edit'),
     path('<int:pk>/delete', delete_view, name='oportunidades_delete'),
-]
\ No newline at end of file
+    path('api/', api.list_view, name='oportunidades_api_list'),
+    path('api/<int:pk>', api.detail_view, name='oportunidades_api_detail'),
+    path('api/empresas', api.empresas_view, name='oportunidades_api_empresas'),
+    path('api/autocomplete/<str:field_name>', api.autocomplete_view, name='oportunidades_api_autocomplete'),
+]
@@ -1,41 +1,287 @@
+import hashlib
+from datetime import datetime
+from itertools import groupby, islice
+from typing import Optional
+from django.conf import settings
+from django.contrib.postgres.search import SearchHeadline, SearchQuery
+from django.db import transaction
+from django.db.models import Max, QuerySet
+from django.http import StreamingHttpResponse
 from django.shortcuts import render, get_object_or_404, redirect
+from django.template.loader import get_template, render_to_string
+from django.utils.html import escape
+from django.utils.safestring import SafeString, mark_safe
 from django.contrib import messages
 from django.urls import reverse
 from django.utils import timezone
+from django.views.decorators.http import condition
 from vagas.forms import CadastroVagasForm, OportunidadesFilterForm
-from vagas.models import Vaga
+from vagas.models import Vaga, VagaDescricao, ContagemSituacao
+from vagas.caching import render_detail, render_rows
+from vagas.filters import (
+    canonical_params, filter_vagas, get_busca, get_data_hora_cadastro_order, get_date, get_empresa,
+    get_ordering, get_periodo_cadastro, get_situacoes, has_row_filter, rank_vagas, start_of_day,
+)
+from vagas.pagination import CursorPaginator
+from vagas.rows import listing_rows
 
+def get_page_size(request) -> int:
+    """
+    Return the number of job opportunities to be shown per page.
+
+    The page size may be chosen through the page_size query parameter, bounded by settings.VAGAS_MAX_PAGE_SIZE.
+
+    :return: int
+    """
+    try:
+        page_size = int(request.GET.get('page_size', settings.VAGAS_PAGE_SIZE))
+    except ValueError:
+        page_size = settings.VAGAS_PAGE_SIZE
+
+    return max(1, min(page_size, settings.VAGAS_MAX_PAGE_SIZE))
+
+def has_pending_messages(request) -> bool:
+    """
+    Check whether there are messages waiting to be displayed to the user.
+
+    Pages showing messages must not be answered with 304 Not Modified, otherwise the messages would not be seen.
+
+    :rtype: bool
+    """
+    return len(messages.get_messages(request)) > 0
+
+def index_etag(request) -> Optional[str]:
+    """
+    Return the ETag of the homepage.
+
+    It changes whenever a row matching the filter is created or updated, which moves the latest
+    data_hora_atualizacao of the filtered rows, and whenever a total or generation of the status
+    counters changes, which covers deletions and rows leaving the filtered status. No Last-Modified
+    is provided for the homepage, since a datetime alone cannot tell that a row was removed.
+
+    :rtype: str or None
+    """
+    if has_pending_messages(request):
+        return None
+
+    # The planner cannot tell how many rows match a text or date filter and may walk the whole data_hora_atualizacao
+    # index looking for the latest one, so these filters rely on the latest update of any row instead.
+    vagas = Vaga.objects.all() if has_row_filter(request.GET) else filter_vagas(request.GET)
+    ultima_atualizacao = vagas.aggregate(ultima=Max('data_hora_atualizacao'))['ultima']
+    contagens = sorted(ContagemSituacao.objects.values_list('situacao', 'total', 'geracao'))
+    querystring = canonical_params(request.GET).urlencode()
+    # Preset periods are relative to the current date.
+    periodo_cadastro = get_periodo_cadastro(request.GET)
+    validator = repr((querystring, ultima_atualizacao, contagens, periodo_cadastro))
+
+    return hashlib.md5(validator.encode()).hexdigest()
+
+def vaga_last_modified(request, pk: int) -> Optional[datetime]:
+    """
+    Return the datetime of the last update of a job opportunity, if it exists.
+
+    :rtype: datetime or None
+    """
+    if has_pending_messages(request):
+        return None
+
+    return Vaga.objects.filter(pk=pk).values_list('data_hora_atualizacao', flat=True).first()
+
+def vaga_etag(request, pk: int) -> Optional[str]:
+    """
+    Return the ETag of the pages of a job opportunity, if it exists.
+
+    :rtype: str or None
+    """
+    data_hora_atualizacao = vaga_last_modified(request, pk)
+
+    if data_hora_atualizacao is None:
+        return None
+
+    return f'{pk}-{data_hora_atualizacao.timestamp()}'
+
+@condition(etag_func=index_etag)
 def index(request):
-    form = OportunidadesFilterForm()
-    situacoes = {
-        Vaga.Status.APPLIED.value: Vaga.Status.APPLIED,
-        Vaga.Status.WAITING.value: Vaga.Status.WAITING,
-        Vaga.Status.INTERVIEW_SCHEDULED.value: Vaga.Status.INTERVIEW_SCHEDULED,
-        Vaga.Status.REJECTED.value: Vaga.Status.REJECTED,
-        Vaga.Status.APPROVED.value: Vaga.Status.APPROVED,
-    }
-    situacao_query = request.GET.get('situacao')
-    situacao = situacoes.get(situacao_query)
-    data_hora_cadastro_order = request.GET.get('data_hora_cadastro_order')
+    totais = ContagemSituacao.totais()
+    form = OportunidadesFilterForm(totais=totais)
+    situacoes = get_situacoes(request.GET)
+    busca = get_busca(request.GET)
+    vagas = filter_vagas(request.GET)
+    ordering = get_ordering(request.GET)
+    form.fields['busca'].initial = request.GET.get('busca', '')
+    form.fields['empresa'].initial = get_empresa(request.GET)
+    form.fields['situacao'].initial = situacoes
+    form.fields['data_hora_cadastro_order'].initial = get_data_hora_cadastro_order(request.GET)
+    form.fields['periodo_cadastro'].initial = request.GET.get('periodo_cadastro') or (None, 'Qualquer data',)
+    form.fields['data_cadastro_inicio'].initial = get_date(request.GET, 'data_cadastro_inicio')
+    form.fields['data_cadastro_fim'].initial = get_date(request.GET, 'data_cadastro_fim')
 
-    if situacao:
-        form.fields['situacao'].initial = situacao
-        vagas = Vaga.objects.filter(situacao=situacao)
-    else:
-        form.fields['situacao'].initial = (None, 'Todas',)
-        vagas = Vaga.objects
-    
-    if data_hora_cadastro_order == OportunidadesFilterForm.DataHoraCadastroOrder.OLDEST.value:
-        form.fields['data_hora_cadastro_order'].initial = OportunidadesFilterForm.DataHoraCadastroOrder.OLDEST
-        vagas = vagas.order_by('data_hora_cadastro')
+    total_excedido = False
+
+    if has_row_filter(request.GET):
+        # Matches of these filters are counted by reading them, so the count stops at a limit.
+        total = vagas[:settings.VAGAS_MAX_FILTERED_TOTAL + 1].count()
+        total_excedido = total > settings.VAGAS_MAX_FILTERED_TOTAL
+        total = min(total, settings.VAGAS_MAX_FILTERED_TOTAL)
     else:
-        form.fields['data_hora_cadastro_order'].initial = OportunidadesFilterForm.DataHoraCadastroOrder.NEWEST
-        vagas = vagas.order_by('-data_hora_cadastro')
+        total = sum(totais[situacao] for situacao in situacoes) if situacoes else sum(totais.values())
+
+    querystring = canonical_params(request.GET)
+    querystring.pop('after', None)
+    querystring.pop('before', None)
+    # The export links keep the filter and ordering, whichever the page.
+    exportar_querystring = querystring.copy()
+    exportar_querystring.pop('exibir', None)
+    exportar_querystring.pop('page_size', None)
+    context = {
+        'total': total,
+        'total_excedido': total_excedido,
+        'form': form,
+        'exportar_querystring': exportar_querystring.urlencode(),
+    }
+    vagas = listing_rows(rank_vagas(vagas, request.GET))
+
+    if 'todas' == request.GET.get('exibir'):
+        return stream_index(request, vagas.order_by(*ordering), context, busca)
+
+    querystring.pop('exibir', None)
+    paginator = CursorPaginator(vagas, ordering, get_page_size(request))
+    page = paginator.get_page(after=request.GET.get('after'), before=request.GET.get('before'))
+    linhas = render_rows(page.object_list)
+
+    if busca is not None:
+        linhas = [linha + trecho for linha, trecho in zip(linhas, render_trechos(page.object_list, busca))]
+
+    return render(request, 'homepage.html', {
+        **context,
+        'vagas': page.object_list,
+        'linhas': linhas,
+        'page': page,
+        'querystring': querystring.urlencode(),
+    })
+
+def render_trechos(vagas: list, busca: SearchQuery) -> list[SafeString]:
+    """
+    Return, for each given job opportunity, a table row with the excerpts of its description that match the search.
+
+    The excerpts are computed by the database for the given rows only. They are marked with control
+    characters, which are replaced by mark tags once the text has been escaped.
+
+    :param vagas: Job opportunities shown on the page
 
-    return render(request, 'homepage.html', {'vagas': vagas, 'form': form})
+    :type vagas: list
+
+    :param busca: The full-text search query
+
+    :type busca: SearchQuery
+
+    :rtype: list[SafeString]
+    """
+    trechos = dict(
+        VagaDescricao.objects.filter(pk__in=[vaga.pk for vaga in vagas])
+        .exclude(cargo_descricao='')
+        .annotate(trecho=SearchHeadline(
+            'cargo_descricao',
+            busca,
+            config='portuguese',
+            start_sel='\x01',
+            stop_sel='\x02',
+            max_fragments=2,
+            fragment_delimiter=' ... ',
+        ))
+        .values_list('pk', 'trecho')
+    )
+    template = get_template('homepage_trecho.html')
+    rows = []
+
+    for vaga in vagas:
+        trecho = trechos.get(vaga.pk)
+
+        if trecho:
+            trecho = mark_safe(escape(trecho).replace('\x01', '<mark>').replace('\x02', '</mark>'))
+            rows.append(mark_safe(template.render({'trecho': trecho})))
+        else:
+            rows.append(mark_safe(''))
+
+    return rows
+
+def stream_index(request, vagas: QuerySet, context: dict, busca: Optional[SearchQuery] = None) -> StreamingHttpResponse:
+    """
+    Return the homepage listing every given job opportunity as a streaming response.
+
+    The page around the table rows is rendered once and split in two; the rows are then read
+    through a server-side cursor and sent in chunks, so neither the time to first byte nor the
+    memory used depend on the number of rows.
+
+    :param vagas: The ordered job opportunities to be listed
+
+    :type vagas: QuerySet
+
+    :param context: Template context of the homepage
+
+    :type context: dict
+
+    :param busca: The full-text search query, whose matching excerpts are shown below each row
+
+    :type busca: SearchQuery
+
+    :rtype: StreamingHttpResponse
+    """
+    marker = '<!-- linhas -->'
+    html = render_to_string('homepage.html', {**context, 'linhas': [mark_safe(marker)]}, request=request)
+    head, tail = html.split(marker)
+    chunk_size = settings.VAGAS_STREAM_CHUNK_SIZE
+
+    def content():
+        yield head
+
+        # Without a transaction, PostgreSQL would materialize the whole result of a WITH HOLD cursor before the first fetch.
+        with transaction.atomic():
+            rows = vagas.iterator(chunk_size=chunk_size)
+
+            for chunk in iter(lambda: list(islice(rows, chunk_size)), []):
+                linhas = render_rows(chunk, store=False)
+
+                if busca is not None:
+                    linhas = [linha + trecho for linha, trecho in zip(linhas, render_trechos(chunk, busca))]
+
+                yield ''.join(linhas)
+
+        yield tail
+
+    return StreamingHttpResponse(content())
+
+def get_agenda() -> list:
+    """
+    Return the upcoming interviews grouped by day, as a list of (day, job opportunities) pairs in chronological order.
+
+    Interviews from the start of the current day onwards are included. Only the job opportunities
+    with Status.INTERVIEW_SCHEDULED are read, through the partial vaga_entrevista_agendada_idx index.
+
+    :rtype: list
+    """
+    vagas = (
+        Vaga.objects.filter(
+            situacao=Vaga.Status.INTERVIEW_SCHEDULED,
+            data_hora_entrevista__gte=start_of_day(timezone.localdate()),
+        )
+        .only('empresa_nome', 'cargo_titulo', 'data_hora_entrevista')
+        .order_by('data_hora_entrevista', 'id')
+    )
+
+    return [
+        (dia, list(entrevistas))
+        for dia, entrevistas in groupby(vagas, key=lambda vaga: timezone.localtime(vaga.data_hora_entrevista).date())
+    ]
+
+def agenda_view(request):
+    return render(request, 'oportunidades_agenda.html', {
+        'agenda': get_agenda(),
+        'hoje': timezone.localdate(),
+    })
 
 def delete_view(request, pk: int):
-    vaga = get_object_or_404(Vaga, pk=pk)
+    vaga = get_object_or_404(Vaga.objects.select_related('descricao'), pk=pk)
 
     if request.method == 'POST':
         vaga.delete()
@@ -45,8 +291,9 @@ def delete_view(request, pk: int):
 
     return render(request, 'oportunidades_delete.html', {'vaga': vaga})
 
+@condition(etag_func=vaga_etag, last_modified_func=vaga_last_modified)
 def edit_view(request, pk: int):
-    vaga = get_object_or_404(Vaga, pk=pk)
+    vaga = get_object_or_404(Vaga.objects.select_related('descricao'), pk=pk)
     form = CadastroVagasForm(initial={
         'empresa_nome': vaga.empresa_nome,
         'empresa_endereco': vaga.empresa_endereco,
@@ -62,7 +309,7 @@ def edit_view(request, pk: int):
     })
 
     if request.method == 'POST':
-        form = CadastroVagasForm(request.POST)
+        form = CadastroVagasForm(request.POST, pk=vaga.pk)
 
         if form.is_valid():
             vaga.empresa_nome = form.cleaned_data['empresa_nome']
@@ -85,10 +332,11 @@ def edit_view(request, pk: int):
 
     return render(request, 'oportunidades_edit.html', {'form': form})
 
+@condition(etag_func=vaga_etag, last_modified_func=vaga_last_modified)
 def detail_view(request, pk: int):
     vaga = get_object_or_404(Vaga, pk=pk)
     
-    return render(request, 'oportunidades_detail.html', {'vaga': vaga})
+    return render(request, 'oportunidades_detail.html', {'vaga': vaga, 'detalhe': render_detail(vaga)})
 
 def create_view(request):
     form = CadastroVagasForm()